@@ -15,7 +15,9 @@ identifier_xmltag = [
     "Info",
 ]  # type: List[str]
 
-#: The XML tag, which will be represented by one row in the table.
+#: The XML tag, which will be used to sort the rows. It should contain a date either
+#: in ISO 8601 format or like '31.12.2021 12:00'. If a list of tags is given, the first
+#: one is used for sorting and all others in the given order to break ties.
 sort_xmltag = "name_tag"
 
 # The table title is displayed as the content of the very first cell in full table
@@ -0,0 +1,178 @@
+"""This module contains the interchangeable backends to parse the XML input
+
+By default the XML input is parsed with :py:mod:`defusedxml`. If :py:mod:`lxml` is
+installed, it is used instead, since it is considerably faster on large inputs. Both
+backends provide the same security guarantees and accept the same documents:
+documents declaring entities are rejected with
+:py:class:`defusedxml.EntitiesForbidden`, documents referring to an external DTD are
+rejected with :py:class:`defusedxml.DTDForbidden` and neither external resources nor
+the network are accessed.
+"""
+
+from typing import Iterator, Tuple
+from xml.etree.ElementTree import TreeBuilder
+
+import defusedxml.ElementTree  # type: ignore
+from defusedxml import DTDForbidden, EntitiesForbidden  # type: ignore
+
+__all__ = [
+    "BACKEND_NAMES",
+    "DefusedXMLBackend",
+    "get_backend",
+    "LXMLBackend",
+    "ParserBackend",
+]
+
+#: The names of all selectable backends. 'auto' prefers lxml if it is installed.
+BACKEND_NAMES = ("auto", "lxml", "defusedxml")
+
+
+def _import_lxml():
+    """Import :py:mod:`lxml` only when it is actually needed
+
+    :returns: the module :py:mod:`lxml.etree` or None, if lxml is not installed
+    """
+    try:
+        from lxml import etree  # type: ignore
+    except ImportError:  # pragma: no cover
+        return None
+    return etree
+
+
+class ParserBackend:
+    """The interface all backends to parse the XML input provide"""
+
+    #: The name under which the backend can be selected.
+    name = ""
+
+    def parse(self, input_path: str):
+        """Parse a whole XML file at once
+
+        :param str input_path: path to the XML file
+        :returns: the parsed document
+        :rtype: xml.etree.ElementTree.ElementTree
+        """
+        raise NotImplementedError
+
+    def iterparse(self, input_path: str, events: Tuple[str, ...]) -> Iterator:
+        """Parse an XML file incrementally
+
+        :param str input_path: path to the XML file
+        :param Tuple[str, ...] events: the events to report, i.e. 'start' and 'end'
+        :returns: an iterator over pairs of event and element
+        :rtype: Iterator[Tuple[str, xml.etree.ElementTree.Element]]
+        """
+        raise NotImplementedError
+
+
+class _DefusedXMLParser(defusedxml.ElementTree.DefusedXMLParser):
+    """The parser of :py:mod:`defusedxml`, which additionally forbids external DTDs
+
+    Documents with a document type declaration are still accepted, as long as it
+    does not refer to an external DTD.
+    """
+
+    def __init__(self):
+        super().__init__(target=TreeBuilder(), forbid_dtd=True)
+
+    def defused_start_doctype_decl(self, name, sysid, pubid, has_internal_subset):
+        if sysid is not None:
+            raise DTDForbidden(name, sysid, pubid)
+
+
+class DefusedXMLBackend(ParserBackend):
+    """Parse the XML input with the standard library secured by :py:mod:`defusedxml`
+
+    Additionally documents referring to an external DTD are rejected just like with
+    :class:`LXMLBackend`.
+    """
+
+    name = "defusedxml"
+
+    def parse(self, input_path: str):
+        return defusedxml.ElementTree.parse(input_path, parser=_DefusedXMLParser())
+
+    def iterparse(self, input_path: str, events: Tuple[str, ...]) -> Iterator:
+        return defusedxml.ElementTree.iterparse(
+            input_path, events=events, parser=_DefusedXMLParser()
+        )
+
+
+class LXMLBackend(ParserBackend):
+    """Parse the XML input with :py:mod:`lxml` with the same restrictions
+
+    Entities are never resolved, no DTD is loaded and the network is not accessed.
+    Additionally documents declaring entities or referring to an external DTD are
+    rejected just like with :class:`DefusedXMLBackend`.
+    """
+
+    name = "lxml"
+
+    _parser_options = dict(
+        resolve_entities=False, no_network=True, load_dtd=False, huge_tree=False
+    )
+
+    def __init__(self):
+        self._etree = _import_lxml()
+        if self._etree is None:
+            raise ImportError(
+                "The XML parser backend 'lxml' was requested, but lxml is not "
+                "installed. Please install it via 'pip install lxml'."
+            )
+
+    def parse(self, input_path: str):
+        tree = self._etree.parse(
+            input_path, self._etree.XMLParser(**self._parser_options)
+        )
+        self._check_doctype(tree)
+        return tree
+
+    def iterparse(self, input_path: str, events: Tuple[str, ...]) -> Iterator:
+        context = self._etree.iterparse(
+            input_path, events=events, **self._parser_options
+        )
+        checked = False
+        for event, element in context:
+            if not checked:
+                # The internal DTD is completely known as soon as the root starts.
+                self._check_doctype(element.getroottree())
+                checked = True
+            yield event, element
+
+    @staticmethod
+    def _check_doctype(tree):
+        """Raise an exception if the document refers to a DTD or declares entities
+
+        :param lxml.etree._ElementTree tree: the (partially) parsed document
+        :raises DTDForbidden: if the document type declaration refers to an external
+            DTD
+        :raises EntitiesForbidden: if the internal DTD declares an entity
+        """
+        docinfo = tree.docinfo
+        if docinfo.system_url is not None:
+            raise DTDForbidden(docinfo.root_name, docinfo.system_url, docinfo.public_id)
+        dtd = docinfo.internalDTD
+        if dtd is not None:
+            for entity in dtd.iterentities():
+                raise EntitiesForbidden(
+                    entity.name, entity.content, None, entity.system_url, None, None
+                )
+
+
+def get_backend(name: str = "auto") -> ParserBackend:
+    """Create the backend to parse the XML input
+
+    :param str name: one of :data:`BACKEND_NAMES`. 'auto' selects lxml if it is
+        installed and defusedxml otherwise.
+    :returns: the backend
+    :rtype: ParserBackend
+    """
+    if name == "auto":
+        name = "defusedxml" if _import_lxml() is None else "lxml"
+    if name == "lxml":
+        return LXMLBackend()
+    if name == "defusedxml":
+        return DefusedXMLBackend()
+    raise ValueError(
+        f"Unknown XML parser backend '{name}'. Please choose one of {BACKEND_NAMES}."
+    )
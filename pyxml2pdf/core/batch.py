@@ -0,0 +1,253 @@
+"""This module contains the class :class:`BatchConverter` to convert many XML files"""
+
+import glob
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+__all__ = ["BatchConverter", "ConversionResult"]
+
+ConversionResult = NamedTuple(
+    "ConversionResult",
+    [("input_path", str), ("output_path", str), ("error", Optional[str])],
+)
+ConversionResult.__doc__ = """The outcome of converting one XML file
+
+:param str input_path: the path to the XML file
+:param str output_path: the path to the resulting PDF file
+:param Optional[str] error: the description of what went wrong or None on success
+"""
+
+
+def _init_worker():
+    """Prepare a worker process once for all its conversions
+
+    Building the shared table styles registers the fonts with :py:mod:`reportlab`,
+    which then is shared by all conversions in this process.
+    """
+    from pyxml2pdf.styles.table_styles import XMLTableStyle
+
+    XMLTableStyle.shared()
+
+
+def _convert(
+    input_path: str,
+    output_path: str,
+    streaming: bool,
+    backend: str,
+    incremental: bool,
+    cache_data: bool,
+    memory_budget: Optional[int],
+    merge_rows: bool,
+    direct_pages: bool,
+    combined: bool,
+    repeat_headers: bool,
+) -> ConversionResult:
+    """Convert one XML file into a PDF and report the outcome instead of raising
+
+    :param str input_path: the path to the XML file
+    :param str output_path: the path to the resulting PDF file
+    :param bool streaming: if True, the XML file is read incrementally
+    :param str backend: the name of the backend to parse the XML file with
+    :param bool incremental: if True, the results of the previous run are reused
+    :param bool cache_data: if True, the data extracted from the XML file is cached
+    :param Optional[int] memory_budget: if given, the rows are sorted out of core
+        with about this many bytes of sort keys in memory
+    :param bool merge_rows: if True, the rows of each subtable are merged into one
+        table
+    :param bool direct_pages: if True, the single pages are written while building
+    :param bool combined: if False, the combined PDF file is not written
+    :param bool repeat_headers: if True, the headers of each subtable are repeated
+        on every page it continues on
+    :returns: the outcome of the conversion
+    :rtype: ConversionResult
+    """
+    from pyxml2pdf.core.initializer import Initializer
+
+    try:
+        Initializer(
+            input_path,
+            output_path,
+            streaming=streaming,
+            backend=backend,
+            incremental=incremental,
+            cache_data=cache_data,
+            memory_budget=memory_budget,
+            merge_rows=merge_rows,
+            direct_pages=direct_pages,
+            combined=combined,
+            repeat_headers=repeat_headers,
+        )
+    except Exception as error:  # pylint: disable=broad-except
+        return ConversionResult(
+            input_path,
+            output_path,
+            "".join(traceback.format_exception_only(type(error), error)).strip(),
+        )
+    return ConversionResult(input_path, output_path, None)
+
+
+class BatchConverter:
+    """Convert several XML files into PDFs in parallel
+
+    Each pair of input and output path is converted in a pool of worker processes,
+    which are prepared once with the fonts and styles. A failing conversion does not
+    abort the others, but is reported in its :class:`ConversionResult`.
+
+    :param List[Tuple[str, str]] jobs: pairs of paths to XML input and PDF output
+    :param Optional[int] max_workers: the number of worker processes, which defaults
+        to the number of processors of the machine
+    :param bool streaming: if True, the XML files are read incrementally
+    :param str backend: the name of the backend to parse the XML files with
+    :param bool incremental: if True, the results of each file's previous run are
+        reused for all its unchanged rows
+    :param bool cache_data: if True, the data extracted from each XML file is stored
+        next to it to skip parsing unchanged files in the following runs
+    :param Optional[int] memory_budget: if given, the rows of each file are sorted
+        out of core with about this many bytes of sort keys in memory
+    :param bool merge_rows: if True, the rows of each subtable are merged into one
+        table with repeated headings
+    :param bool direct_pages: if True, the rotated single pages of each file are
+        written directly while building
+    :param bool combined: if False, the combined PDF files are not written, which
+        requires `direct_pages`
+    :param bool repeat_headers: if True, the headers of each subtable are repeated
+        on every page it continues on
+    """
+
+    _jobs: List[Tuple[str, str]]
+    _max_workers: Optional[int]
+    _streaming: bool
+    _backend: str
+    _incremental: bool
+    _cache_data: bool
+    _memory_budget: Optional[int]
+    _merge_rows: bool
+    _direct_pages: bool
+    _combined: bool
+    _repeat_headers: bool
+
+    def __init__(
+        self,
+        jobs: List[Tuple[str, str]],
+        max_workers: Optional[int] = None,
+        streaming: bool = False,
+        backend: str = "auto",
+        incremental: bool = False,
+        cache_data: bool = False,
+        memory_budget: Optional[int] = None,
+        merge_rows: bool = False,
+        direct_pages: bool = False,
+        combined: bool = True,
+        repeat_headers: bool = False,
+    ):
+        self._jobs = jobs
+        self._max_workers = max_workers
+        self._streaming = streaming
+        self._backend = backend
+        self._incremental = incremental
+        self._cache_data = cache_data
+        self._memory_budget = memory_budget
+        self._merge_rows = merge_rows
+        self._direct_pages = direct_pages
+        self._combined = combined
+        self._repeat_headers = repeat_headers
+
+    @staticmethod
+    def collect_inputs(paths: Iterable[str]) -> List[str]:
+        """Expand directories and glob patterns into a list of XML files
+
+        Directories are replaced by all XML files directly inside them and patterns
+        like `input/*.xml` by all matching files, each in alphabetical order. All
+        other paths are kept as they are.
+
+        :param Iterable[str] paths: paths to files or directories or glob patterns
+        :returns: the paths of all XML files
+        :rtype: List[str]
+        """
+        inputs = []
+        for path in paths:
+            if os.path.isdir(path):
+                inputs.extend(sorted(glob.glob(os.path.join(path, "*.xml"))))
+            elif glob.has_magic(path):
+                inputs.extend(sorted(glob.glob(path)))
+            else:
+                inputs.append(path)
+        return inputs
+
+    @staticmethod
+    def pair_outputs(
+        inputs: Iterable[str], output_directory: str
+    ) -> List[Tuple[str, str]]:
+        """Assign a PDF file in the output directory to each of the XML files
+
+        The PDF files are named after the XML files. Files given several times are
+        converted only once.
+
+        :param Iterable[str] inputs: paths to XML files
+        :param str output_directory: the directory to store the PDF files to
+        :returns: pairs of paths to XML input and PDF output
+        :rtype: List[Tuple[str, str]]
+        :raises ValueError: if different XML files of the same name would overwrite
+            each other's PDF files
+        """
+        jobs = []  # type: List[Tuple[str, str]]
+        inputs_by_output = {}  # type: Dict[str, str]
+        for input_path in inputs:
+            output_path = os.path.join(
+                output_directory,
+                os.path.splitext(os.path.basename(input_path))[0] + ".pdf",
+            )
+            output_key = os.path.normcase(os.path.abspath(output_path))
+            if output_key in inputs_by_output:
+                if os.path.realpath(inputs_by_output[output_key]) == os.path.realpath(
+                    input_path
+                ):
+                    continue
+                raise ValueError(
+                    f"The XML files {inputs_by_output[output_key]} and {input_path} "
+                    f"would both be converted to {output_path}. Please rename one of "
+                    f"them."
+                )
+            inputs_by_output[output_key] = input_path
+            jobs.append((input_path, output_path))
+        return jobs
+
+    def convert(self) -> List[ConversionResult]:
+        """Convert all files and wait until all conversions are finished
+
+        :returns: the outcomes in the order of the jobs
+        :rtype: List[ConversionResult]
+        """
+        with ProcessPoolExecutor(
+            max_workers=self._max_workers, initializer=_init_worker
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _convert,
+                    input_path,
+                    output_path,
+                    self._streaming,
+                    self._backend,
+                    self._incremental,
+                    self._cache_data,
+                    self._memory_budget,
+                    self._merge_rows,
+                    self._direct_pages,
+                    self._combined,
+                    self._repeat_headers,
+                )
+                for input_path, output_path in self._jobs
+            ]
+            results = []
+            for (input_path, output_path), future in zip(self._jobs, futures):
+                error = future.exception()
+                if error is None:
+                    results.append(future.result())
+                else:
+                    # The worker itself broke down, e.g. because it ran out of memory.
+                    results.append(
+                        ConversionResult(input_path, output_path, repr(error))
+                    )
+        return results
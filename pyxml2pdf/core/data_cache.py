@@ -0,0 +1,192 @@
+"""This module contains the class :class:`DataCache` to skip parsing unchanged input
+
+Usually the XML input is the same as in the previous run, for instance because the
+download is skipped for an existing local file. The :class:`DataCache` stores the
+data extracted from the input next to it and hands it out again as long as the
+input did not change. The cache consists of compressed JSON containing only the
+texts of the rows, so that loading it cannot run any code.
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from typing import Optional, Tuple
+
+import input.properties_template as properties  # type: ignore
+from pyxml2pdf import __version__
+from pyxml2pdf.core.dataset import XMLDataset
+from pyxml2pdf.core.sorter import Sorter
+
+__all__ = ["DataCache"]
+
+#: Increased whenever the stored data changes its layout.
+_FORMAT_VERSION = 2
+
+#: The size of the chunks in which the input is read to compute its hash.
+_CHUNK_SIZE = 1 << 20
+
+
+class DataCache:
+    """Store the data extracted from an XML file next to it for the following runs
+
+    The stored data is keyed by the input's size, modification time and content hash.
+    If size and modification time are unchanged, the data is reused right away. If
+    only the modification time changed, e.g. because the file was downloaded again,
+    the data is reused as long as the content hash is unchanged. The stored data is
+    discarded whenever the properties change which tags are extracted or how the rows
+    are sorted.
+
+    :param str input_path: path to the XML file
+    """
+
+    _input_path: str
+    _path: str
+    _key: Optional[Tuple[int, int, str]]
+
+    def __init__(self, input_path: str):
+        self._input_path = input_path
+        self._path = self.cache_path(input_path)
+        self._key = None
+
+    @staticmethod
+    def cache_path(input_path: str) -> str:
+        """Determine the path of the cache belonging to an XML file
+
+        :param str input_path: path to the XML file
+        :returns: the path to the cache right next to the XML file
+        :rtype: str
+        """
+        return input_path + ".cache"
+
+    @staticmethod
+    def fingerprint() -> str:
+        """Summarize the properties, which determine the extracted data
+
+        :returns: the digest of all properties referencing tags
+        :rtype: str
+        """
+        settings = [
+            _FORMAT_VERSION,
+            __version__,
+            properties.rows_xmltag,
+            [column.tag for column in properties.columns],
+            properties.identifier_xmltag,
+            properties.subtables_xmltag,
+            properties.sort_xmltag,
+        ]
+        return hashlib.blake2b(repr(settings).encode(), digest_size=16).hexdigest()
+
+    def load(self) -> Optional[XMLDataset]:
+        """Return the data extracted in a previous run, if the input did not change
+
+        :returns: the sorted data of all rows or None
+        :rtype: Optional[XMLDataset]
+        """
+        try:
+            stat = os.stat(self._input_path)
+        except OSError:
+            return None
+        size, mtime = stat.st_size, stat.st_mtime_ns
+        # The key is determined before the input is parsed in case of a miss, so
+        # that changes while parsing are detected in the next run.
+        self._key = None
+        fingerprint, key, data = self._read()
+        if fingerprint != self.fingerprint():
+            data = None
+        if data is not None and key[:2] == [size, mtime]:
+            return self._restore(data)
+        self._key = (size, mtime, self._hash_input())
+        if data is not None and key[::2] == list(self._key[::2]):
+            # Only the modification time changed, e.g. due to another download.
+            dataset = self._restore(data)
+            if dataset is not None:
+                self._store(dataset, self._key)
+            return dataset
+        return None
+
+    def save(self, dataset: XMLDataset):
+        """Store the data extracted from the input for the following runs
+
+        :param XMLDataset dataset: the sorted data of all rows
+        """
+        if self._key is None:
+            stat = os.stat(self._input_path)
+            self._key = (stat.st_size, stat.st_mtime_ns, self._hash_input())
+        self._store(dataset, self._key)
+
+    def _store(self, dataset: XMLDataset, key: Tuple[int, int, str]):
+        """Write the data together with the key of the input it was extracted from
+
+        :param XMLDataset dataset: the sorted data of all rows
+        :param Tuple[int, int, str] key: the input's size, modification time and hash
+        """
+        content = {
+            "fingerprint": self.fingerprint(),
+            "key": key,
+            "dataset": dataset.to_dict(),
+        }
+        try:
+            with open(self._path, "wb") as cache_file:
+                cache_file.write(
+                    zlib.compress(json.dumps(content, separators=(",", ":")).encode())
+                )
+        except OSError:
+            # Without the cache the input is just parsed again next time.
+            pass
+
+    def _read(self) -> Tuple[Optional[str], list, Optional[dict]]:
+        """Read the stored fingerprint, key and data without interpreting the data
+
+        :returns: the fingerprint, the key and the data of the dataset, which are
+            None and a key of Nones, if there is no readable cache
+        :rtype: Tuple[Optional[str], list, Optional[dict]]
+        """
+        try:
+            with open(self._path, "rb") as cache_file:
+                content = json.loads(zlib.decompress(cache_file.read()).decode())
+            fingerprint, key, data = (
+                content["fingerprint"],
+                list(content["key"]),
+                content["dataset"],
+            )
+        except (OSError, ValueError, zlib.error, KeyError, TypeError):
+            return None, [None, None, None], None
+        if len(key) != 3 or not isinstance(data, dict):
+            return None, [None, None, None], None
+        return fingerprint, key, data
+
+    @staticmethod
+    def _restore(data: dict) -> Optional[XMLDataset]:
+        """Restore the sorted dataset including its sort keys from the stored data
+
+        :param dict data: the data of the dataset as stored in the cache
+        :returns: the sorted data of all rows or None, if the data is malformed
+        :rtype: Optional[XMLDataset]
+        """
+        try:
+            dataset = XMLDataset.from_dict(data)
+        except ValueError:
+            return None
+        sort_tags = properties.sort_xmltag
+        if isinstance(sort_tags, str):
+            sort_tags = [sort_tags]
+        try:
+            dataset.sort_keys = Sorter.create_sort_keys(
+                [dataset.column(tag) for tag in sort_tags]
+            )
+        except KeyError:
+            return None
+        return dataset
+
+    def _hash_input(self) -> str:
+        """Compute the hash of the input's content
+
+        :returns: the hex digest of the input
+        :rtype: str
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(self._input_path, "rb") as input_file:
+            for chunk in iter(lambda: input_file.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
@@ -0,0 +1,210 @@
+"""This module contains the class :class:`XMLDataset` for column-oriented XML data"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from pyxml2pdf.core.records import XMLRecord
+
+__all__ = ["XMLDataset"]
+
+
+class XMLDataset:
+    """A column-oriented collection of the data extracted from all rows
+
+    Between parsing and building the tables, all rows' data is kept in one list per
+    referenced tag, accompanied by a column of criteria, a column of identifiers and
+    a column of sort keys. This allows for sorting, filtering and formatting all rows
+    at once before any :py:mod:`reportlab` flowable is created.
+
+    :param Iterable[str] tags: all tags whose texts are stored
+    """
+
+    _columns: Dict[str, List[Optional[str]]]
+    _row_tags: List[str]
+    _attribs: List[Optional[Dict[str, str]]]
+    _criteria: List[Set[str]]
+    _identifiers: List[str]
+    _sort_keys: List[Any]
+
+    def __init__(self, tags: Iterable[str]):
+        self._columns = {tag: [] for tag in sorted(tags)}
+        self._row_tags = []
+        self._attribs = []
+        self._criteria = []
+        self._identifiers = []
+        self._sort_keys = []
+
+    @classmethod
+    def from_records(cls, records: Iterable[XMLRecord], tags: Iterable[str]):
+        """Collect the data of several records into a new dataset
+
+        :param Iterable[XMLRecord] records: the records to collect
+        :param Iterable[str] tags: all tags whose texts are stored
+        :returns: the dataset containing all records in the given order
+        :rtype: XMLDataset
+        """
+        dataset = cls(tags)
+        for record in records:
+            dataset.append(record)
+        return dataset
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Restore a dataset from the plain data returned by :meth:`to_dict`
+
+        The sort keys are not restored.
+
+        :param Dict[str, Any] data: the dataset's texts
+        :returns: the dataset
+        :rtype: XMLDataset
+        :raises ValueError: if the data does not describe a dataset
+        """
+        try:
+            dataset = cls(data["columns"])
+            for tag, column in data["columns"].items():
+                dataset._columns[tag] = [
+                    None if text is None else str(text) for text in column
+                ]
+            dataset._row_tags = [str(tag) for tag in data["row_tags"]]
+            dataset._attribs = [
+                (
+                    None
+                    if attrib is None
+                    else {str(name): str(value) for name, value in attrib.items()}
+                )
+                for attrib in data["attribs"]
+            ]
+            dataset._criteria = [
+                set(map(str, criteria)) for criteria in data["criteria"]
+            ]
+            dataset._identifiers = [
+                str(identifier) for identifier in data["identifiers"]
+            ]
+        except (AttributeError, KeyError, TypeError) as error:
+            raise ValueError(f"The data does not describe a dataset: {error}")
+        if any(len(column) != len(dataset) for column in dataset._columns.values()) or (
+            not len(dataset._attribs)
+            == len(dataset._criteria)
+            == len(dataset._identifiers)
+            == len(dataset)
+        ):
+            raise ValueError("The columns of the data differ in length.")
+        return dataset
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the texts of the dataset as plain lists and dictionaries
+
+        The result consists only of strings, lists, dictionaries and None, so that it
+        can be stored for instance as JSON. The sort keys are not included.
+
+        :returns: the dataset's texts
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "columns": self._columns,
+            "row_tags": self._row_tags,
+            "attribs": self._attribs,
+            "criteria": [sorted(criteria) for criteria in self._criteria],
+            "identifiers": self._identifiers,
+        }
+
+    def __len__(self) -> int:
+        return len(self._row_tags)
+
+    def append(self, record: XMLRecord):
+        """Append a record's data to the end of all columns
+
+        :param XMLRecord record: the record to append
+        """
+        for tag, column in self._columns.items():
+            column.append(record.findtext(tag))
+        self._row_tags.append(record.tag)
+        self._attribs.append(record.attrib or None)
+        self._criteria.append(record.criteria)
+        self._identifiers.append(record.identifier)
+
+    def record(self, index: int) -> XMLRecord:
+        """Assemble the record of one row
+
+        :param int index: the row's position in the dataset
+        :returns: the record of the row
+        :rtype: XMLRecord
+        """
+        texts = {}
+        for tag, column in self._columns.items():
+            text = column[index]
+            if text:
+                texts[tag] = text
+        return XMLRecord(self._row_tags[index], self._attribs[index] or {}, texts)
+
+    def records(self) -> Iterable[XMLRecord]:
+        """Assemble the records of all rows one after another
+
+        :returns: an iterator over all rows' records
+        :rtype: Iterable[XMLRecord]
+        """
+        return (self.record(index) for index in range(len(self)))
+
+    def column(self, tag: str) -> List[Optional[str]]:
+        """Return the texts of one tag for all rows with None for empty tags
+
+        :param str tag: one of the stored tags
+        :returns: the texts of all rows
+        :rtype: List[Optional[str]]
+        """
+        return self._columns[tag]
+
+    def concatenate(self, tags: List[str], separator: str = " - ") -> List[str]:
+        """Form one string per row from the texts of a set of tags
+
+        This is the column-wise counterpart of
+        :meth:`pyxml2pdf.core.records.XMLRecord.concatenate`.
+
+        :param List[str] tags: list of all tags for which the texts are wanted
+        :param str separator: the separator in between the concatenated texts
+        :returns: concatenated, separated texts of all non-empty tags for all rows
+        :rtype: List[str]
+        """
+        if len(tags) == 1:
+            return [text or "" for text in self._columns[tags[0]]]
+        return [
+            separator.join([text for text in texts if text])
+            for texts in zip(*[self._columns[tag] for tag in tags])
+        ]
+
+    def reorder(self, order: List[int]):
+        """Rearrange all columns at once
+
+        :param List[int] order: the new order given as the current row positions
+        """
+        for tag, column in self._columns.items():
+            self._columns[tag] = [column[index] for index in order]
+        self._row_tags = [self._row_tags[index] for index in order]
+        self._attribs = [self._attribs[index] for index in order]
+        self._criteria = [self._criteria[index] for index in order]
+        self._identifiers = [self._identifiers[index] for index in order]
+        if self._sort_keys:
+            self._sort_keys = [self._sort_keys[index] for index in order]
+
+    @property
+    def tags(self) -> List[str]:
+        """List[str]: All stored tags in alphabetical order"""
+        return list(self._columns)
+
+    @property
+    def criteria(self) -> List[Set[str]]:
+        """List[Set[str]]: The criteria of all rows"""
+        return self._criteria
+
+    @property
+    def identifiers(self) -> List[str]:
+        """List[str]: The identifiers of all rows"""
+        return self._identifiers
+
+    @property
+    def sort_keys(self) -> List[Any]:
+        """List[Any]: The sort keys of all rows or an empty list if not yet sorted"""
+        return self._sort_keys
+
+    @sort_keys.setter
+    def sort_keys(self, value: List[Any]):
+        self._sort_keys = value
@@ -1,13 +1,12 @@
 """A wrapper :py:class:`pyxml2pdf.core.events.Event` for xml extracted data"""
 import re
-from typing import List, Type
+from typing import FrozenSet, List, Optional, Pattern, Type
 
 import defusedxml  # type: ignore
 from reportlab.platypus import Table  # type: ignore
 
+from pyxml2pdf.core.dataset import XMLDataset
 from pyxml2pdf.core.rows import XMLCell, XMLRow
-from pyxml2pdf.styles.table_styles import XMLTableStyle
-from pyxml2pdf.tables.builder import TableBuilder
 
 # Monkeypatch standard library xml vulnerabilities.
 defusedxml.defuse_stdlib()
@@ -18,11 +17,45 @@ __all__ = ["Event"]
 class Event(XMLRow):
     """A specialisation of :class:`XMLRow` onto events from an ACB event program
 
-    :param xml.etree.ElementTree.Element element: the element to build the instance from
+    :param element: the element or record to build the instance from
+    :type element: xml.etree.ElementTree.Element or XMLRecord
     """
 
-    _table_builder: TableBuilder = TableBuilder()
-    _table_style: XMLTableStyle = XMLTableStyle()
+    _referenced_tags: FrozenSet[str] = XMLRow._referenced_tags | frozenset(
+        [
+            "Ausruestung",
+            "Beschreibung",
+            "Bezeichnung",
+            "Bezeichnung2",
+            "Kursart",
+            "Kursleiter",
+            "Kurskosten",
+            "Leistungen",
+            "Ort1",
+            "TerminDatumBis1",
+            "TerminDatumBis2",
+            "TerminDatumBis3",
+            "TerminDatumVon1",
+            "TerminDatumVon2",
+            "TerminDatumVon3",
+            "TrainerURL",
+            "Voraussetzung",
+            "Zielgruppe",
+        ]
+    )
+
+    #: The pairs of tags forming the up to three date ranges of an event.
+    _date_ranges = [
+        ["TerminDatumVon1", "TerminDatumBis1"],
+        ["TerminDatumVon2", "TerminDatumBis2"],
+        ["TerminDatumVon3", "TerminDatumBis3"],
+    ]
+
+    #: The first two digits of a number with four or more digits like a year.
+    _century: Pattern = re.compile("(?<![0-9])[0-9]{2}(?=[0-9]{2})")
+
+    #: The separator of the events' dates while formatting all of them at once.
+    _separator: str = "\x00"
 
     _categories: List[str]
     _full_row: Table
@@ -32,14 +65,82 @@ class Event(XMLRow):
     _reduced_columns: List[XMLCell]
     _cell_styler: Type[XMLCell]
 
-    def __init__(self, element):
+    def __init__(self, element, cell_texts: Optional[List[str]] = None):
+        # Call XMLRow constructor, which builds the full row.
+        super().__init__(element, cell_texts)
         # Initialize definitely needed instance variables.
-        self._date = self._responsible = ""
-        # Call XMLRow constructor
-        super().__init__(element)
-        self._date = self._init_date()
-        self._responsible = self._concatenate_tags_content(["Kursleiter"])
-        self._reduced_columns = self._init_full_row()
+        self._date = self._cell_texts[1]
+        self._responsible = self._cell_texts[3]
+        self._reduced_columns = self._mandatory_columns
+
+    @classmethod
+    def build_cell_texts(cls, dataset: XMLDataset) -> List[List[str]]:
+        """Build the texts of all cells of the full rows for all events at once
+
+        This is the column-wise counterpart of :meth:`_build_cell_texts`.
+
+        :param XMLDataset dataset: the data of all events
+        :returns: one list of cell texts per event
+        :rtype: List[List[str]]
+        """
+        types = [cls._format_type(text) for text in dataset.concatenate(["Kursart"])]
+        dates = cls.format_dates(
+            [dataset.concatenate(date_range) for date_range in cls._date_ranges]
+        )
+        descriptions = [
+            cls._assemble_description(*texts)
+            for texts in zip(
+                dataset.concatenate(["Bezeichnung"]),
+                dataset.concatenate(["Bezeichnung2"]),
+                dataset.concatenate(["Beschreibung"]),
+                dataset.concatenate(["TrainerURL"]),
+            )
+        ]
+        prerequisites = [
+            cls._parse_prerequisites(*texts)
+            for texts in zip(
+                dataset.concatenate(["Voraussetzung"]),
+                dataset.concatenate(["Ausruestung"]),
+                dataset.concatenate(["Kurskosten"]),
+                dataset.concatenate(["Leistungen"]),
+            )
+        ]
+        return [
+            list(cell_texts)
+            for cell_texts in zip(
+                types,
+                dates,
+                dataset.concatenate(["Ort1"]),
+                dataset.concatenate(["Kursleiter"]),
+                descriptions,
+                dataset.concatenate(["Zielgruppe"]),
+                prerequisites,
+            )
+        ]
+
+    def _build_cell_texts(self) -> List[str]:
+        """Build the texts of all cells of the event's full row
+
+        Extract interesting information from events children tags for each of the
+        columns.
+
+        :return: the texts of all cells
+        :rtype: List[str]
+        """
+        return [
+            self._build_type(),
+            self._init_date(),
+            self._concatenate_tags_content(["Ort1"]),
+            self._concatenate_tags_content(["Kursleiter"]),
+            self._build_description(self._concatenate_tags_content(["TrainerURL"])),
+            self._concatenate_tags_content(["Zielgruppe"]),
+            self._parse_prerequisites(
+                self._concatenate_tags_content(["Voraussetzung"]),
+                self._concatenate_tags_content(["Ausruestung"]),
+                self._concatenate_tags_content(["Kurskosten"]),
+                self._concatenate_tags_content(["Leistungen"]),
+            ),
+        ]
 
     def _init_reduced_row(self, subtable_title):
         """Initializes the reduced version of the event
@@ -97,30 +198,12 @@ class Event(XMLRow):
     def _init_full_row(self) -> List[XMLCell]:
         """Initialize the single table row containing all information of the event
 
-        Extract interesting information from events children tags and connect them
-        into a nicely formatted row of a table.
+        Connect the cell texts into a nicely formatted row of a table.
 
         :return: the common starting columns of any table representation
         :rtype: List[XMLCell]
         """
-        table_columns = [
-            self._cell_styler(self._build_type()),
-            self._cell_styler(self._date),
-            self._cell_styler(self._concatenate_tags_content(["Ort1"])),
-            self._cell_styler(self._responsible),
-            self._cell_styler(
-                self._build_description(self._concatenate_tags_content(["TrainerURL"]))
-            ),
-            self._cell_styler(self._concatenate_tags_content(["Zielgruppe"])),
-            self._cell_styler(
-                self._parse_prerequisites(
-                    self._concatenate_tags_content(["Voraussetzung"]),
-                    self._concatenate_tags_content(["Ausruestung"]),
-                    self._concatenate_tags_content(["Kurskosten"]),
-                    self._concatenate_tags_content(["Leistungen"]),
-                )
-            ),
-        ]
+        table_columns = [self._cell_styler(text) for text in self._cell_texts]
         self._full_row = self._table_builder.create_fixedwidth_table([table_columns])
         return table_columns[:4]
 
@@ -136,22 +219,28 @@ class Event(XMLRow):
 
     def _init_date(self):
         """Create a properly formatted string containing the identifier of the event"""
-        # Extract data from xml children tags' texts. Since the date can consist of
-        # three date ranges, we concatenate them separated with a line containing
-        # only an "und".
-
-        dates = [
-            ["TerminDatumVon1", "TerminDatumBis1"],
-            ["TerminDatumVon2", "TerminDatumBis2"],
-            ["TerminDatumVon3", "TerminDatumBis3"],
-        ]
+        return self._format_date(
+            [
+                self._concatenate_tags_content(date_range)
+                for date_range in self._date_ranges
+            ]
+        )
 
-        extracted_dates = [
-            self._concatenate_tags_content(date)
-            for date in dates
-            if self._concatenate_tags_content(date)
-        ]
-        extracted_dates = "<br/>und<br/>".join(extracted_dates)
+    @classmethod
+    def _format_date(cls, date_ranges: List[str]) -> str:
+        """Format the date ranges of an event for the date column
+
+        Since the date can consist of three date ranges, we concatenate them
+        separated with a line containing only an "und".
+
+        :param List[str] date_ranges: the texts of all date ranges, which might be
+            empty
+        :returns: the content of the date column
+        :rtype: str
+        """
+        extracted_dates = "<br/>und<br/>".join(
+            [date_range for date_range in date_ranges if date_range]
+        )
 
         # Replace any extracted_dates of a form similar to 31.12.2099 with "on request".
         if "2099" in extracted_dates:
@@ -160,10 +249,47 @@ class Event(XMLRow):
             # Remove placeholders for missing time specifications and the first two
             # digits of the year specification.
             new_date = re.sub(
-                "[0-9]{4,}", self._remove_century, extracted_dates.replace("00:00", "")
+                "[0-9]{4,}", cls._remove_century, extracted_dates.replace("00:00", "")
             )
         return new_date
 
+    @classmethod
+    def format_dates(cls, date_range_columns: List[List[str]]) -> List[str]:
+        """Format the date ranges of many events for the date column at once
+
+        This is the column-wise counterpart of :meth:`_format_date`. Since the
+        separator between an event's date ranges contains no digits, each date range
+        can be formatted on its own. Thus all distinct date ranges of all events are
+        joined into one text, formatted in one pass and split up again.
+
+        :param List[List[str]] date_range_columns: one column per date range
+            containing its texts for all events, which might be empty
+        :returns: the content of the date column for all events
+        :rtype: List[str]
+        """
+        distinct_dates = list(set().union(*date_range_columns))
+        # Remove placeholders for missing time specifications and the first two
+        # digits of the year specification. The separator cannot occur in XML texts
+        # and keeps the numbers of different date ranges apart.
+        formatted_dates = cls._century.sub(
+            "", cls._separator.join(distinct_dates).replace("00:00", "")
+        ).split(cls._separator)
+        # Mark any dates of a form similar to 31.12.2099 to be replaced by "on
+        # request".
+        formats = {
+            date: None if "2099" in date else formatted_date
+            for date, formatted_date in zip(distinct_dates, formatted_dates)
+        }
+        dates = []
+        for date_ranges in zip(*date_range_columns):
+            formatted_ranges = [formats[date] for date in date_ranges if date]
+            dates.append(
+                "auf Anfrage"
+                if None in formatted_ranges
+                else "<br/>und<br/>".join(formatted_ranges)
+            )
+        return dates
+
     @staticmethod
     def _parse_prerequisites(
         personal: str, material: str, financial: str, offers: str
@@ -210,11 +336,27 @@ class Event(XMLRow):
         :returns: the full description including url if provided
         :rtype: str
         """
-        texts = [
-            self._concatenate_tags_content(["Bezeichnung"]).join(["<b>", "</b>"]),
+        return self._assemble_description(
+            self._concatenate_tags_content(["Bezeichnung"]),
             self._concatenate_tags_content(["Bezeichnung2"]),
             self._concatenate_tags_content(["Beschreibung"]),
-        ]
+            link,
+        )
+
+    @staticmethod
+    def _assemble_description(
+        title: str, subtitle: str, description: str, link: str = ""
+    ) -> str:
+        """Assemble the description from the texts of the according tags
+
+        :param str title: the event's title, which is printed bold
+        :param str subtitle: the event's subtitle
+        :param str description: the event's description
+        :param str link: a link to more details like the trainer url or the subtable
+        :returns: the full description including url if provided
+        :rtype: str
+        """
+        texts = [title.join(["<b>", "</b>"]), subtitle, description]
         full_description = " – ".join([text for text in texts if text])
         if link:
             joiner = "." if full_description[-1] != "." else ""
@@ -232,10 +374,17 @@ class Event(XMLRow):
         :returns: the entry in the type column of the event
         :rtype: str
         """
-        types = self._concatenate_tags_content(["Kursart"])
-        types = types.replace("Gemeinschaftsfahrt", "Eigenverant- wortlich")
+        return self._format_type(self._concatenate_tags_content(["Kursart"]))
+
+    @staticmethod
+    def _format_type(types: str) -> str:
+        """Format the type of an event for the type column
 
-        return types
+        :param str types: the text of the tag containing the types
+        :returns: the entry in the type column of the event
+        :rtype: str
+        """
+        return types.replace("Gemeinschaftsfahrt", "Eigenverant- wortlich")
 
     @create_reduced_after_full
     def get_full_row(self, subtable_title: str = None) -> Table:
@@ -0,0 +1,169 @@
+"""This module contains the class :class:`ExternalSorter` to sort within a budget
+
+For inputs larger than the available memory, the rows are written to a temporary
+file right after they were extracted and only their sort keys and positions in that
+file are kept in memory. As soon as those exceed the memory budget, they are sorted
+and spilled to a temporary file as a sorted run. Finally all runs are merged and the
+rows are read back one after another in sorted order.
+"""
+
+import heapq
+import pickle
+import sys
+import tempfile
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pyxml2pdf.core.sorter import SortKey, Sorter
+
+__all__ = ["ExternalSorter", "SortedRows"]
+
+#: The estimated memory of an entry besides its sort key.
+_ENTRY_OVERHEAD = 120
+
+#: The estimated memory of a parsed date kept by the key function for reuse.
+_CACHED_DATE_SIZE = 400
+
+#: The share of the memory budget for the parsed dates kept for reuse.
+_CACHED_DATES_SHARE = 4
+
+Entry = Tuple[SortKey, int, int]
+
+
+def _read_run(run: IO[bytes]) -> Iterator[Entry]:
+    """Read the entries of a sorted run one after another
+
+    :param IO[bytes] run: the temporary file containing the run
+    :returns: an iterator over the run's entries in sorted order
+    :rtype: Iterator[Tuple[Tuple, int, int]]
+    """
+    run.seek(0)
+    while True:
+        try:
+            yield pickle.load(run)
+        except EOFError:
+            return
+
+
+class SortedRows:
+    """The sorted rows of an :class:`ExternalSorter` read back one after another
+
+    :param IO[bytes] rows: the temporary file containing all rows
+    :param List[IO[bytes]] runs: the temporary files containing the sorted runs
+    :param int length: the number of rows
+    """
+
+    _rows: IO[bytes]
+    _runs: List[IO[bytes]]
+    _length: int
+
+    def __init__(self, rows: IO[bytes], runs: List[IO[bytes]], length: int):
+        self._rows = rows
+        self._runs = runs
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        for _, _, offset in heapq.merge(*[_read_run(run) for run in self._runs]):
+            self._rows.seek(offset)
+            yield pickle.load(self._rows)
+
+    def close(self):
+        """Remove all temporary files"""
+        for temporary_file in [self._rows] + self._runs:
+            temporary_file.close()
+
+
+class ExternalSorter:
+    """Sort rows by their date without keeping more than a budget in memory
+
+    The resulting order is identical to the one of
+    :meth:`pyxml2pdf.core.sorter.Sorter.sort_parsed_xml`, since the sort keys are
+    computed the same way and ties are broken by the original order of the rows.
+
+    :param rows: the rows to sort, which must be picklable and are consumed only
+        once, such as the records extracted from a
+        :class:`pyxml2pdf.core.streamer.Streamer`
+    :type rows: Iterable[XMLRecord]
+    :param int memory_budget: the approximate number of bytes the sort keys of one
+        run together with the parsed dates kept for reuse may occupy in memory
+    :param Optional[str] directory: the directory to create the temporary files in,
+        which defaults to the system's temporary directory
+    """
+
+    _rows: Iterable[Any]
+    _memory_budget: int
+    _directory: Optional[str]
+
+    def __init__(
+        self,
+        rows: Iterable[Any],
+        memory_budget: int,
+        directory: Optional[str] = None,
+    ):
+        self._rows = rows
+        self._memory_budget = memory_budget
+        self._directory = directory
+
+    def sort_parsed_xml(self, sort_key: Union[str, List[str]]) -> SortedRows:
+        """Sort the rows by their date and further tags to break ties
+
+        :param sort_key: the XML tag which contains the date or a list of tags,
+            where the first one contains the date and all others are used in the
+            given order to break ties
+        :type sort_key: str or List[str]
+        :returns: the rows in sorted order, which can be iterated over once
+        :rtype: SortedRows
+        """
+        # A quarter of the budget keeps the most recently parsed dates for reuse, so
+        # that their number does not grow with the number of distinct dates.
+        dates_budget = self._memory_budget // _CACHED_DATES_SHARE
+        runs_budget = self._memory_budget - dates_budget
+        get_key = Sorter.create_key_function(
+            sort_key, max(dates_budget // _CACHED_DATE_SIZE, 1)
+        )
+        rows = tempfile.TemporaryFile(dir=self._directory)
+        runs = []  # type: List[IO[bytes]]
+        entries = []  # type: List[Entry]
+        occupied = 0
+        length = 0
+        for length, row in enumerate(self._rows, 1):
+            key = get_key(row)
+            entries.append((key, length, rows.tell()))
+            pickle.dump(row, rows, protocol=pickle.HIGHEST_PROTOCOL)
+            occupied += self._estimate_size(key)
+            if occupied > runs_budget:
+                runs.append(self._spill(entries))
+                entries, occupied = [], 0
+        if entries or not runs:
+            runs.append(self._spill(entries))
+        return SortedRows(rows, runs, length)
+
+    def _spill(self, entries: List[Entry]) -> IO[bytes]:
+        """Sort entries and write them to a temporary file as one run
+
+        :param List[Tuple[Tuple, int, int]] entries: the sort keys, original
+            positions and offsets of the rows
+        :returns: the temporary file containing the sorted run
+        :rtype: IO[bytes]
+        """
+        entries.sort()
+        run = tempfile.TemporaryFile(dir=self._directory)
+        for entry in entries:
+            pickle.dump(entry, run, protocol=pickle.HIGHEST_PROTOCOL)
+        return run
+
+    @staticmethod
+    def _estimate_size(key: SortKey) -> int:
+        """Estimate the memory an entry with a given sort key occupies
+
+        :param Tuple key: the sort key
+        :returns: the approximate number of bytes
+        :rtype: int
+        """
+        return (
+            _ENTRY_OVERHEAD
+            + sys.getsizeof(key)
+            + sum([sys.getsizeof(part) for part in key])
+        )
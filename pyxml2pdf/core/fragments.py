@@ -0,0 +1,83 @@
+"""This module contains the class :class:`FragmentCache` to parse cell texts once
+
+Many cell texts repeat across thousands of rows, such as the same locations, the
+same names of the responsible persons or the same prerequisites. The
+:class:`FragmentCache` hands out the fragments :py:mod:`reportlab`'s paragraph
+parser produced for the first occurrence of a text in a certain style for all
+following occurrences.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, List, Tuple
+
+from reportlab.lib.styles import ParagraphStyle  # type: ignore
+from reportlab.platypus import Paragraph  # type: ignore
+
+__all__ = ["FragmentCache"]
+
+
+class FragmentCache:
+    """A bounded least recently used cache of parsed paragraph fragments
+
+    The fragments are keyed by the text and the style they were parsed with and can
+    be handed over to :py:class:`reportlab.platypus.Paragraph` via its `frags`
+    parameter to skip parsing. The cache can be shared across all rows of a run and
+    across threads.
+
+    :param int maxsize: the maximum number of texts to keep the fragments of
+    """
+
+    _maxsize: int
+    _fragments: "OrderedDict[Tuple[str, ParagraphStyle], List[Any]]"
+    _lock: threading.Lock
+    hits: int
+    misses: int
+
+    def __init__(self, maxsize: int = 4096):
+        self._maxsize = maxsize
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def parse(self, text: str, style: ParagraphStyle) -> List[Any]:
+        """Return the fragments of a text parsed with a style
+
+        :param str text: the text including its markup
+        :param ParagraphStyle style: the style to parse the text with
+        :returns: the fragments of the text
+        :rtype: List[ParaFrag]
+        """
+        key = (text, style)
+        with self._lock:
+            try:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                return self._fragments[key]
+            except KeyError:
+                self.misses += 1
+        fragments = Paragraph(text, style).frags
+        with self._lock:
+            self._fragments[key] = fragments
+            if len(self._fragments) > self._maxsize:
+                self._fragments.popitem(last=False)
+        return fragments
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of texts whose fragments were found in the cache
+
+        :returns: the ratio of hits to all lookups or 0 without any lookups
+        :rtype: float
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Remove all fragments and reset the statistics"""
+        with self._lock:
+            self._fragments.clear()
+            self.hits = self.misses = 0
@@ -0,0 +1,533 @@
+"""This module contains the classes :class:`RowCache` and
+:class:`IncrementalDocTemplate` for incremental rebuilds
+
+Between two runs on slightly changed XML input, most rows and subtables stay the
+same. The :class:`RowCache` stores the table rows built for each row's content and
+all rows of each subtable including its header on disk, so that only new or changed
+rows need to be built again and only subtables which gained, lost or changed rows are
+assembled anew. Together with the rows it remembers where the pages of the resulting
+PDF started, which allows the :class:`IncrementalDocTemplate` to take every page,
+whose content did not change, from the previous PDF and only lay out the others.
+
+The cache holds the built tables and is thus stored via :py:mod:`pickle`. To not run
+code planted by anyone else, it is signed with a secret key only readable by the
+current user and a cache without a valid signature is ignored.
+"""
+
+import hashlib
+import hmac
+import io
+import os
+import pickle
+import secrets
+from typing import Dict, List, Optional, Tuple
+
+import reportlab  # type: ignore
+from PyPDF2.pdf import PdfFileReader, PdfFileWriter  # type: ignore
+from reportlab.platypus import SimpleDocTemplate, Table  # type: ignore
+from reportlab.platypus.doctemplate import PageBegin  # type: ignore
+
+import input.properties_template as properties  # type: ignore
+from pyxml2pdf import __version__
+from pyxml2pdf.core.dataset import XMLDataset
+
+__all__ = ["IncrementalDocTemplate", "RowCache"]
+
+#: The file holding the current user's secret key to sign the caches with.
+_KEY_PATH = os.path.join(os.path.expanduser("~"), ".pyxml2pdf", "cache.key")
+
+#: The number of bytes of the secret key.
+_KEY_SIZE = 32
+
+#: The hash function of the signatures preceding the cached data.
+_SIGNATURE_HASH = hashlib.sha256
+
+#: The layout of a PDF as the signatures of all its flowables, the positions of the
+#: flowables starting each page and the size and modification time of the file.
+Layout = Tuple[List[str], List[Optional[int]], Tuple[int, int]]
+
+#: All properties which influence the resulting tables.
+_PROPERTY_NAMES = (
+    "columns",
+    "font",
+    "fontsize",
+    "identifier_xmltag",
+    "pagesize",
+    "rows_xmltag",
+    "sort_xmltag",
+    "subtable_settings",
+    "subtables_xmltag",
+)
+
+
+def _signing_key() -> bytes:
+    """Read the current user's secret key to sign caches with, creating it if needed
+
+    :returns: the secret key
+    :rtype: bytes
+    """
+    try:
+        with open(_KEY_PATH, "rb") as key_file:
+            key = key_file.read()
+        if len(key) == _KEY_SIZE:
+            return key
+    except OSError:
+        pass
+    key = secrets.token_bytes(_KEY_SIZE)
+    os.makedirs(os.path.dirname(_KEY_PATH), mode=0o700, exist_ok=True)
+    new_path = f"{_KEY_PATH}.{os.getpid()}"
+    with os.fdopen(
+        os.open(new_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb"
+    ) as key_file:
+        key_file.write(key)
+    # Concurrent runs each write a whole key, of which the last one is kept.
+    os.replace(new_path, _KEY_PATH)
+    return key
+
+
+def _sign(data: bytes) -> bytes:
+    """Compute the signature of data with the current user's secret key
+
+    :param bytes data: the data to sign
+    :returns: the signature
+    :rtype: bytes
+    """
+    return hmac.new(_signing_key(), data, _SIGNATURE_HASH).digest()
+
+
+class RowCache:
+    """Reuse built table rows and subtables of a previous run for unchanged content
+
+    Every row is identified by a hash of its referenced tags' texts together with the
+    active properties. The table rows created for a row are reused as long as its
+    hash does not change. Each subtable is identified by the sequence of hashes of
+    its rows, so its rows including the header are reused as a whole if it contains
+    exactly the same rows. The cache is only loaded, if it was signed with the current
+    user's secret key.
+
+    :param str path: path to the file to store the cache in
+    :param str row_type: a name for the kind of rows, since e.g. events result in
+        different tables than generic rows
+    """
+
+    _path: str
+    _fingerprint: bytes
+    _rows: Dict[str, List[Table]]
+    _subtables: Dict[str, Tuple[Tuple[str, ...], List[Table]]]
+    _used_rows: Dict[str, List[Table]]
+    _used_subtables: Dict[str, Tuple[Tuple[str, ...], List[Table]]]
+    _layout: Optional[Layout]
+    _new_layout: Optional[Layout]
+    _signatures: List[str]
+
+    def __init__(self, path: str, row_type: str = "XMLRow"):
+        self._path = path
+        self._fingerprint = self.fingerprint(row_type)
+        self._rows = {}
+        self._subtables = {}
+        self._used_rows = {}
+        self._used_subtables = {}
+        self._layout = None
+        self._new_layout = None
+        self._signatures = []
+        self.row_hits = self.row_misses = 0
+        self.subtable_hits = self.subtable_misses = 0
+        self.load()
+
+    @staticmethod
+    def cache_path(output_path: str) -> str:
+        """Determine the path of the cache belonging to a PDF file
+
+        :param str output_path: the path to the resulting PDF file
+        :returns: the path to the cache right next to the PDF file
+        :rtype: str
+        """
+        return os.path.splitext(output_path)[0] + ".cache"
+
+    @staticmethod
+    def fingerprint(row_type: str = "XMLRow") -> bytes:
+        """Summarize everything besides the XML content the tables depend on
+
+        :param str row_type: a name for the kind of rows
+        :returns: the digest of the active properties and versions
+        :rtype: bytes
+        """
+        settings = [row_type, __version__, reportlab.Version] + [
+            getattr(properties, name, None) for name in _PROPERTY_NAMES
+        ]
+        return hashlib.blake2b(repr(settings).encode(), digest_size=16).digest()
+
+    def load(self):
+        """Load the cache of the previous run if it was created with equal settings
+
+        The cache is ignored, if it was not signed with the current user's secret key.
+        """
+        try:
+            with open(self._path, "rb") as cache_file:
+                signature = cache_file.read(_SIGNATURE_HASH().digest_size)
+                data = cache_file.read()
+        except OSError:
+            return
+        if not hmac.compare_digest(signature, _sign(data)):
+            return
+        try:
+            fingerprint, rows, subtables, layout = pickle.loads(data)
+        except (EOFError, ValueError, pickle.UnpicklingError):
+            return
+        if fingerprint == self._fingerprint:
+            self._rows, self._subtables, self._layout = rows, subtables, layout
+
+    def save(self):
+        """Store everything used in the current run to be reused in the next one
+
+        The stored data is preceded by its signature with the current user's secret
+        key.
+        """
+        data = pickle.dumps(
+            (
+                self._fingerprint,
+                self._used_rows,
+                self._used_subtables,
+                self._new_layout,
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        with open(self._path, "wb") as cache_file:
+            cache_file.write(_sign(data))
+            cache_file.write(data)
+
+    def remove(self):
+        """Remove the file storing the cache"""
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+    def row_hashes(self, dataset: XMLDataset) -> List[str]:
+        """Compute the hashes of all rows' contents together with the properties
+
+        :param XMLDataset dataset: the data of all rows
+        :returns: the hashes of all rows
+        :rtype: List[str]
+        """
+        base = hashlib.blake2b(self._fingerprint, digest_size=16)
+        hashes = []
+        for texts in zip(*[dataset.column(tag) for tag in dataset.tags]):
+            row_hash = base.copy()
+            row_hash.update(repr(texts).encode())
+            hashes.append(row_hash.hexdigest())
+        return hashes
+
+    def get_rows(self, row_hash: str) -> Optional[List[Table]]:
+        """Return the table rows built for a row in the previous run
+
+        :param str row_hash: the row's hash
+        :returns: the table rows in the order of the row's subtables or None
+        :rtype: Optional[List[Table]]
+        """
+        tables = self._rows.get(row_hash)
+        if tables is None:
+            self.row_misses += 1
+        else:
+            self.row_hits += 1
+            self._used_rows[row_hash] = tables
+        return tables
+
+    def store_rows(self, row_hash: str, tables: List[Table]):
+        """Remember the table rows built for a row
+
+        :param str row_hash: the row's hash
+        :param List[Table] tables: the table rows in the order of the row's subtables
+        """
+        self._used_rows[row_hash] = tables
+
+    def get_subtable(
+        self, title: str, row_hashes: Tuple[str, ...]
+    ) -> Optional[List[Table]]:
+        """Return all rows of a subtable, if they did not change
+
+        :param str title: the subtable's title
+        :param Tuple[str, ...] row_hashes: the hashes of the subtable's rows in order
+        :returns: the subtable's rows of the previous run or None
+        :rtype: Optional[List[Table]]
+        """
+        previous_hashes, table_rows = self._subtables.get(title, ((), None))
+        if table_rows is None or previous_hashes != row_hashes:
+            self.subtable_misses += 1
+            return None
+        self.subtable_hits += 1
+        self._used_subtables[title] = (row_hashes, table_rows)
+        return table_rows
+
+    def store_subtable(
+        self, title: str, row_hashes: Tuple[str, ...], table_rows: List[Table]
+    ):
+        """Remember all rows of a subtable
+
+        :param str title: the subtable's title
+        :param Tuple[str, ...] row_hashes: the hashes of the subtable's rows in order
+        :param List[Table] table_rows: the subtable's rows including the header
+        """
+        self._used_subtables[title] = (row_hashes, table_rows)
+
+    def add_signatures(
+        self, title: str, row_hashes: Tuple[str, ...], table_rows: List[Table]
+    ):
+        """Append the signatures of a subtable's rows in the order they are printed
+
+        :param str title: the subtable's title
+        :param Tuple[str, ...] row_hashes: the hashes of the subtable's rows in order
+        :param List[Table] table_rows: the subtable's rows including the header
+        """
+        header_length = len(table_rows) - len(row_hashes)
+        self._signatures.extend(
+            [f"{title}\x1fheader {index}" for index in range(header_length)]
+            + [f"{title}\x1f{row_hash}" for row_hash in row_hashes]
+        )
+
+    @property
+    def signatures(self) -> List[str]:
+        """List[str]: The signatures of all flowables of the current run in order"""
+        return self._signatures
+
+    @property
+    def layout(self) -> Optional[Layout]:
+        """Optional[Layout]: The layout of the previous run's PDF if known"""
+        return self._layout
+
+    def store_layout(self, layout: Optional[Layout]):
+        """Remember the layout of the current run's PDF
+
+        :param Optional[Layout] layout: the layout of the current run's PDF
+        """
+        self._new_layout = layout
+
+
+class IncrementalDocTemplate(SimpleDocTemplate):
+    """A document template, which reuses all pages of the previous run still valid
+
+    A page of the previous run is reused, whenever it would start with the same
+    flowable again and all flowables on it as well as the one following it did not
+    change, since then it is laid out exactly as before. All other pages are laid
+    out as usual until a page could be reused again. The pages of both kinds are
+    combined in their order into the resulting PDF.
+
+    All arguments besides the :class:`RowCache` are passed on to
+    :py:class:`reportlab.platypus.SimpleDocTemplate`.
+
+    :param str filename: path to the resulting PDF file
+    :param RowCache row_cache: the cache holding the previous run's layout
+    """
+
+    _row_cache: RowCache
+    _signatures: List[str]
+    _old_signatures: List[str]
+    _old_starts: List[Optional[int]]
+    _old_pages: Dict[str, int]
+    _originals: list
+    _story: list
+    _indices: Dict[int, int]
+    _page_starts: List[Optional[int]]
+    _stop: Optional[int]
+
+    def __init__(self, filename: str, row_cache: RowCache, **kwargs):
+        super().__init__(filename, **kwargs)
+        self._row_cache = row_cache
+        self._signatures = []
+        self._old_signatures = []
+        self._old_starts = []
+        self._old_pages = {}
+        self._originals = []
+        self._story = []
+        self._indices = {}
+        self._page_starts = []
+        self._stop = None
+        #: The positions of the pages, which were laid out anew or moved
+        self.changed_pages = []  # type: List[int]
+
+    def build(self, flowables, *args, **kwargs):
+        """Lay out only the changed pages and combine them with the previous ones
+
+        :param flowables: all flowables of the document as for
+            :py:meth:`reportlab.platypus.SimpleDocTemplate.build`
+        """
+        filename = self.filename
+        self._signatures = self._row_cache.signatures
+        previous_pdf = self._read_previous(filename)
+        if previous_pdf is None or len(self._signatures) != len(flowables):
+            previous_pdf, self._old_signatures, self._old_starts = None, [], []
+        self._old_pages = {
+            self._old_signatures[start]: page
+            for page, start in reversed(list(enumerate(self._old_starts)))
+            if start is not None
+        }
+
+        pages = []  # type: List[Tuple[PdfFileReader, int]]
+        page_starts = []  # type: List[Optional[int]]
+        index = 0
+        while index < len(flowables):
+            old_page = self._reusable_page(index)
+            if old_page is None:
+                laid_out, index = self._lay_out(flowables, index, *args, **kwargs)
+                pages.extend(
+                    [(laid_out, page) for page in range(laid_out.getNumPages())]
+                )
+                page_starts.extend(self._page_starts)
+            else:
+                pages.append((previous_pdf, old_page))
+                page_starts.append(index)
+                index += self._old_page_length(old_page)
+
+        self.changed_pages = [
+            position
+            for position, (pdf, page) in enumerate(pages)
+            if pdf is not previous_pdf or page != position
+        ]
+        if not self.changed_pages and len(pages) == len(self._old_starts):
+            # Nothing changed at all, so the previous PDF stays as it is.
+            self._row_cache.store_layout(self._row_cache.layout)
+            return
+        with open(filename, "wb") as pdf_out:
+            if previous_pdf is None and len(pages) == pages[0][0].getNumPages():
+                # Everything was laid out at once, so take the PDF as it is.
+                pdf_out.write(pages[0][0].stream.getvalue())
+            else:
+                pdf_writer = PdfFileWriter()
+                for pdf, page in pages:
+                    pdf_writer.addPage(pdf.getPage(page))
+                pdf_writer.write(pdf_out)
+        stat = os.stat(filename)
+        self._row_cache.store_layout(
+            (self._signatures, page_starts, (stat.st_size, stat.st_mtime_ns))
+        )
+
+    def _lay_out(
+        self, flowables: list, start: int, *args, **kwargs
+    ) -> Tuple[PdfFileReader, int]:
+        """Lay out the flowables from a position on until a page can be reused
+
+        All further arguments are passed on to
+        :py:meth:`reportlab.platypus.SimpleDocTemplate.build`.
+
+        :param list flowables: all flowables of the document
+        :param int start: the position of the first flowable to lay out
+        :returns: the laid out pages and the position of the first flowable not
+            laid out
+        :rtype: Tuple[PdfFileReader, int]
+        """
+        self._originals = flowables[start:]
+        self._story = list(self._originals)
+        self._indices = {
+            id(flowable): index for index, flowable in enumerate(self._originals, start)
+        }
+        self._page_starts = [start]
+        self._stop = None
+        filename, laid_out = self.filename, io.BytesIO()
+        self.filename = laid_out
+        try:
+            super().build(self._story, *args, **kwargs)
+        finally:
+            self.filename = filename
+        return (
+            PdfFileReader(laid_out),
+            len(flowables) if self._stop is None else self._stop,
+        )
+
+    def handle_flowable(self, flowables):
+        super().handle_flowable(flowables)
+        if (
+            flowables is self._story
+            and flowables
+            and self._hanging
+            and self._hanging[-1] is PageBegin
+        ):
+            # A new page is about to start with the next flowable.
+            index = self._front_index(flowables)
+            if index is not None and self._reusable_page(index) is not None:
+                self._stop = index
+                del flowables[:]
+            else:
+                self._page_starts.append(index)
+
+    def _front_index(self, flowables: list) -> Optional[int]:
+        """Determine the position of the flowable about to be placed in the document
+
+        Flowables like :py:class:`reportlab.platypus.flowables.KeepTogether` are
+        replaced by their content once they are split, so the next flowable either
+        is one of the original flowables or part of the last one started.
+
+        :param list flowables: the flowables not yet placed in the document
+        :returns: the position of the next flowable or None, if only a part of the
+            original flowable is left
+        :rtype: Optional[int]
+        """
+        start = self._page_starts[0]
+        for position, flowable in enumerate(flowables):
+            index = self._indices.get(id(flowable))
+            if index is not None:
+                break
+        else:
+            position, index = len(flowables), start + len(self._originals)
+        if position == 0:
+            return index
+        original = self._originals[index - 1 - start]
+        if any(flowables[0] is part for part in getattr(original, "_content", ())):
+            return index - 1
+        return None
+
+    def _reusable_page(self, index: int) -> Optional[int]:
+        """Find a page of the previous run, which would look the same if laid out now
+
+        :param int index: the position of the flowable starting the page
+        :returns: the previous run's page number or None
+        :rtype: Optional[int]
+        """
+        page = self._old_pages.get(self._signatures[index])
+        if page is None:
+            return None
+        length = self._old_page_length(page)
+        if not length:
+            return None
+        start = self._old_starts[page]
+        # The flowable following the page must be the same, since it did not fit.
+        if (
+            self._signatures[index : index + length + 1]
+            != self._old_signatures[start : start + length + 1]
+        ):
+            return None
+        return page
+
+    def _old_page_length(self, page: int) -> Optional[int]:
+        """Count the flowables starting on a page of the previous run
+
+        :param int page: the previous run's page number
+        :returns: the number of flowables or None, if the next page starts with a
+            part of a flowable
+        :rtype: Optional[int]
+        """
+        start = self._old_starts[page]
+        if page + 1 == len(self._old_starts):
+            return len(self._old_signatures) - start
+        end = self._old_starts[page + 1]
+        return None if end is None else end - start
+
+    def _read_previous(self, filename: str) -> Optional[PdfFileReader]:
+        """Read the previous run's PDF if it is still exactly as it was left
+
+        :param str filename: path to the PDF file
+        :returns: the previous PDF or None
+        :rtype: Optional[PdfFileReader]
+        """
+        layout = self._row_cache.layout
+        if layout is None:
+            return None
+        self._old_signatures, self._old_starts, (size, mtime) = layout
+        try:
+            stat = os.stat(filename)
+            if (stat.st_size, stat.st_mtime_ns) != (size, mtime):
+                return None
+            with open(filename, "rb") as pdf_in:
+                previous_pdf = PdfFileReader(io.BytesIO(pdf_in.read()))
+            if previous_pdf.getNumPages() != len(self._old_starts):
+                return None
+        except Exception:  # pylint: disable=broad-except
+            return None
+        return previous_pdf
@@ -1,16 +1,24 @@
 """This module contains the class :class:`Initializer` to coordinate the process."""
 
-from typing import List
+import os
+import tempfile
+from typing import Iterable, List, Optional
 
-from defusedxml.ElementTree import parse  # type: ignore
 from reportlab.lib.units import mm  # type: ignore
 from reportlab.platypus import SimpleDocTemplate  # type: ignore
-from reportlab.platypus.flowables import KeepTogether  # type: ignore
+from reportlab.platypus.flowables import Flowable  # type: ignore
 
 from input.properties_template import pagesize, rows_xmltag, sort_xmltag  # type: ignore
+from pyxml2pdf.core.backends import get_backend
+from pyxml2pdf.core.data_cache import DataCache
+from pyxml2pdf.core.external_sorter import ExternalSorter
+from pyxml2pdf.core.incremental import IncrementalDocTemplate, RowCache
+from pyxml2pdf.core.parallel import ParallelDocTemplate
 from pyxml2pdf.core.parser import Parser
 from pyxml2pdf.core.post_processor import PostProcessor
+from pyxml2pdf.core.single_pages import SinglePageDocTemplate
 from pyxml2pdf.core.sorter import Sorter
+from pyxml2pdf.core.streamer import Streamer
 
 
 class Initializer:
@@ -20,28 +28,169 @@ class Initializer:
 
     :param str input_path: Path to input XML file
     :param str output_path: Path to resulting PDF file
+    :param bool streaming: If True, the XML file is read incrementally one row at a
+        time instead of parsing the whole document at once, which keeps the memory
+        footprint flat for large inputs. Defaults to False.
+    :param str backend: The name of the backend to parse the XML file with, one of
+        :data:`pyxml2pdf.core.backends.BACKEND_NAMES`. Defaults to 'auto', which
+        prefers lxml if it is installed.
+    :param bool incremental: If True, the table rows and subtables built for the
+        same output in the previous run are reused for all unchanged rows and the
+        ones built now are stored for the next run. Only the pages affected by
+        changes are laid out and split into single pages again. Defaults to False.
+    :param bool cache_data: If True, the data extracted from the XML file is stored
+        next to it and the XML file is not parsed again as long as it does not
+        change. Defaults to False.
+    :param Optional[int] memory_budget: If given, the rows are sorted out of core
+        with at most about this many bytes of sort keys in memory at once, so that
+        the extracted rows are not all kept in memory for sorting. The table rows
+        built from them are still kept until the PDF is built. The data is not
+        cached then and this cannot be combined with `incremental`. Defaults to
+        None, i.e. sorting in memory.
+    :param bool merge_rows: If True, the rows of each subtable are merged into one
+        table, which repeats the title and column headings on every page, instead of
+        laying out the rows' tables one below the other. This cannot be combined
+        with `incremental`. Defaults to False.
+    :param Optional[int] render_workers: If given, all pages are laid out at once
+        and then drawn in this many worker processes. This cannot be combined with
+        `incremental` or `merge_rows`. Defaults to None, i.e. drawing the pages one
+        after the other in this process.
+    :param bool direct_pages: If True, the rotated single pages are written
+        directly while building instead of splitting the combined PDF into them
+        afterwards. This cannot be combined with `incremental` or `render_workers`.
+        Defaults to False.
+    :param bool combined: If False, the combined PDF file is not written at all,
+        which requires `direct_pages`. Defaults to True.
+    :param Optional[Iterable[int]] pages: If given, all pages are laid out, but only
+        the pages with these zero-based numbers are drawn and split into single
+        pages, which are numbered as in the whole document. The resulting PDF file
+        of a previous run is left as it is. This cannot be combined with
+        `incremental`, `merge_rows` or `direct_pages`. Defaults to None, i.e. all
+        pages.
+    :param bool repeat_headers: If True, the title and column headings of each
+        subtable are repeated on every page it continues on, which results in more
+        pages. This cannot be combined with `incremental`. Defaults to False.
     """
 
-    def __init__(self, input_path: str, output_path: str):
+    def __init__(
+        self,
+        input_path: str,
+        output_path: str,
+        streaming: bool = False,
+        backend: str = "auto",
+        incremental: bool = False,
+        cache_data: bool = False,
+        memory_budget: Optional[int] = None,
+        merge_rows: bool = False,
+        render_workers: Optional[int] = None,
+        direct_pages: bool = False,
+        combined: bool = True,
+        pages: Optional[Iterable[int]] = None,
+        repeat_headers: bool = False,
+    ):
+        if incremental and (merge_rows or repeat_headers):
+            raise ValueError(
+                "Incremental builds reuse single table rows, so they cannot be "
+                "combined with merging the rows of each subtable into one table or "
+                "repeating its headers."
+            )
+        if incremental and memory_budget is not None:
+            raise ValueError(
+                "Incremental builds compare the rows' hashes with the previous run, "
+                "which are only computed for rows sorted in memory, so they cannot be "
+                "combined with a memory budget."
+            )
+        if render_workers is not None and (incremental or merge_rows):
+            raise ValueError(
+                "Drawing in parallel requires laying out whole subtables, so it "
+                "cannot be combined with incremental builds or merged rows."
+            )
+        if direct_pages and (incremental or render_workers is not None):
+            raise ValueError(
+                "Writing the single pages directly requires drawing all pages in "
+                "this process, so it cannot be combined with incremental builds or "
+                "drawing in parallel."
+            )
+        if pages is not None and (incremental or merge_rows or direct_pages):
+            raise ValueError(
+                "Drawing selected pages requires laying out whole subtables in "
+                "advance, so it cannot be combined with incremental builds, merged "
+                "rows or writing the single pages directly."
+            )
+        if not (combined or direct_pages):
+            raise ValueError(
+                "The single pages are split off the combined PDF file, unless they "
+                "are written directly."
+            )
         #: The processed content of the XML file as table rows and columns
-        self._data = []  # type: List[KeepTogether]
-        parser = Parser(self._data)
-        pdf = SimpleDocTemplate(
-            output_path,
+        self._data = []  # type: List[Flowable]
+        page_settings = dict(
             pagesize=[size * mm for size in pagesize],
             topMargin=0.0,
             bottomMargin=0.0,
             leftMargin=0.0,
             rightMargin=0.0,
         )
-        doc = parse(input_path)
-        sorter = Sorter(doc.findall(rows_xmltag))
-        sorted_courses = sorter.sort_parsed_xml(sort_xmltag)
+        if incremental:
+            row_cache = RowCache(RowCache.cache_path(output_path))
+            pdf = IncrementalDocTemplate(output_path, row_cache, **page_settings)
+        elif render_workers is not None or pages is not None:
+            row_cache = None
+            # Only a few pages are usually selected, which are drawn in this process.
+            pdf = ParallelDocTemplate(
+                output_path, render_workers or 1, pages, **page_settings
+            )
+        elif direct_pages:
+            row_cache = None
+            pdf = SinglePageDocTemplate(output_path, combined, **page_settings)
+        else:
+            row_cache = None
+            pdf = SimpleDocTemplate(output_path, **page_settings)
+        parser = Parser(self._data, row_cache, merge_rows, repeat_headers)
+        data_cache = (
+            DataCache(input_path) if cache_data and memory_budget is None else None
+        )
+        sorted_courses = data_cache.load() if data_cache else None
+        if sorted_courses is None:
+            parser_backend = get_backend(backend)
+            if streaming:
+                elements = Streamer(input_path, rows_xmltag, parser_backend)
+            else:
+                elements = parser_backend.parse(input_path).findall(rows_xmltag)
+            if memory_budget is None:
+                sorter = Sorter(parser.create_dataset(elements))
+                sorted_courses = sorter.sort_parsed_xml(sort_xmltag)
+                if data_cache:
+                    data_cache.save(sorted_courses)
+            else:
+                external_sorter = ExternalSorter(
+                    parser.iterate_records(elements), memory_budget
+                )
+                sorted_courses = external_sorter.sort_parsed_xml(sort_xmltag)
 
-        parser.collect_xml_data(sorted_courses)
+        try:
+            parser.collect_xml_data(sorted_courses)
+        finally:
+            if memory_budget is not None:
+                sorted_courses.close()
 
-        if self._data:
+        if self._data and pages is not None:
+            # The resulting PDF file of a previous run is left as it is, while the
+            # selected pages are drawn into a temporary file to split them.
+            with tempfile.TemporaryDirectory() as directory:
+                pdf.filename = os.path.join(directory, os.path.basename(output_path))
+                pdf.build(self._data)
+                PostProcessor(output_path, render_workers).store_pages(
+                    pdf.filename, pdf.drawn_pages, pdf.page_count
+                )
+        elif self._data:
             pdf.build(self._data)
 
-            pdf_postprocessor = PostProcessor(output_path)
-            pdf_postprocessor.finalize_print_preparation()
+            # The single pages were already written while building directly.
+            if not direct_pages:
+                pdf_postprocessor = PostProcessor(output_path, render_workers)
+                if row_cache is None:
+                    pdf_postprocessor.finalize_print_preparation()
+                else:
+                    row_cache.save()
+                    pdf_postprocessor.finalize_print_preparation(pdf.changed_pages)
@@ -0,0 +1,97 @@
+"""This module contains the class :class:`MeasurementCache` to break lines once
+
+:py:mod:`reportlab` wraps every cell several times, e.g. while trying to keep a
+table row together, while placing it into a frame and again while drawing it. For
+a fixed column width the result of breaking a certain text in a certain style into
+lines never changes, so the :class:`MeasurementCache` hands out the result of the
+first measurement for all following ones.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from reportlab.lib.styles import ParagraphStyle  # type: ignore
+
+__all__ = ["MeasurementCache"]
+
+Measurement = Dict[str, Any]
+
+
+class MeasurementCache:
+    """A bounded least recently used cache of the measurements of wrapped texts
+
+    The measurements are keyed by the text, the style and the available width and
+    consist of all attributes :py:meth:`reportlab.platypus.Paragraph.wrap` sets,
+    so that a paragraph can be drawn after restoring them. The cache can be shared
+    across all rows of a run and across threads.
+
+    :param int maxsize: the maximum number of measurements to keep
+    """
+
+    _maxsize: int
+    _measurements: "OrderedDict[Tuple[str, ParagraphStyle, float], Measurement]"
+    _lock: threading.Lock
+    hits: int
+    misses: int
+
+    def __init__(self, maxsize: int = 8192):
+        self._maxsize = maxsize
+        self._measurements = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._measurements)
+
+    def get(
+        self, text: str, style: ParagraphStyle, width: float
+    ) -> Optional[Measurement]:
+        """Return the measurement of a text wrapped in a style to a width
+
+        :param str text: the text including its markup
+        :param ParagraphStyle style: the style the text is wrapped in
+        :param float width: the available width
+        :returns: the attributes set by wrapping or None if not yet measured
+        :rtype: Optional[Dict[str, Any]]
+        """
+        key = (text, style, width)
+        with self._lock:
+            try:
+                self._measurements.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._measurements[key]
+
+    def store(
+        self, text: str, style: ParagraphStyle, width: float, measurement: Measurement
+    ):
+        """Store the measurement of a text wrapped in a style to a width
+
+        :param str text: the text including its markup
+        :param ParagraphStyle style: the style the text was wrapped in
+        :param float width: the available width
+        :param Dict[str, Any] measurement: the attributes set by wrapping
+        """
+        with self._lock:
+            self._measurements[(text, style, width)] = measurement
+            if len(self._measurements) > self._maxsize:
+                self._measurements.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of measurements which were found in the cache
+
+        :returns: the ratio of hits to all lookups or 0 without any lookups
+        :rtype: float
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Remove all measurements and reset the statistics"""
+        with self._lock:
+            self._measurements.clear()
+            self.hits = self.misses = 0
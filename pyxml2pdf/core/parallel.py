@@ -0,0 +1,231 @@
+"""This module contains the class :class:`ParallelDocTemplate` to draw in parallel
+
+Breaking the subtables into pages only needs the heights of their rows, which each
+:class:`pyxml2pdf.tables.tables.SubtableFlowable` measures once, while drawing the
+rows takes by far the most time of building the PDF. The
+:class:`ParallelDocTemplate` thus first lays out all pages in one pass without
+drawing anything, then draws contiguous ranges of pages in worker processes and
+finally concatenates the resulting PDF fragments in their order. The same way it
+draws only selected pages, if the others did not change.
+"""
+
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from typing import Any, Dict, Iterable, List, Optional
+
+from PyPDF2.pdf import PdfFileReader, PdfFileWriter  # type: ignore
+from reportlab.platypus import Frame, PageBreak, SimpleDocTemplate  # type: ignore
+from reportlab.platypus.doctemplate import LayoutError  # type: ignore
+from reportlab.rl_config import _FUZZ  # type: ignore
+
+from pyxml2pdf.core.batch import _init_worker
+from pyxml2pdf.tables.tables import SubtableFlowable
+
+__all__ = ["ParallelDocTemplate"]
+
+#: The rows to draw for each part of a subtable on each page of a range of pages.
+Pages = List[List[List[Any]]]
+
+
+class _FragmentDocTemplate(SimpleDocTemplate):
+    """A document of a range of pages numbered as in the whole document
+
+    :param first_page: the number of pages preceding the range
+    """
+
+    def __init__(self, filename, first_page: int, **kw):
+        super().__init__(filename, **kw)
+        self._first_page = first_page
+
+    def beforeDocument(self):
+        if self._first_page:
+            # Continue the numbering and the page templates of the preceding pages.
+            self.page = self._first_page
+            self.canv._pageNumber = self._first_page + 1
+            self.pageTemplate = self.pageTemplates[1]
+
+
+def _render_pages(
+    pages: Pages, first_page: int, page_settings: Dict[str, Any]
+) -> bytes:
+    """Draw a range of laid out pages into a PDF fragment
+
+    :param Pages pages: the rows of each part of a subtable on each page
+    :param int first_page: the number of pages preceding the range
+    :param Dict[str, Any] page_settings: the settings of the whole document
+    :returns: the PDF fragment
+    :rtype: bytes
+    """
+    story = []  # type: List[Any]
+    for page in pages:
+        if story:
+            story.append(PageBreak())
+        story.extend(SubtableFlowable(rows, repeat_rows=0) for rows in page)
+    fragment = io.BytesIO()
+    _FragmentDocTemplate(fragment, first_page, **page_settings).build(story)
+    return fragment.getvalue()
+
+
+class ParallelDocTemplate(SimpleDocTemplate):
+    """A document template laying out all pages at once and drawing them in parallel
+
+    The pages are laid out exactly as :py:class:`reportlab.platypus.SimpleDocTemplate`
+    would, so that the page breaks and the page numbering stay the same. Only
+    flowables of type :class:`pyxml2pdf.tables.tables.SubtableFlowable` are
+    supported, since they allow for laying out without drawing.
+
+    :param filename: the path to the resulting PDF file
+    :param Optional[int] max_workers: the number of worker processes, which defaults
+        to the number of processors of the machine. A single worker draws in this
+        process.
+    :param Optional[Iterable[int]] pages: the zero-based numbers of the only pages
+        to draw into the resulting PDF file. Defaults to all.
+    """
+
+    #: The number of ranges of pages per worker process to balance their load.
+    _RANGES_PER_WORKER = 2
+
+    _max_workers: Optional[int]
+    _page_settings: Dict[str, Any]
+    _pages: Optional[List[int]]
+    #: The number of pages of the whole document as laid out by the last build.
+    page_count: int
+    #: The zero-based numbers of the pages drawn by the last build in their order.
+    drawn_pages: List[int]
+
+    def __init__(
+        self,
+        filename,
+        max_workers: Optional[int] = None,
+        pages: Optional[Iterable[int]] = None,
+        **kw,
+    ):
+        super().__init__(filename, **kw)
+        self._max_workers = max_workers
+        self._page_settings = kw
+        self._pages = None if pages is None else sorted(set(pages))
+        self.page_count = 0
+        self.drawn_pages = []
+
+    def build(self, flowables, *args, **kwargs):
+        """Lay out all pages, draw ranges of them in parallel and concatenate those
+
+        :param flowables: all flowables of the document as for
+            :py:meth:`reportlab.platypus.SimpleDocTemplate.build`
+        :raises ValueError: if no pages or pages the document does not have are
+            selected
+        """
+        pages = self.paginate(flowables)
+        self.page_count = len(pages)
+        if self._pages is None:
+            self.drawn_pages = list(range(len(pages)))
+        elif not (self._pages and 0 <= self._pages[0] <= self._pages[-1] < len(pages)):
+            raise ValueError(
+                f"Select some of the pages 1 to {len(pages)} instead of the pages "
+                f"{', '.join(str(page + 1) for page in self._pages)}."
+            )
+        else:
+            self.drawn_pages = self._pages
+        ranges = self._split_ranges(self.drawn_pages)
+        jobs = [
+            (
+                [[part.drawn_rows for part in pages[page]] for page in page_range],
+                page_range[0],
+                self._page_settings,
+            )
+            for page_range in ranges
+        ]
+        if self._worker_count == 1 or len(jobs) <= 1:
+            fragments = [_render_pages(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self._max_workers, initializer=_init_worker
+            ) as executor:
+                fragments = list(executor.map(_render_pages, *zip(*jobs)))
+        pdf_writer = PdfFileWriter()
+        for page_range, fragment_data in zip(ranges, fragments):
+            fragment = PdfFileReader(io.BytesIO(fragment_data))
+            if fragment.getNumPages() != len(page_range):
+                raise LayoutError(
+                    f"The pages from page {page_range[0] + 1} on were not laid out as "
+                    f"planned."
+                )
+            for page in range(fragment.getNumPages()):
+                pdf_writer.addPage(fragment.getPage(page))
+        with open(self.filename, "wb") as pdf_out:
+            pdf_writer.write(pdf_out)
+
+    def _split_ranges(self, page_numbers: List[int]) -> List[range]:
+        """Split sorted page numbers into contiguous ranges to draw in one piece each
+
+        :param List[int] page_numbers: the sorted zero-based numbers of the pages
+        :returns: the ranges of consecutive pages, which are at most as long as
+            needed to give each worker process some ranges to balance their load
+        :rtype: List[range]
+        """
+        range_length = max(
+            ceil(len(page_numbers) / (self._worker_count * self._RANGES_PER_WORKER)),
+            1,
+        )
+        ranges = []  # type: List[range]
+        for page_number in page_numbers:
+            if (
+                ranges
+                and ranges[-1].stop == page_number
+                and len(ranges[-1]) < range_length
+            ):
+                ranges[-1] = range(ranges[-1].start, page_number + 1)
+            else:
+                ranges.append(range(page_number, page_number + 1))
+        return ranges
+
+    @property
+    def _worker_count(self) -> int:
+        """int: The number of worker processes drawing the pages"""
+        return self._max_workers or os.cpu_count() or 1
+
+    def paginate(self, flowables: List[SubtableFlowable]) -> List[List[Any]]:
+        """Break the flowables into pages without drawing them
+
+        The flowables are placed one below the other into the frame of each page in
+        the same way as :py:class:`reportlab.platypus.Frame` does and split, where
+        they do not fit anymore.
+
+        :param List[SubtableFlowable] flowables: all flowables of the document
+        :returns: the flowables or their parts on each page
+        :rtype: List[List[SubtableFlowable]]
+        """
+        self._calc()
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height)
+        available_width = frame._getAvailableWidth()
+        pages = [[]]  # type: List[List[Any]]
+        y = frame._y
+        story = deque(flowables)
+        while story:
+            flowable = story.popleft()
+            _, height = flowable.wrap(available_width, y - frame._y1p)
+            if y - height >= frame._y1p - _FUZZ:
+                pages[-1].append(flowable)
+                y -= height
+                continue
+            parts = flowable.split(available_width, y - frame._y1p)
+            if parts:
+                # Place the first part and try the rest on the same page.
+                pages[-1].append(parts[0])
+                y -= parts[0].wrap(available_width, y - frame._y1p)[1]
+                story.extendleft(reversed(parts[1:]))
+                continue
+            if not pages[-1]:
+                raise LayoutError(
+                    f"Flowable {flowable.identity()} too large for frame of "
+                    f"{available_width}x{frame._aH} points."
+                )
+            story.appendleft(flowable)
+            pages.append([])
+            y = frame._y
+        if not pages[-1]:
+            pages.pop()
+        return pages
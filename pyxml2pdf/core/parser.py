@@ -3,10 +3,13 @@
 __all__ = ["Parser"]
 
 import warnings
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 
-from reportlab.platypus.flowables import KeepTogether  # type: ignore
+from reportlab.platypus.flowables import Flowable, KeepTogether  # type: ignore
 
+from pyxml2pdf.core.dataset import XMLDataset
+from pyxml2pdf.core.incremental import RowCache
+from pyxml2pdf.core.records import XMLRecord
 from pyxml2pdf.core.rows import XMLRow
 from pyxml2pdf.tables.builder import TableBuilder
 
@@ -15,14 +18,122 @@ class Parser:
     """XML parser to extract all interesting information from XML input
 
     :param elements: cells to populate the Parser
+    :param Optional[RowCache] row_cache: the cache of a previous run to reuse the
+        table rows of unchanged rows and the subtables with unchanged rows from
+    :param bool merge_rows: if True, the rows of each subtable are merged into one
+        table instead of handing over each row as a table of its own
+    :param bool repeat_headers: if True, the title and column headings of each
+        subtable are repeated on every page it continues on
     """
 
-    _elements: List[KeepTogether]
+    _elements: List[Flowable]
     _table_manager: TableBuilder
+    _row_cache: Optional[RowCache]
+    _merge_rows: bool
+    _repeat_headers: bool
 
-    def __init__(self, elements: List[KeepTogether]):
+    def __init__(
+        self,
+        elements: List[Flowable],
+        row_cache: Optional[RowCache] = None,
+        merge_rows: bool = False,
+        repeat_headers: bool = False,
+    ):
         self._elements = elements
         self._table_manager = TableBuilder()
+        self._row_cache = row_cache
+        self._merge_rows = merge_rows
+        self._repeat_headers = repeat_headers
+        self._subtable_hashes = None  # type: Optional[List[List[str]]]
+
+    @staticmethod
+    def create_records(elements: Iterable) -> List[XMLRecord]:
+        """Extract the compact records of XML elements one after another
+
+        Since only the referenced tags' texts are transferred into the records, the
+        elements can be discarded right after they were handed over. This allows for
+        consuming a :class:`pyxml2pdf.core.streamer.Streamer`.
+
+        :param Iterable[xml.etree.ElementTree.Element] elements: the items from which
+            the records shall be extracted
+        :returns: the records in the order of the elements
+        :rtype: List[XMLRecord]
+        """
+        return [XMLRow.extract(element) for element in elements]
+
+    @staticmethod
+    def iterate_records(elements: Iterable) -> Iterator[XMLRecord]:
+        """Extract the compact records of XML elements lazily one after another
+
+        In contrast to :meth:`create_records` the records are not collected, so they
+        can be processed within a constant amount of memory.
+
+        :param Iterable[xml.etree.ElementTree.Element] elements: the items from which
+            the records shall be extracted
+        :returns: an iterator over the records in the order of the elements
+        :rtype: Iterator[XMLRecord]
+        """
+        return (XMLRow.extract(element) for element in elements)
+
+    @staticmethod
+    def create_dataset(elements: Iterable) -> XMLDataset:
+        """Extract the data of XML elements into one column-oriented dataset
+
+        Just like for :meth:`create_records` the elements can be discarded right after
+        they were handed over.
+
+        :param Iterable[xml.etree.ElementTree.Element] elements: the items from which
+            the data shall be extracted
+        :returns: the data of all elements in their order
+        :rtype: XMLDataset
+        """
+        return XMLRow.create_dataset(elements)
+
+    def _distribute_dataset(self, dataset: XMLDataset):
+        """Distribute all rows of a dataset with their subtables determined at once
+
+        The matching subtables and the texts of all cells are determined for all rows
+        in one go, before any table row is created. Rows not matching any subtable are
+        not built at all. With a :class:`RowCache` the table rows of all rows with
+        unchanged content are taken from the cache instead of being built.
+
+        :param XMLDataset dataset: the data of all rows
+        """
+        subtables = [
+            self._table_manager.match_subtables(criteria)
+            for criteria in dataset.criteria
+        ]
+        cell_texts = XMLRow.build_cell_texts(dataset)
+        row_cache = self._row_cache
+        if row_cache is not None:
+            row_hashes = row_cache.row_hashes(dataset)
+            self._subtable_hashes = [[] for _ in self._table_manager.tables]
+        for index, subtable_indices in enumerate(subtables):
+            if subtable_indices:
+                if row_cache is None:
+                    self._table_manager.distribute_row(
+                        XMLRow(dataset.record(index), cell_texts[index]),
+                        subtable_indices,
+                    )
+                    continue
+                row_hash = row_hashes[index]
+                table_rows = row_cache.get_rows(row_hash)
+                if table_rows is None:
+                    table_rows = self._table_manager.distribute_row(
+                        XMLRow(dataset.record(index), cell_texts[index]),
+                        subtable_indices,
+                    )
+                    row_cache.store_rows(row_hash, table_rows)
+                else:
+                    self._table_manager.distribute_table_rows(
+                        table_rows, subtable_indices
+                    )
+                for subtable_index in subtable_indices:
+                    self._subtable_hashes[subtable_index].append(row_hash)
+            else:
+                self._table_manager.warn_undistributed(
+                    dataset.identifiers[index], dataset.criteria[index]
+                )
 
     def collect_xml_data(self, events):
         """Traverse the parsed xml data and gather collected event data
@@ -30,22 +141,48 @@ class Parser:
         The collected XML data then is passed to the table_manager and all arranged
         data is return.
 
-        :param List[XMLRow] events: a list of the items from which the texts shall be
-            extracted into a nicely formatted table
-        :returns: list of all table rows containing the relevant
-            event data
-        :rtype: List[KeepTogether]
+        :param events: a list of the items from which the texts shall be extracted
+            into a nicely formatted table. Items which already are of type
+            :class:`XMLRow` are distributed as they are.
+        :type events: List[xml.etree.ElementTree.Element] or List[XMLRecord] or
+            XMLDataset
+        :returns: list of all subtables containing the relevant event data or of
+            all table rows, if the rows of the previous run are reused
+        :rtype: List[Flowable]
         """
         if events:
-            for event in events:
-                self._table_manager.distribute_row(XMLRow(event))
-            subtable_elements = self._table_manager.subtables
-            self._elements.extend(
-                [
-                    KeepTogether(subtable_element)
-                    for subtable_element in subtable_elements
-                ]
-            )
+            if isinstance(events, XMLDataset):
+                self._distribute_dataset(events)
+            else:
+                for event in events:
+                    if not isinstance(event, XMLRow):
+                        event = XMLRow(event)
+                    self._table_manager.distribute_row(event)
+            if self._merge_rows:
+                self._elements.extend(self._table_manager.merged_subtables)
+            elif self._subtable_hashes is None:
+                self._elements.extend(
+                    self._table_manager.subtable_flowables(self._repeat_headers)
+                )
+            else:
+                self._extend_cached_subtables()
             return self._elements
 
         return warnings.warn("There were no items to print.", RuntimeWarning)
+
+    def _extend_cached_subtables(self):
+        """Add all subtables reusing those whose rows did not change since last run
+
+        Only subtables which gained, lost or changed rows are assembled anew and
+        stored in the :class:`RowCache` for the next run.
+        """
+        for subtable, row_hashes in zip(
+            self._table_manager.tables, self._subtable_hashes
+        ):
+            signature = tuple(row_hashes)
+            table_rows = self._row_cache.get_subtable(subtable.title, signature)
+            if table_rows is None:
+                table_rows = subtable.rows
+                self._row_cache.store_subtable(subtable.title, signature, table_rows)
+            self._row_cache.add_signatures(subtable.title, signature, table_rows)
+            self._elements.extend([KeepTogether(row) for row in table_rows])
@@ -1,10 +1,48 @@
 """This module contains the class :class:`PostProcessor` to arrange the result pages"""
 
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from math import ceil
+from typing import Iterable, List, Optional
 
 from PyPDF2.pdf import PageObject, PdfFileReader, PdfFileWriter  # type: ignore
 
 
+def _write_single_pages(
+    pdf: PdfFileReader, page_numbers: List[int], output_paths: List[str]
+) -> int:
+    """Write pages of a PDF rotated into PDF files of their own
+
+    :param PdfFileReader pdf: the PDF to take the pages from
+    :param List[int] page_numbers: the zero-based numbers of the pages to write
+    :param List[str] output_paths: the paths to the files for each of the pages
+    :returns: the number of pages written
+    :rtype: int
+    """
+    for page_number, output_path in zip(page_numbers, output_paths):
+        pdf_writer: PdfFileWriter = PdfFileWriter()
+        page: PageObject = pdf.getPage(page_number)
+        page.rotateCounterClockwise(90)
+        pdf_writer.addPage(page)
+        with open(output_path, "wb") as pdf_out:
+            pdf_writer.write(pdf_out)
+    return len(page_numbers)
+
+
+def _split_pages(path: str, page_numbers: List[int], output_paths: List[str]) -> int:
+    """Read a PDF file once and write some of its pages into files of their own
+
+    :param str path: the path to the PDF file
+    :param List[int] page_numbers: the zero-based numbers of the pages to write
+    :param List[str] output_paths: the paths to the files for each of the pages
+    :returns: the number of pages written
+    :rtype: int
+    """
+    return _write_single_pages(PdfFileReader(path), page_numbers, output_paths)
+
+
 class PostProcessor:
     """Arrange for needed modifications of the result to prepare for printing
 
@@ -12,50 +50,153 @@ class PostProcessor:
     multipage PDF file to automate splitting and rotating.
 
     :param str path:  path to the PDF file which shall be processed
+    :param Optional[int] max_workers: the maximum number of worker processes to
+        write the single pages, which defaults to the number of processors of the
+        machine
     """
 
+    #: The minimum number of pages for each worker process to be worth starting it.
+    _MIN_PAGES_PER_WORKER = 64
+
     _full_output_path_: str
     _output_directory_name: str
     _output_base_filename: str
+    _max_workers: Optional[int]
 
-    def __init__(self, path):
+    def __init__(self, path, max_workers: Optional[int] = None):
         self._full_output_path_ = path
         self._output_directory_name = os.path.dirname(path)
         self._output_base_filename = os.path.splitext(os.path.basename(path))[0]
+        self._max_workers = max_workers
+
+    def page_path(self, page_number: int, page_count: int) -> str:
+        """Return the path to the file of a single page
 
-    def finalize_print_preparation(self):
+        The pages are numbered with as many digits as needed for the number of
+        pages, but with at least two digits.
+
+        :param int page_number: the zero-based number of the page
+        :param int page_count: the number of pages of the whole PDF
+        :returns: the path to the file of the page
+        :rtype: str
+        """
+        digits = max(len(str(page_count)), 2)
+        return os.path.join(
+            self._output_directory_name,
+            f"{self._output_base_filename}_page_{str(page_number + 1).zfill(digits)}"
+            f".pdf",
+        )
+
+    def finalize_print_preparation(self, pages: Optional[Iterable[int]] = None):
         """Take the resulting multi page PDF and split into rotated single pages
 
         Taken from `pythonlibrary.org
         <https://www.blog.pythonlibrary.org/2018/04/11/splitting-and-merging-pdfs
         -with-python/>`_ in combination with `johndcook.com
         <https://www.johndcook.com/blog/2015/05/01/rotating-pdf-pages-with-python/>`_
+
+        The PDF is read only once by each process involved. Many pages are written
+        by several worker processes concurrently, each taking a contiguous range
+        of the pages.
+
+        :param Optional[Iterable[int]] pages: the zero-based numbers of the pages to
+            store, if only these changed since the previous run. Defaults to all.
+            All pages are stored anyway, if the names of the files changed because
+            the number of pages gained a digit.
         """
 
         pdf: PdfFileReader = PdfFileReader(self._full_output_path_)
-        for page_number in range(pdf.getNumPages()):
-            pdf_writer: PdfFileWriter = PdfFileWriter()
-            page: PageObject = pdf.getPage(page_number)
-            page.rotateCounterClockwise(90)
-            pdf_writer.addPage(page)
-            output_filename: str = (
-                f"{self._output_base_filename}_page_"
-                f"{str(page_number + 1).zfill(2)}.pdf"
-            )
-
-            with open(
-                os.path.join(self._output_directory_name, output_filename), "wb"
-            ) as pdf_out:
-                pdf_writer.write(pdf_out)
+        page_count = pdf.getNumPages()
+        if pages is None or not os.path.exists(self.page_path(0, page_count)):
+            pages = range(page_count)
+        page_numbers = list(pages)
+        self._write_pages(
+            self._full_output_path_,
+            pdf,
+            page_numbers,
+            [self.page_path(page_number, page_count) for page_number in page_numbers],
+        )
+
+    def store_pages(self, path: str, page_numbers: List[int], page_count: int):
+        """Split a PDF of only some pages of a document into rotated single pages
+
+        The single pages are named after their numbers in the whole document, so
+        that they replace the ones of a previous run with all pages, while the PDF
+        file to process is left as it is.
+
+        :param str path: the path to the PDF file consisting of only the pages
+        :param List[int] page_numbers: the zero-based numbers in the whole document
+            of the pages the PDF consists of in their order
+        :param int page_count: the number of pages of the whole document
+        """
+        self._write_pages(
+            path,
+            PdfFileReader(path),
+            list(range(len(page_numbers))),
+            [self.page_path(page_number, page_count) for page_number in page_numbers],
+            combined=False,
+        )
 
+    def _write_pages(
+        self,
+        path: str,
+        pdf: PdfFileReader,
+        page_numbers: List[int],
+        output_paths: List[str],
+        combined: bool = True,
+    ):
+        """Write pages of the PDF rotated into files of their own and report on it
+
+        :param str path: the path to the PDF file to process
+        :param PdfFileReader pdf: the PDF read from the file to process
+        :param List[int] page_numbers: the zero-based numbers of the pages in the PDF
+        :param List[str] output_paths: the paths to the files for each of the pages
+        :param bool combined: if False, the PDF file to process is not the one to
+            report. Defaults to True.
+        """
+        start = time.perf_counter()
+        worker_count = min(
+            self._max_workers or os.cpu_count() or 1,
+            len(page_numbers) // self._MIN_PAGES_PER_WORKER,
+        )
+        if worker_count <= 1:
+            _write_single_pages(pdf, page_numbers, output_paths)
+        else:
+            range_length = ceil(len(page_numbers) / worker_count)
+            starts = range(0, len(page_numbers), range_length)
+            with ProcessPoolExecutor(max_workers=worker_count) as executor:
+                list(
+                    executor.map(
+                        _split_pages,
+                        repeat(path),
+                        [page_numbers[i : i + range_length] for i in starts],
+                        [output_paths[i : i + range_length] for i in starts],
+                    )
+                )
+        self.report(len(page_numbers), time.perf_counter() - start, combined)
+
+    def report(self, page_count: int, duration: float, combined: bool = True):
+        """Print how fast the single pages were written and where to find the PDF
+
+        :param int page_count: the number of single pages written
+        :param float duration: the time it took to write them in seconds
+        :param bool combined: if False, the combined PDF file was not written and
+            only the directory of the single pages is printed. Defaults to True.
+        """
         path_to_pdf = (
             os.path.dirname(os.path.realpath(__file__))[
                 : os.path.dirname(os.path.realpath(__file__)).rfind("pyxml2pdf")
             ]
             + self._full_output_path_
         )
+        location = (
+            f"You can find them concatenated at file://{path_to_pdf}"
+            if combined
+            else f"You can find them at file://{os.path.dirname(path_to_pdf)}"
+        )
         print(
-            f"Create {pdf.getNumPages()} single paged PDFs.\n\n"
-            f"You can find them concatenated at file://"
-            f"{path_to_pdf}"
+            f"Create {page_count} single paged PDFs in {duration:.2f} s "
+            f"({page_count / duration if duration else 0:.0f} pages per "
+            f"second).\n\n"
+            f"{location}"
         )
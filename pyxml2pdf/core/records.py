@@ -0,0 +1,109 @@
+"""This module contains the class :class:`XMLRecord` for compact XML extracted data"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+from input.properties_template import (  # type: ignore
+    identifier_xmltag,
+    subtables_xmltag,
+)
+
+__all__ = ["XMLRecord"]
+
+
+class XMLRecord:
+    """A compact representation of one row's XML element
+
+    Instead of keeping the complete :py:class:`xml.etree.ElementTree.Element` with
+    all its children alive, only the texts of the tags which are actually referenced
+    are stored together with the criteria and the identifier derived from them. This
+    reduces the memory footprint per row to a small dictionary and allows to discard
+    the underlying XML element right after the record was created.
+
+    :param str tag: the tag of the element the record was created from
+    :param Dict[str, str] attrib: the attributes of the element
+    :param Dict[str, str] texts: the non-empty texts of the referenced tags
+    """
+
+    __slots__ = ("_tag", "_attrib", "_texts", "_criteria", "_identifier")
+
+    _tag: str
+    _attrib: Dict[str, str]
+    _texts: Dict[str, str]
+    _criteria: Set[str]
+    _identifier: str
+
+    def __init__(self, tag: str, attrib: Dict[str, str], texts: Dict[str, str]):
+        self._tag = tag
+        self._attrib = attrib
+        self._texts = texts
+        self._criteria = set(self.concatenate([subtables_xmltag]).split(", "))
+        self._identifier = self.concatenate(identifier_xmltag)
+
+    @classmethod
+    def from_element(cls, element, tags: Iterable[str]) -> "XMLRecord":
+        """Extract a record from an XML element
+
+        The texts are collected in one single pass over the element's children
+        instead of searching the children once for every tag. Just like
+        :py:meth:`xml.etree.ElementTree.Element.findtext` only the first occurrence
+        of each tag is taken into account.
+
+        :param xml.etree.ElementTree.Element element: the element to extract from
+        :param Iterable[str] tags: all tags whose texts are needed later on
+        :returns: the compact record of the element
+        :rtype: XMLRecord
+        """
+        if not isinstance(tags, (set, frozenset)):
+            tags = frozenset(tags)
+        found = {}  # type: Dict[str, Optional[str]]
+        for child in element:
+            tag = child.tag
+            if tag in tags and tag not in found:
+                found[tag] = child.text
+        texts = {tag: text for tag, text in found.items() if text}
+        return cls(element.tag, dict(element.attrib), texts)
+
+    def findtext(self, tag: str, default: Optional[str] = None) -> Optional[str]:
+        """Return the text of the first subtag with the given name
+
+        This mimics :py:meth:`xml.etree.ElementTree.Element.findtext` for the
+        referenced tags, so a record can be sorted and inspected like an element.
+        Since only non-empty texts are stored, empty tags result in `default`.
+
+        :param str tag: the tag to look up
+        :param Optional[str] default: the value to return for missing tags
+        :returns: the tag's text or `default`
+        :rtype: Optional[str]
+        """
+        return self._texts.get(tag, default)
+
+    def concatenate(self, tags: List[str], separator: str = " - ") -> str:
+        """Form one string from the texts of a set of XML tags
+
+        :param List[str] tags: list of all tags for which the texts are wanted
+        :param str separator: the separator in between the concatenated texts
+        :returns: concatenated, separated texts of all non-empty tags
+        :rtype: str
+        """
+        texts = [self._texts.get(tag) for tag in tags]
+        return separator.join([text for text in texts if text])
+
+    @property
+    def tag(self) -> str:
+        """str: The tag of the element the record was created from"""
+        return self._tag
+
+    @property
+    def attrib(self) -> Dict[str, str]:
+        """Dict[str, str]: The attributes of the element the record was created from"""
+        return self._attrib
+
+    @property
+    def criteria(self) -> Set[str]:
+        """Set[str]: The criteria extracted from the `subtables_xmltag`'s content"""
+        return self._criteria
+
+    @property
+    def identifier(self) -> str:
+        """str: The identifier extracted from the `identifier_xmltag`'s contents"""
+        return self._identifier
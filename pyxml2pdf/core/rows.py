@@ -3,17 +3,24 @@
 Specifically it contains a class :class:`XMLCell` for unified styled cells and
 a class :class:`XMLRow` for xml extracted data.
 """
-from typing import cast, List, Set, Type
+
+from typing import FrozenSet, Iterable, List, Optional, Set, Tuple, Type
 
 import defusedxml  # type: ignore
 from reportlab.lib.styles import StyleSheet1  # type: ignore
 from reportlab.platypus import Paragraph, Table  # type: ignore
+from reportlab.rl_config import _FUZZ  # type: ignore
 
 from input.properties_template import (  # type: ignore
     columns,
     identifier_xmltag,
+    sort_xmltag,
     subtables_xmltag,
 )
+from pyxml2pdf.core.dataset import XMLDataset
+from pyxml2pdf.core.fragments import FragmentCache
+from pyxml2pdf.core.measurements import MeasurementCache
+from pyxml2pdf.core.records import XMLRecord
 from pyxml2pdf.styles.table_styles import XMLTableStyle
 from pyxml2pdf.tables.builder import TableBuilder
 
@@ -33,13 +40,91 @@ class XMLCell(Paragraph):
     :py:class:`reportlab.platypus.Paragraph` is solely used with one
     certain style, which is supposed to be set as a class attribute during runtime.
 
+    The markup of the text is only parsed, when the cell is laid out or drawn for
+    the first time. Thus cells of rows, which are never drawn, e.g. because they do
+    not fit into any subtable, only hold their text and style.
+
     :param str text: the text to write into row
     """
 
     _style: StyleSheet1
 
+    #: The fragments of all texts parsed during this run shared by all cells.
+    fragment_cache: FragmentCache = FragmentCache()
+
+    #: The measurements of all texts wrapped during this run shared by all cells.
+    measurement_cache: MeasurementCache = MeasurementCache()
+
+    #: The attributes :py:meth:`reportlab.platypus.Paragraph.wrap` sets.
+    _wrap_attributes: Tuple[str, ...] = (
+        "width",
+        "height",
+        "blPara",
+        "_wrapWidths",
+        "_width_max",
+        "_splitLongWordCount",
+        "_hyphenations",
+    )
+
+    #: The attributes which are only available after the markup was parsed.
+    _parsed_attributes: FrozenSet[str] = frozenset(["frags", "bulletText", "debug"])
+
     def __init__(self, text: str):
-        super().__init__(text, self.style)
+        # Only store what :py:meth:`reportlab.platypus.Paragraph.__init__` would
+        # store before parsing the markup and defer the parsing itself.
+        self.caseSensitive = 1
+        self.encoding = "utf8"
+        self.text = text
+        self.style = self.style
+
+    def __getattr__(self, name: str):
+        # Only called for attributes which are not yet set, so that the markup is
+        # parsed on the first access to the results of parsing.
+        if name in self._parsed_attributes:
+            self._parse()
+            return self.__dict__[name]
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+        )
+
+    def _parse(self):
+        """Parse the markup of the cell's text like a usual Paragraph does
+
+        Texts, which were already parsed with the same style for another cell, reuse
+        the fragments from :attr:`fragment_cache`.
+        """
+        super().__init__(
+            self.text,
+            self.style,
+            frags=self.fragment_cache.parse(self.text, self.style),
+        )
+
+    def wrap(self, availWidth: float, availHeight: float) -> Tuple[float, float]:
+        """Break the cell's text into lines fitting into the available width
+
+        Texts, which were already wrapped in the same style to the same width for
+        this or another cell, reuse the measurement from :attr:`measurement_cache`
+        instead of breaking the lines again.
+
+        :param float availWidth: the available width
+        :param float availHeight: the available height, which is not considered
+        :returns: the width and height of the cell's content
+        :rtype: Tuple[float, float]
+        """
+        if availWidth < _FUZZ:
+            return super().wrap(availWidth, availHeight)
+        measurement = self.measurement_cache.get(self.text, self.style, availWidth)
+        if measurement is None:
+            super().wrap(availWidth, availHeight)
+            measurement = {
+                name: self.__dict__[name]
+                for name in self._wrap_attributes
+                if name in self.__dict__
+            }
+            self.measurement_cache.store(self.text, self.style, availWidth, measurement)
+        else:
+            self.__dict__.update(measurement)
+        return self.width, self.height
 
     @property
     def style(self) -> StyleSheet1:
@@ -50,43 +135,134 @@ class XMLCell(Paragraph):
     def style(self, value: StyleSheet1):
         self._style = value
 
+    def __setstate__(self, state: dict):
+        # Restore the style of cells from a cache, even if it was not yet set
+        # as a class attribute in the current process.
+        self.__dict__.update(state)
+        self.style = state["style"]
+
 
 class XMLRow(Element):
     """A wrapper class for :py:class:`xml.etree.ElementTree.Element`
 
     :py:class:`xml.etree.ElementTree.Element` is augmented with the table row
     representation and the attributes and methods to manipulate everything
-    according to the final tables needs. A :py:class:`XMLRow` can only be initialized
-    with an object of type :py:class:`xml.etree.ElementTree.Element`.
-
-    :param xml.etree.ElementTree.Element element: the element to build the instance from
+    according to the final tables needs. A :py:class:`XMLRow` can be initialized
+    with an object of type :py:class:`xml.etree.ElementTree.Element` or with an
+    :class:`pyxml2pdf.core.records.XMLRecord` extracted via :meth:`extract`. In both
+    cases the row does not copy the element's children but only keeps the compact
+    record of the referenced tags' texts.
+
+    :param element: the element or record to build the instance from
+    :type element: xml.etree.ElementTree.Element or XMLRecord
+    :param Optional[List[str]] cell_texts: the texts of all cells of the full row, if
+        they were already built for many rows at once via :meth:`build_cell_texts`
     """
 
-    _table_builder: TableBuilder = TableBuilder()
-    _table_style: XMLTableStyle = XMLTableStyle()
+    #: Shared by all rows, but only created along with the first row.
+    _table_builder: TableBuilder
+    _table_style: XMLTableStyle
+
+    #: All tags whose texts are needed to build the row.
+    _referenced_tags: FrozenSet[str] = frozenset(
+        [tag for column in columns for tag in column.tag]
+        + identifier_xmltag
+        + [subtables_xmltag]
+        + ([sort_xmltag] if isinstance(sort_xmltag, str) else list(sort_xmltag))
+    )
 
+    _record: XMLRecord
     _criteria: Set[str]
     _identifier: str
+    _cell_texts: List[str]
     _cell_styler: Type[XMLCell] = XMLCell
 
-    def __init__(self, element):
-        # Call Element constructor and extend ourselves by extending all children
-        # tags to create an underlying copy of element.
+    def __init__(self, element, cell_texts: Optional[List[str]] = None):
+        # Extract the referenced tags' texts into a compact record instead of copying
+        # all children of element, unless that happened already.
+        if not isinstance(element, XMLRecord):
+            element = self.extract(element)
         super().__init__(element.tag, element.attrib)
-        self.extend(list(element))
+        self._record = element
         # Initialize needed objects especially for table creation.
+        self._init_table_styling()
         self._cell_styler.style = self._table_style.custom_styles["stylesheet"][
             "Normal"
         ]
         # Initialize definitely needed instance variables.
-        self._criteria = self._init_criteria()
-        self._identifier = self._concatenate_tags_content(identifier_xmltag)
+        self._criteria = element.criteria
+        self._identifier = element.identifier
+        if cell_texts is None:
+            cell_texts = self._build_cell_texts()
+        self._cell_texts = cell_texts
         self._mandatory_columns = self._init_full_row()
 
-    def _init_criteria(self):
-        """Initialize the list of criteria from the according xml tag's content"""
-        criteria: str = self._concatenate_tags_content([subtables_xmltag])
-        return set(criteria.split(", "))
+    @staticmethod
+    def _init_table_styling():
+        """Create the styling and the builder shared by all table rows if necessary
+
+        This happens only when the first row is created instead of when this module
+        is imported, so that e.g. the fonts are not loaded before they are needed.
+        """
+        if "_table_builder" not in XMLRow.__dict__:
+            XMLRow._table_style = XMLTableStyle.shared()
+            XMLRow._table_builder = TableBuilder()
+
+    @classmethod
+    def extract(cls, element) -> XMLRecord:
+        """Extract the compact record of all tags this kind of row references
+
+        :param xml.etree.ElementTree.Element element: the element to extract from
+        :returns: the record to build the row from later on
+        :rtype: XMLRecord
+        """
+        return XMLRecord.from_element(element, cls._referenced_tags)
+
+    @classmethod
+    def create_dataset(cls, elements: Iterable) -> XMLDataset:
+        """Extract the data of all tags this kind of row references into a dataset
+
+        :param Iterable[xml.etree.ElementTree.Element] elements: the elements to
+            extract from, which can be discarded right after they were handed over
+        :returns: the column-oriented data of all elements in the given order
+        :rtype: XMLDataset
+        """
+        return XMLDataset.from_records(
+            (cls.extract(element) for element in elements), cls._referenced_tags
+        )
+
+    @classmethod
+    def build_cell_texts(cls, dataset: XMLDataset) -> List[List[str]]:
+        """Build the texts of all cells of the full rows for all rows at once
+
+        This is the column-wise counterpart of :meth:`_build_cell_texts`.
+
+        :param XMLDataset dataset: the data of all rows
+        :returns: one list of cell texts per row
+        :rtype: List[List[str]]
+        """
+        return [
+            list(cell_texts)
+            for cell_texts in zip(
+                *[dataset.concatenate(column.tag) for column in columns]
+            )
+        ]
+
+    def findtext(
+        self, path: str, default: Optional[str] = None, namespaces=None
+    ) -> Optional[str]:
+        """Return the text of the first subtag with the given name
+
+        Since the children are not copied, the lookup is answered by the underlying
+        record. Only the referenced tags are available.
+
+        :param str path: the tag to look up
+        :param Optional[str] default: the value to return for missing or empty tags
+        :param namespaces: ignored and only present for compatibility
+        :returns: the tag's text or `default`
+        :rtype: Optional[str]
+        """
+        return self._record.findtext(path, default)
 
     def _concatenate_tags_content(
         self, cell_tags: List[str], separator: str = " - "
@@ -105,23 +281,28 @@ class XMLRow(Element):
         :param separator: the separator in between the concatenated texts
         :returns: concatenated, separated texts of all tags for the current cell
         """
-        return separator.join(
-            [cast(str, self.findtext(tag)) for tag in cell_tags if self.findtext(tag)]
-        )
+        return self._record.concatenate(cell_tags, separator)
+
+    def _build_cell_texts(self) -> List[str]:
+        """Build the texts of all cells of the full row
+
+        Extract interesting information from specified row tag's subtags for each of
+        the columns.
+
+        :return: the texts of all cells
+        :rtype: List[str]
+        """
+        return [self._concatenate_tags_content(column.tag) for column in columns]
 
     def _init_full_row(self) -> List[XMLCell]:
         """Initialize the single table row containing all information from the XML input
 
-        Extract interesting information from specified row tag's subtags and
-        connect them into a nicely formatted row of a table.
+        Connect the cell texts into a nicely formatted row of a table.
 
         :return: the columns of any table representation
         :rtype: List[XMLCell]
         """
-        table_columns = [
-            self._cell_styler(self._concatenate_tags_content(column.tag))
-            for column in columns
-        ]
+        table_columns = [self._cell_styler(text) for text in self._cell_texts]
         self._full_row = self._table_builder.create_fixedwidth_table([table_columns])
         return table_columns
 
@@ -0,0 +1,200 @@
+"""This module contains the class :class:`SinglePageDocTemplate` to write single pages
+
+Splitting the resulting PDF into rotated single pages with
+:class:`pyxml2pdf.core.post_processor.PostProcessor` reads and parses the whole PDF
+again after writing it. The :class:`SinglePageDocTemplate` instead draws each page
+onto a canvas of its own as well, which is saved as the rotated single page right
+away.
+"""
+
+import os
+import time
+from typing import Optional
+
+from reportlab.pdfgen import canvas  # type: ignore
+from reportlab.platypus import (  # type: ignore
+    BaseDocTemplate,
+    Frame,
+    PageTemplate,
+    SimpleDocTemplate,
+)
+from reportlab.platypus.doctemplate import _doNothing  # type: ignore
+
+from pyxml2pdf.core.post_processor import PostProcessor
+
+__all__ = ["SinglePageDocTemplate"]
+
+
+class _MirroringFrame(Frame):
+    """A frame drawing each flowable onto a second canvas at the same position
+
+    All arguments are passed on to :py:class:`reportlab.platypus.Frame`.
+    """
+
+    #: The second canvas to draw onto or None to only draw onto the document's one.
+    mirror: Optional[canvas.Canvas]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.mirror = None
+
+    def add(self, flowable, canv, trySplit=0):
+        mirror = self.mirror
+        if mirror is None:
+            return super().add(flowable, canv, trySplit)
+        draw_on = flowable.drawOn
+
+        def draw_on_both(canv, x, y, _sW=0):
+            draw_on(canv, x, y, _sW=_sW)
+            draw_on(mirror, x, y, _sW=_sW)
+
+        # The frame determines the position while adding, so the flowable is drawn
+        # onto both canvases right there.
+        flowable.drawOn = draw_on_both
+        try:
+            return super().add(flowable, canv, trySplit)
+        finally:
+            del flowable.drawOn
+
+
+class SinglePageDocTemplate(SimpleDocTemplate):
+    """A document template writing each page rotated into a PDF file of its own
+
+    The single pages are named and rotated just like the ones split off the
+    combined PDF by :class:`pyxml2pdf.core.post_processor.PostProcessor`. Each page
+    is drawn onto the canvas of the combined PDF and onto a canvas of its own at
+    once, so that each single page is a document of its own embedding the subsets of
+    its fonts by itself. Without the combined PDF, only the single pages are drawn
+    and each is released as soon as it is written, so that the memory consumption
+    does not grow with the number of pages.
+
+    :param filename: the path to the combined PDF file, next to which the single
+        pages are stored
+    :param bool combined: If True, the pages are drawn unrotated into the combined
+        PDF file as well. Defaults to True.
+    """
+
+    #: The rotation of the single pages, which turns them counterclockwise.
+    _ROTATION = -90
+
+    _combined: bool
+    _post_processor: PostProcessor
+    _page_count: int
+    _frame: Optional[_MirroringFrame]
+    _page_canvas: Optional[canvas.Canvas]
+
+    def __init__(self, filename, combined: bool = True, **kw):
+        # Without the combined PDF the single pages are the document's only pages.
+        super().__init__(filename, rotation=0 if combined else self._ROTATION, **kw)
+        self._combined = combined
+        self._post_processor = PostProcessor(filename)
+        self._page_count = 0
+        self._frame = None
+        self._page_canvas = None
+
+    def build(
+        self,
+        flowables,
+        onFirstPage=_doNothing,
+        onLaterPages=_doNothing,
+        canvasmaker=canvas.Canvas,
+    ):
+        """Build the document and write its single pages and the combined PDF
+
+        :param flowables: all flowables of the document as for
+            :py:meth:`reportlab.platypus.SimpleDocTemplate.build`
+        :param onFirstPage: the function drawing onto the first page
+        :param onLaterPages: the function drawing onto all further pages
+        :param canvasmaker: the class of the canvases
+        """
+        start = time.perf_counter()
+        self._page_count = 0
+        # The canvas of the whole document only keeps track of the build, if the
+        # combined PDF is not requested.
+        self._doSave = int(self._combined)
+        self._calc()
+        self._frame = _MirroringFrame(
+            self.leftMargin, self.bottomMargin, self.width, self.height, id="normal"
+        )
+        self.addPageTemplates(
+            [
+                PageTemplate(
+                    id="First",
+                    frames=self._frame,
+                    onPage=self._on_both_canvases(onFirstPage),
+                    pagesize=self.pagesize,
+                ),
+                PageTemplate(
+                    id="Later",
+                    frames=self._frame,
+                    onPage=self._on_both_canvases(onLaterPages),
+                    pagesize=self.pagesize,
+                ),
+            ]
+        )
+        BaseDocTemplate.build(self, flowables, canvasmaker=canvasmaker)
+        self._name_pages()
+        self._post_processor.report(
+            self._page_count, time.perf_counter() - start, self._combined
+        )
+
+    def _on_both_canvases(self, on_page):
+        """Extend a function drawing onto a page to draw onto the single page as well
+
+        :param on_page: the function drawing onto a page
+        :returns: the function drawing onto the page of the combined PDF and the
+            single page
+        """
+        if on_page is _doNothing:
+            return on_page
+
+        def on_both_canvases(canv, doc):
+            on_page(canv, doc)
+            if self._page_canvas is not canv:
+                on_page(self._page_canvas, doc)
+
+        return on_both_canvases
+
+    def _startBuild(self, filename=None, canvasmaker=canvas.Canvas):
+        self._canvasmaker = canvasmaker
+        super()._startBuild(filename, canvasmaker)
+
+    def handle_pageBegin(self):
+        """Draw the page onto a new canvas numbered as in the whole document"""
+        # Making a canvas starts a new sequencer, which belongs to the whole build.
+        sequencer = self.seq
+        page_canvas = self._makeCanvas(
+            filename=self._post_processor.page_path(self.page, 0),
+            canvasmaker=self._canvasmaker,
+        )
+        self.seq = sequencer
+        page_canvas._pageNumber = self.page + 1
+        page_canvas._doctemplate = self
+        self._page_canvas = page_canvas
+        if self._combined:
+            self._frame.mirror = page_canvas
+        else:
+            self.canv = page_canvas
+        super().handle_pageBegin()
+
+    def handle_pageEnd(self):
+        """Show the page and store it as a single page"""
+        super().handle_pageEnd()
+        if self._combined:
+            self._page_canvas.setPageRotation(self._ROTATION)
+            self._page_canvas.showPage()
+        with open(self._post_processor.page_path(self.page - 1, 0), "wb") as pdf_out:
+            pdf_out.write(self._page_canvas.getpdfdata())
+        self._frame.mirror = self._page_canvas = None
+        self._page_count += 1
+
+    def _name_pages(self):
+        """Rename the single pages, if their number needs more than two digits"""
+        if self._post_processor.page_path(0, self._page_count) != (
+            self._post_processor.page_path(0, 0)
+        ):
+            for page_number in range(self._page_count):
+                os.replace(
+                    self._post_processor.page_path(page_number, 0),
+                    self._post_processor.page_path(page_number, self._page_count),
+                )
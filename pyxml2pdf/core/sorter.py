@@ -1,6 +1,108 @@
 """This module contains the class :class:`Sorter` to sort the resulting table."""
 
-from datetime import datetime
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from pyxml2pdf.core.dataset import XMLDataset
+
+#: The format of the dates in the XML input, if they are not given in ISO 8601.
+DATE_FORMAT = "%d.%m.%Y %H:%M"
+#: The date assumed for rows without any date, which places them at the very end.
+FALLBACK_DATE = datetime(2099, 1, 1)
+
+SortKey = Tuple[Any, ...]
+
+#: The ISO 8601 dates as understood by :py:meth:`datetime.datetime.fromisoformat`.
+_ISO_DATE = re.compile(
+    r"(\d{4}-\d{2}-\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?)?"
+    r"(?:([+-])(\d{2}):(\d{2}))?"
+)
+
+
+def _from_iso_format(text: str) -> datetime:
+    """Parse an ISO 8601 date for Python versions prior to 3.7
+
+    :py:meth:`datetime.datetime.fromisoformat` was only introduced with Python 3.7.
+
+    :param str text: the date like `2019-12-01T10:00:00+00:00`
+    :returns: the date, which is timezone aware, if the text contains an offset
+    :rtype: datetime
+    :raises ValueError: if the text is not an ISO 8601 date
+    """
+    match = _ISO_DATE.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Invalid isoformat string: '{text}'")
+    day, hour, minute, second, fraction, sign, offset_hours, offset_minutes = (
+        match.groups()
+    )
+    date = datetime.strptime(day, "%Y-%m-%d").replace(
+        hour=int(hour or 0),
+        minute=int(minute or 0),
+        second=int(second or 0),
+        microsecond=int((fraction or "").ljust(6, "0")),
+    )
+    if sign:
+        offset = timedelta(hours=int(offset_hours), minutes=int(offset_minutes))
+        date = date.replace(tzinfo=timezone(-offset if sign == "-" else offset))
+    return date
+
+
+#: The parser of ISO 8601 dates, which is built into Python from version 3.7 on.
+_fromisoformat = getattr(datetime, "fromisoformat", _from_iso_format)
+
+
+def _create_date_parser(
+    max_cached: Optional[int] = None,
+) -> Callable[[Optional[str]], SortKey]:
+    """Create a function to turn the text of a date tag into a sortable key
+
+    The texts are expected to contain a date, either in ISO 8601 format like
+    `2019-12-01T10:00:00Z` or in the format `01.12.2019 10:00`. Missing dates result in
+    :data:`FALLBACK_DATE` and texts, which cannot be interpreted as a date, are sorted
+    by their text after all dates. ISO 8601 dates with an offset are compared by their
+    time in UTC. Every distinct text is parsed only once, unless the number of
+    parsed texts to keep is limited. Then the least recently used ones are
+    discarded and parsed again when needed.
+
+    :param Optional[int] max_cached: the maximum number of parsed texts to keep,
+        which defaults to keeping all
+    :returns: the function to compute the key of one date text
+    :rtype: Callable[[Optional[str]], Tuple]
+    """
+
+    def parse_date(text):
+        if not text:
+            return (0, FALLBACK_DATE)
+        # Try to provide a reasonable sortable date.
+        try:
+            if text[4:5] == "-":
+                # ISO 8601 is parsed much faster than by strptime.
+                date = _fromisoformat(text.replace("Z", "+00:00"))
+                if date.tzinfo is not None:
+                    # Compare dates with different offsets by their time in UTC.
+                    date = date.astimezone(timezone.utc).replace(tzinfo=None)
+                parsed = (0, date)
+            else:
+                parsed = (0, datetime.strptime(text, DATE_FORMAT))
+        except ValueError:
+            # If that did not work sort by the text itself after all dates.
+            parsed = (1, text)
+        return parsed
+
+    if max_cached is not None:
+        return lru_cache(maxsize=max_cached)(parse_date)
+    parsed_dates = {}  # type: Dict[Optional[str], SortKey]
+
+    def get_date(text):
+        try:
+            return parsed_dates[text]
+        except KeyError:
+            parsed = parsed_dates[text] = parse_date(text)
+            return parsed
+
+    return get_date
 
 
 class Sorter:
@@ -9,9 +111,11 @@ class Sorter:
     We took `effbot.org <http://effbot.org/zone/element-sort.htm>`_ and adapted the
     code to our needs of sorting a list of :py:class:`xml.etree.ElementTree.Element`
     by the texts of one of their tags containing a string representation of a date.
+    Ties can be broken by the texts of any number of further tags.
 
-    :param List[xml.etree.ElementTree.Element] courses: rows that where extracted
-        from an xml source
+    :param courses: rows that where extracted from an xml source
+    :type courses: List[xml.etree.ElementTree.Element] or List[XMLRecord] or
+        XMLDataset
     """
 
     def __init__(self, courses):
@@ -21,20 +125,90 @@ class Sorter:
         """Sort a list of :py:class:`xml.etree.ElementTree.Element` by their date
 
         Taken from `effbot.org <http://effbot.org/zone/element-sort.htm>`_ and adapted.
+        Every row is decorated with its key exactly once and each distinct date
+        string is parsed only once per sort.
 
-        :param str sort_key: the XML tag which contains the data
+        :param sort_key: the XML tag which contains the date or a list of tags,
+            where the first one contains the date and all others are used in the
+            given order to break ties
+        :type sort_key: str or List[str]
         """
+        if isinstance(self._courses, XMLDataset):
+            return self._sort_dataset(sort_key)
+        self._courses[:] = sorted(self._courses, key=self.create_key_function(sort_key))
+        return self._courses[:]
+
+    def _sort_dataset(self, sort_key: Union[str, List[str]]) -> XMLDataset:
+        """Sort a dataset by computing all sort keys at once and reordering it
+
+        The dataset's sort keys are stored in the dataset alongside.
+
+        :param sort_key: the XML tag which contains the date or a list of tags,
+            where the first one contains the date and all others are used to break ties
+        :type sort_key: str or List[str]
+        :returns: the sorted dataset
+        :rtype: XMLDataset
+        """
+        if isinstance(sort_key, str):
+            sort_key = [sort_key]
+        sort_keys = self.create_sort_keys(
+            [self._courses.column(tag) for tag in sort_key]
+        )
+        self._courses.sort_keys = sort_keys
+        self._courses.reorder(sorted(range(len(sort_keys)), key=sort_keys.__getitem__))
+        return self._courses
+
+    @staticmethod
+    def create_key_function(
+        sort_key: Union[str, List[str]],
+        max_cached_dates: Optional[int] = None,
+    ) -> Callable[[Any], SortKey]:
+        """Create the function to compute the sort key of one row
+
+        The first tag is expected to contain a date, either in ISO 8601 format like
+        `2019-12-01T10:00:00Z` or in the format `01.12.2019 10:00`. Rows without a date
+        are placed at the end and rows with a text, which cannot be interpreted as a
+        date, after those sorted by their text. The texts of all further tags are
+        compared as they are.
+
+        :param sort_key: the XML tag which contains the date or a list of tags,
+            where the first one contains the date and all others are used to break ties
+        :type sort_key: str or List[str]
+        :param Optional[int] max_cached_dates: the maximum number of parsed dates the
+            function keeps to reuse them, which defaults to keeping all
+        :returns: a function which maps a row to its sort key
+        :rtype: Callable[[xml.etree.ElementTree.Element], Tuple]
+        """
+        if isinstance(sort_key, str):
+            sort_key = [sort_key]
+        date_key, tie_breaker_keys = sort_key[0], sort_key[1:]
+        get_date = _create_date_parser(max_cached_dates)
 
         def get_key(course):
-            _key = course.findtext(sort_key)
-            # Try to provide a reasonable sortable date string.
-            try:
-                if _key:
-                    return datetime.strptime(_key, "%d.%m.%Y %H:%M")
-                return datetime.strptime("01.01.2099 00:00", "%d.%m.%Y %H:%M")
-            except ValueError:
-                # If that did not work return the key itself.
-                return _key
-
-        self._courses[:] = sorted(self._courses, key=get_key)
-        return self._courses[:]
+            key = get_date(course.findtext(date_key))
+            if tie_breaker_keys:
+                key += tuple(course.findtext(tag) or "" for tag in tie_breaker_keys)
+            return key
+
+        return get_key
+
+    @staticmethod
+    def create_sort_keys(columns: List[List[Optional[str]]]) -> List[SortKey]:
+        """Compute the sort keys of all rows at once from their sort tags' texts
+
+        This is the column-wise counterpart of :meth:`create_key_function` and
+        results in identical keys.
+
+        :param List[List[Optional[str]]] columns: the texts of the tag containing the
+            date followed by the texts of all tags to break ties, each for all rows
+        :returns: the sort keys of all rows
+        :rtype: List[Tuple]
+        """
+        get_date = _create_date_parser()
+        dates = [get_date(text) for text in columns[0]]
+        if len(columns) == 1:
+            return dates
+        return [
+            date + tuple(text or "" for text in texts)
+            for date, *texts in zip(dates, *columns[1:])
+        ]
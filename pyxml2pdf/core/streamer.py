@@ -0,0 +1,63 @@
+"""This module contains the class :class:`Streamer` to read large XML files lazily"""
+
+from typing import Iterator, Optional
+
+from pyxml2pdf.core.backends import get_backend, ParserBackend
+
+__all__ = ["Streamer"]
+
+
+class Streamer:
+    """Stream the rows of an XML file one element at a time
+
+    Instead of parsing the whole document into memory, the XML file is read
+    incrementally with the secured `iterparse` of the chosen backend. Every
+    element with the tag `rows_tag`, which is a direct child of the document's root,
+    is handed out as soon as it is complete. Right after the consumer requested the
+    next element, the previous one is cleared and detached from the root, so memory
+    consumption stays flat regardless of the size of the input.
+
+    .. note:: The yielded elements are only valid until the next one is requested.
+        Everything needed later on has to be extracted or copied in between, as it is
+        done by :meth:`pyxml2pdf.core.parser.Parser.create_records`.
+
+    :param str input_path: path to the XML file
+    :param str rows_tag: the XML tag which represents one row of the table
+    :param Optional[ParserBackend] backend: the backend to parse the XML file with,
+        which defaults to the one selected by
+        :func:`pyxml2pdf.core.backends.get_backend`
+    """
+
+    _input_path: str
+    _rows_tag: str
+    _backend: ParserBackend
+
+    def __init__(
+        self, input_path: str, rows_tag: str, backend: Optional[ParserBackend] = None
+    ):
+        self._input_path = input_path
+        self._rows_tag = rows_tag
+        self._backend = get_backend() if backend is None else backend
+
+    def __iter__(self) -> Iterator:
+        """Yield all elements with the rows' tag below the root one after another
+
+        :returns: an iterator over all row elements
+        :rtype: Iterator[xml.etree.ElementTree.Element]
+        """
+        context = self._backend.iterparse(self._input_path, ("start", "end"))
+        _, root = next(context)
+        # Keep track of the current depth to yield only the root's direct children
+        # just like :py:meth:`xml.etree.ElementTree.ElementTree.findall` does.
+        depth = 1
+        for event, element in context:
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1:
+                if element.tag == self._rows_tag:
+                    yield element
+                # Drop everything parsed so far, since it is not needed anymore.
+                element.clear()
+                root.clear()
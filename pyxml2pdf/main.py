@@ -6,12 +6,11 @@ described in the README.
 """
 
 import argparse
+import os
 import sys
-from typing import Dict
+from typing import Any, Dict, List, Optional
 
-from download import download  # type: ignore
-
-from pyxml2pdf.core.initializer import Initializer
+from pyxml2pdf.core.backends import BACKEND_NAMES
 
 
 def _add_arguments() -> Dict[str, str]:
@@ -26,7 +25,10 @@ def _add_arguments() -> Dict[str, str]:
         default="input/template.xml",
         help="The local file path to the XML file. If this file is not present, "
         "the optional input parameter '--url' needs to be provided with the URL "
-        "from which the file shall be downloaded.",
+        "from which the file shall be downloaded. If several files, directories or "
+        "glob patterns are given, all XML files are converted in parallel and the "
+        "PDF files are stored next to the path specified by '--pdf' named after "
+        "the XML files. Therefore the XML files need distinct names.",
     )
     parser.add_argument(
         "-u",
@@ -51,13 +53,145 @@ def _add_arguments() -> Dict[str, str]:
         help="The file path to store the created PDF to. Defaults to "
         "'output/kursdaten.pdf'",
     )
-    return vars(parser.parse_args())
+    parser.add_argument(
+        "-b",
+        "--backend",
+        choices=BACKEND_NAMES,
+        default="auto",
+        help="The backend to parse the XML files with. Both are equally secured "
+        "against malicious XML. Defaults to 'auto', which selects lxml if it is "
+        "installed and defusedxml otherwise.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="The number of worker processes to convert several XML files in "
+        "parallel. Defaults to the number of processors.",
+    )
+    parser.add_argument(
+        "-s",
+        "--streaming",
+        action="store_true",
+        help="Read the XML file incrementally one row at a time instead of parsing "
+        "the whole document at once. This keeps the memory consumption flat for "
+        "large inputs.",
+    )
+    # Incremental builds require the rows' hashes, which are computed while sorting
+    # in memory.
+    incremental_or_budget = parser.add_mutually_exclusive_group()
+    incremental_or_budget.add_argument(
+        "-i",
+        "--incremental",
+        action="store_true",
+        help="Reuse the table rows and subtables built in the previous run for all "
+        "unchanged rows. They are stored next to the PDF file with the extension "
+        "'.cache'. This cannot be combined with '--memory-budget'.",
+    )
+    parser.add_argument(
+        "-c",
+        "--cache",
+        action="store_true",
+        help="Store the data extracted from the XML file next to it with the "
+        "additional extension '.cache' and skip parsing the XML file in the "
+        "following runs as long as it does not change.",
+    )
+    incremental_or_budget.add_argument(
+        "-m",
+        "--memory-budget",
+        metavar="<MiB>",
+        type=_positive_int,
+        default=None,
+        help="Sort the rows out of core with at most about this many mebibytes of "
+        "sort keys in memory at once instead of keeping all extracted rows in memory "
+        "for sorting. The table rows built from them are still kept in memory until "
+        "the PDF file is built. This cannot be combined with '--incremental'. "
+        "Defaults to sorting in memory.",
+    )
+    parser.add_argument(
+        "-r",
+        "--merge-rows",
+        action="store_true",
+        help="Merge the rows of each subtable into one table, which repeats the "
+        "title and column headings on each page. This cannot be combined with "
+        "'--incremental'.",
+    )
+    parser.add_argument(
+        "-H",
+        "--repeat-headers",
+        action="store_true",
+        help="Repeat the title and column headings of each subtable on every page it "
+        "continues on, which results in more pages. This cannot be combined with "
+        "'--incremental'.",
+    )
+    parser.add_argument(
+        "-w",
+        "--render-workers",
+        metavar="<N>",
+        type=_positive_int,
+        default=None,
+        help="Lay out all pages of a single XML file at once and draw them in this "
+        "many worker processes. This cannot be combined with '--incremental' or "
+        "'--merge-rows'. Defaults to drawing the pages one after the other.",
+    )
+    parser.add_argument(
+        "-d",
+        "--direct-pages",
+        action="store_true",
+        help="Write the rotated single pages directly while building instead of "
+        "splitting the PDF file into them afterwards. This cannot be combined with "
+        "'--incremental' or '--render-workers'.",
+    )
+    parser.add_argument(
+        "-n",
+        "--no-combined",
+        action="store_true",
+        help="Do not write the combined PDF file, but only the rotated single pages. "
+        "This requires '--direct-pages'.",
+    )
+    parser.add_argument(
+        "-P",
+        "--pages",
+        metavar="<pages>",
+        type=_page_numbers,
+        default=None,
+        help="Draw only these pages of a single XML file, given as comma separated "
+        "page numbers or ranges such as '3,7-9', and split only them into single "
+        "pages. The PDF file of a previous run is left as it is. This cannot be "
+        "combined with '--incremental', '--merge-rows' or '--direct-pages'. "
+        "Defaults to all pages.",
+    )
+    args = vars(parser.parse_args())
+    single_file_options = (
+        ("render_workers", "-w/--render-workers"),
+        ("pages", "-P/--pages"),
+    )
+    if any(args[option] is not None for option, _ in single_file_options) and (
+        _batch_inputs(args["local_file"]) is not None
+    ):
+        for option, name in single_file_options:
+            if args[option] is not None:
+                parser.error(
+                    f"argument {name}: only applies to the conversion of a single "
+                    f"XML file, but several files, a directory or a glob pattern "
+                    f"were given"
+                )
+    return args
 
 
 def main():
     """This method is the workhorse of the application but expects stdin input."""
     args = _add_arguments()
     validate_inputs(args)
+    # Import the conversion only now, so that e.g. '--help' does not wait for it.
+    from download import download  # type: ignore
+
+    from pyxml2pdf.core.initializer import Initializer
+
+    inputs = _batch_inputs(args["local_file"])
+    if inputs is not None:
+        return _convert_batch(inputs, args)
     download(
         args["url"][0],
         args["local_file"][0],
@@ -65,10 +199,130 @@ def main():
         progressbar=True,
         verbose=False,
     )
-    Initializer(args["local_file"][0], args["pdf"][0])
+    Initializer(
+        args["local_file"][0],
+        args["pdf"][0],
+        streaming=args["streaming"],
+        backend=args["backend"],
+        incremental=args["incremental"],
+        cache_data=args["cache"],
+        memory_budget=_memory_budget(args),
+        merge_rows=args["merge_rows"],
+        render_workers=args["render_workers"],
+        direct_pages=args["direct_pages"],
+        combined=not args["no_combined"],
+        pages=args["pages"],
+        repeat_headers=args["repeat_headers"],
+    )
     print("\n-------------------------------DONE-------------------------------")
 
 
+def _batch_inputs(local_files: List[str]) -> Optional[List[str]]:
+    """Expand the given paths into the XML files to convert together
+
+    :param List[str] local_files: the paths to files or directories or glob patterns
+    :returns: the paths of all XML files or None, if a single file is given
+    """
+    from pyxml2pdf.core.batch import BatchConverter
+
+    inputs = BatchConverter.collect_inputs(local_files)
+    if len(inputs) != 1 or inputs[0] != local_files[0]:
+        return inputs
+    return None
+
+
+def _convert_batch(inputs: List[str], args: Dict[str, Any]) -> int:
+    """Convert several XML files in parallel and report each file's outcome
+
+    :param List[str] inputs: the paths to the XML files
+    :param Dict[str, Any] args: the parsed parameter namespace
+    :returns: the exit status, which is 1 if any of the conversions failed
+    """
+    from pyxml2pdf.core.batch import BatchConverter
+
+    jobs = BatchConverter.pair_outputs(inputs, os.path.dirname(args["pdf"][0]))
+    results = BatchConverter(
+        jobs,
+        max_workers=args["jobs"],
+        streaming=args["streaming"],
+        backend=args["backend"],
+        incremental=args["incremental"],
+        cache_data=args["cache"],
+        memory_budget=_memory_budget(args),
+        merge_rows=args["merge_rows"],
+        direct_pages=args["direct_pages"],
+        combined=not args["no_combined"],
+        repeat_headers=args["repeat_headers"],
+    ).convert()
+    for result in results:
+        if result.error is None:
+            print(f"Converted {result.input_path} to {result.output_path}")
+        else:
+            print(f"Failed to convert {result.input_path}: {result.error}")
+    failures = sum(result.error is not None for result in results)
+    print(
+        f"\n{len(results) - failures} of {len(results)} files converted successfully."
+    )
+    return int(bool(failures) or not results)
+
+
+def _page_numbers(pages: str) -> List[int]:
+    """Convert comma separated page numbers and ranges into zero-based page numbers
+
+    :param str pages: the page numbers starting at one, such as '3,7-9'
+    :returns: the zero-based page numbers, such as [2, 6, 7, 8]
+    :raises argparse.ArgumentTypeError: if the page numbers are malformed or a range
+        ends before it starts
+    """
+    page_numbers = []  # type: List[int]
+    for page_range in pages.split(","):
+        first, dash, last = page_range.partition("-")
+        try:
+            first_page = int(first)
+            last_page = int(last) if dash else first_page
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"'{pages}' are no page numbers or ranges like '3,7-9'."
+            )
+        if last_page < first_page:
+            raise argparse.ArgumentTypeError(
+                f"The range '{page_range}' ends before it starts."
+            )
+        page_numbers.extend(range(first_page - 1, last_page))
+    if not page_numbers or min(page_numbers) < 0:
+        raise argparse.ArgumentTypeError(
+            f"'{pages}' select no pages, which are numbered from 1 on."
+        )
+    return page_numbers
+
+
+def _positive_int(number: str) -> int:
+    """Convert a count or size given on the command line, which must be at least one
+
+    :param str number: the number as given on the command line
+    :returns: the number
+    :raises argparse.ArgumentTypeError: if the number is no integer of at least one
+    """
+    try:
+        value = int(number)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{number}' is no integer.")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"'{number}' is less than 1.")
+    return value
+
+
+def _memory_budget(args: Dict[str, Any]) -> Optional[int]:
+    """Convert the memory budget given in mebibytes into bytes
+
+    :param Dict[str, Any] args: the parsed parameter namespace
+    :returns: the memory budget in bytes or None, if none was given
+    """
+    if args["memory_budget"] is None:
+        return None
+    return args["memory_budget"] * 2**20
+
+
 def validate_inputs(args: Dict[str, str]):
     """Checks the provided parameters on validity
 
@@ -1,7 +1,8 @@
 """This module contains the class :class:`XMLTableStyle` to style the result"""
 
+from copy import copy
 from pathlib import PurePath
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from reportlab.lib.colors import black, Color, honeydew  # type: ignore
 from reportlab.lib.pagesizes import mm  # type: ignore
@@ -11,7 +12,7 @@ from reportlab.pdfbase.pdfmetrics import (  # type: ignore
     registerFontFamily,
 )
 from reportlab.pdfbase.ttfonts import TTFont  # type: ignore
-from reportlab.platypus import TableStyle  # type: ignore
+from reportlab.platypus import Table, TableStyle  # type: ignore
 
 from input.properties_template import columns, font, fontsize  # type: ignore
 
@@ -21,9 +22,69 @@ CellFormattingCommand = Tuple[
 ]
 
 
+class CompiledTableStyle:
+    """The result of applying a table style to tables of a certain shape
+
+    Applying a :py:class:`reportlab.platypus.TableStyle` walks all its commands and
+    sets the resulting properties cell by cell. For tables with the same number of
+    rows and columns the result is always the same, so it is computed once here and
+    handed over to all such tables by reference. Tables sharing the result must not
+    be styled any further without copying it via :meth:`unshare` first.
+
+    :param TableStyle style: the table style to apply
+    :param int row_count: the number of rows of the tables to style
+    :param int column_count: the number of columns of the tables to style
+    """
+
+    style: TableStyle
+    _attributes: Dict[str, Any]
+
+    def __init__(self, style: TableStyle, row_count: int, column_count: int):
+        self.style = style
+        cells = [[""] * column_count for _ in range(row_count)]
+        unstyled = Table(cells).__dict__
+        styled = Table(cells, style=style).__dict__
+        # Keep everything applying the style changed, which always includes the
+        # cells' styles, since those are never equal.
+        self._attributes = {
+            name: value
+            for name, value in styled.items()
+            if name not in unstyled or unstyled[name] != value
+        }
+
+    @property
+    def cell_styles(self) -> List[List[Any]]:
+        """List[List[CellStyle]]: The styles of all cells to share"""
+        return self._attributes["_cellStyles"]
+
+    def apply(self, table: Table):
+        """Hand over the result of applying the style to a table by reference
+
+        :param Table table: a table with as many rows and columns as compiled for
+        """
+        table.__dict__.update(self._attributes)
+
+    def unshare(self, table: Table):
+        """Give a table its own copy of the result it was handed over
+
+        :param Table table: a table the result was handed over to before
+        """
+        for name, value in self._attributes.items():
+            if name == "_cellStyles":
+                table._cellStyles = [
+                    [copy(cell_style) for cell_style in row] for row in value
+                ]
+            elif isinstance(value, list):
+                setattr(table, name, list(value))
+
+
 class XMLTableStyle:
     """ Create a collection of styling information about the table to create
 
+    Building the stylesheet and especially loading the fonts takes a while, so
+    everything related to the tables of one process should share the instance
+    returned by :meth:`shared` instead of creating its own.
+
     Beautiful colors are:
         *   aliceblue (not with azure)
         *   azure (not with aliceblue)
@@ -31,6 +92,12 @@ class XMLTableStyle:
         * ...
     """
 
+    #: The instance shared by all tables of the current process.
+    _shared: Optional["XMLTableStyle"] = None
+
+    #: The font files last registered with reportlab in the current process.
+    _registered_font: Optional[Tuple[str, ...]] = None
+
     # Prepare a reusable constant for assigning settings to all cells of an area.
     FULL_ROW = (
         (0, 0),
@@ -126,6 +193,10 @@ class XMLTableStyle:
             )
         )
 
+        self._compiled_styles: Dict[Tuple[TableStyle, int, int], CompiledTableStyle] = (
+            {}
+        )
+
         # Extract the column widths from properties.
         self._column_widths = [
             float(column.width) * mm for column in columns
@@ -137,11 +208,55 @@ class XMLTableStyle:
         # Register font with reportlab.
         self._init_font_family()
 
+    @classmethod
+    def shared(cls) -> "XMLTableStyle":
+        """Return the styling information shared by all tables of the process
+
+        The instance is created on the first call, so that the fonts are loaded only
+        once per process, e.g. once per worker of a
+        :class:`pyxml2pdf.core.batch.BatchConverter`.
+
+        :returns: the shared instance
+        :rtype: XMLTableStyle
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def compiled_style(
+        self, style: Union[str, TableStyle], row_count: int, column_count: int
+    ) -> CompiledTableStyle:
+        """Return a style pre-compiled for tables of a certain shape
+
+        The result is compiled on the first request for each style and shape and
+        shared by all following requests, so that styling a table does not walk the
+        style's commands again.
+
+        :param Union[str, TableStyle] style: the style itself or the name of one of
+            the :attr:`custom_styles`, like "normal", "heading" or "sub_heading"
+        :param int row_count: the number of rows of the tables to style
+        :param int column_count: the number of columns of the tables to style
+        :returns: the style applied to tables of the given shape
+        :rtype: CompiledTableStyle
+        """
+        if isinstance(style, str):
+            style = self._custom_styles[style]
+        key = (style, row_count, column_count)
+        try:
+            return self._compiled_styles[key]
+        except KeyError:
+            compiled_style = CompiledTableStyle(style, row_count, column_count)
+            self._compiled_styles[key] = compiled_style
+            return compiled_style
+
     def _init_font_family(self):
         """Register the desired font with :py:mod:`reportlab`
 
-        This ensures that `<i></i>` and `<b></b>` as cell content work well.
+        This ensures that `<i></i>` and `<b></b>` as cell content work well. The font
+        files are only loaded, if they were not yet registered in this process.
         """
+        if tuple(self._font) == XMLTableStyle._registered_font:
+            return
         # Set root of fonts to the folder containing this file.
         path_to_fonts = PurePath(__file__).parent.joinpath("fonts")
 
@@ -159,6 +274,7 @@ class XMLTableStyle:
             italic="italic_font",
             boldItalic="bolditalic_font",
         )
+        XMLTableStyle._registered_font = tuple(self._font)
 
     @property
     def column_widths(self):
@@ -1,24 +1,29 @@
 """This module contains the class :class:`TableBuilder` which deals with XML tables."""
 
 import warnings
-from typing import List, Optional, Union
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
 from reportlab.platypus import Flowable, Paragraph, Table, TableStyle  # type: ignore
 
 from input.properties_template import columns, subtable_settings  # type: ignore
 from pyxml2pdf.styles.table_styles import XMLTableStyle
-from pyxml2pdf.tables.tables import XMLTable
+from pyxml2pdf.tables.tables import FixedWidthTable, XMLTable
 
 
 class TableBuilder:
     """Takes over all tasks for building and working with the tables created"""
 
+    #: The row of column headings shared by all subtables of the process together
+    #: with the styling information it was built with.
+    _column_headings = None  # type: Optional[Tuple[XMLTableStyle, Table]]
+
     def __init__(self):
-        self._table_style = XMLTableStyle()  # type: XMLTableStyle
+        self._table_style = XMLTableStyle.shared()  # type: XMLTableStyle
         self._stylesheet = self._table_style.custom_styles[
             "stylesheet"
         ]  # type: TableStyle
         self._subtables = self.create_subtables()  # type: List[XMLTable]
+        self._compile_include_filters()
 
     def create_subtables(self) -> List[XMLTable]:
         """Create subtables for all different kinds of rows
@@ -37,7 +42,9 @@ class TableBuilder:
         """Build the first two rows of a subtable
 
         Build the first two rows of a subtable with its title and column headings taken
-        from the properties file.
+        from the properties file. Only the title row is built for each subtable, while
+        the row of column headings is shared as returned by
+        :meth:`make_column_headings`.
 
         :param str title: the title of the subtable
 
@@ -53,53 +60,174 @@ class TableBuilder:
             )
         ]
 
-        # Create row containing one column per heading.
-        columns_list = [
-            Paragraph(heading, self._stylesheet.get("Heading2"))
-            for heading in [column.label for column in columns]
-        ]
-
         # Concatenate both rows.
-        title_row.append(
-            self.create_fixedwidth_table(
-                [columns_list],
-                self._table_style.column_widths,
-                self._table_style.custom_styles["sub_heading"],
-            )
-        )
+        title_row.append(self.make_column_headings())
         return title_row
 
+    def make_column_headings(self) -> Table:
+        """Build the row of column headings shared by all subtables
+
+        The row is built only once per process and styling information and shared by
+        the subtables of all instances of :class:`TableBuilder` and all runs. Thereby
+        its size is measured only once as well, since the row does not depend on the
+        subtable it is placed in.
+
+        :returns: one line table with the column headings
+        :rtype: Table
+        """
+        if (
+            TableBuilder._column_headings is None
+            or TableBuilder._column_headings[0] is not self._table_style
+        ):
+            # Create row containing one column per heading.
+            columns_list = [
+                Paragraph(heading, self._stylesheet.get("Heading2"))
+                for heading in [column.label for column in columns]
+            ]
+            TableBuilder._column_headings = (
+                self._table_style,
+                self.create_fixedwidth_table(
+                    [columns_list],
+                    self._table_style.column_widths,
+                    self._table_style.custom_styles["sub_heading"],
+                ),
+            )
+        return TableBuilder._column_headings[1]
+
     @property
     def subtables(self) -> List[Table]:
         """List[Table]: Return all subtables at once"""
         return [element for subtable in self._subtables for element in subtable.rows]
 
-    def distribute_row(self, row):
+    @property
+    def merged_subtables(self) -> List[Table]:
+        """List[Table]: Return each subtable merged into one table at once"""
+        return [
+            subtable.merge_rows(self._table_style.column_widths)
+            for subtable in self._subtables
+        ]
+
+    def subtable_flowables(self, repeat_headers: bool = False) -> List[Flowable]:
+        """Return each subtable as one flowable splitting between its rows
+
+        :param bool repeat_headers: if True, the rows of the title and the column
+            headings are repeated on every page a subtable continues on
+        :returns: the flowables of all subtables
+        :rtype: List[Flowable]
+        """
+        repeat_rows = 2 if repeat_headers else 0
+        return [subtable.to_flowable(repeat_rows) for subtable in self._subtables]
+
+    @property
+    def tables(self) -> List[XMLTable]:
+        """List[XMLTable]: Return the subtables themselves in their order"""
+        return self._subtables
+
+    def _compile_include_filters(self):
+        """Compile the include filters of all subtables into bitmasks per criterion
+
+        Each list of include filters of each subtable gets its own bit. A criterion's
+        bitmask has the bits of all lists of include filters containing it set and a
+        subtable's bitmask has the bits of all its lists of include filters set. Thus
+        a row belongs to a subtable, if the bitwise or of its criteria's bitmasks
+        covers the subtable's bitmask.
+        """
+        self._criterion_masks = {}  # type: Dict[str, int]
+        self._subtable_masks = []  # type: List[int]
+        bit = 1
+        for subtable in self._subtables:
+            subtable_mask = 0
+            for include_filters in subtable.include_filters:
+                for criterion in include_filters:
+                    self._criterion_masks[criterion] = (
+                        self._criterion_masks.get(criterion, 0) | bit
+                    )
+                subtable_mask |= bit
+                bit <<= 1
+            self._subtable_masks.append(subtable_mask)
+        self._matches = {}  # type: Dict[FrozenSet[str], List[int]]
+
+    def match_subtables(self, criteria: Iterable[str]) -> List[int]:
+        """Determine the subtables a row with the given criteria belongs to
+
+        A row belongs to a subtable, if it matches at least one criterion of each of
+        the subtable's lists of include filters. The result is determined via the
+        bitmasks compiled from the include filters and memorized for each distinct
+        combination of criteria, since many rows share the same criteria.
+
+        :param Iterable[str] criteria: the row's criteria
+        :returns: the positions of all matching subtables in their order
+        :rtype: List[int]
+        """
+        distinct_criteria = frozenset(criteria)
+        try:
+            return list(self._matches[distinct_criteria])
+        except KeyError:
+            pass
+        criteria_mask = 0
+        for criterion in distinct_criteria:
+            criteria_mask |= self._criterion_masks.get(criterion, 0)
+        matches = [
+            index
+            for index, subtable_mask in enumerate(self._subtable_masks)
+            if criteria_mask & subtable_mask == subtable_mask
+        ]
+        self._matches[distinct_criteria] = matches
+        return list(matches)
+
+    def distribute_row(
+        self, row, subtable_indices: Optional[List[int]] = None
+    ) -> List[Table]:
         """Distribute a row to the subtables according to the related criteria
 
         :param XMLRow row: row to distribute
+        :param Optional[List[int]] subtable_indices: the positions of the subtables the
+            row belongs to, if they were already determined via
+            :meth:`match_subtables`
+        :returns: the table rows appended to the subtables in their order
+        :rtype: List[Table]
         """
-        distribution_failed = True
-        set_of_crits = set(row.criteria)
-        for subtable in self._subtables:
-            crit_filters_intersection = [
-                set_of_crits.intersection(include_filters)
-                for include_filters in subtable.include_filters
-            ]
-            if all(crit_filters_intersection):
-                subtable.append(row.get_table_row(subtable.title))
-                distribution_failed = False
-        if distribution_failed:
-            warnings.warn(
-                "XML row identified by "
-                + row.identifier
-                + " would not be printed, because it does not contain a valid"
-                " combination of criteria. Currently it contains "
-                + str(row.criteria)
-                + ". If it is supposed to shown please adapt the tables' "
-                "include-filters or adapt the XML tags content .",
-                RuntimeWarning,
-            )
+        if subtable_indices is None:
+            subtable_indices = self.match_subtables(row.criteria)
+        table_rows = [
+            row.get_table_row(self._subtables[index].title)
+            for index in subtable_indices
+        ]
+        self.distribute_table_rows(table_rows, subtable_indices)
+        if not subtable_indices:
+            self.warn_undistributed(row.identifier, row.criteria)
+        return table_rows
+
+    def distribute_table_rows(
+        self, table_rows: List[Table], subtable_indices: List[int]
+    ):
+        """Append a row's already built table rows to their subtables
+
+        :param List[Table] table_rows: the table rows as returned by
+            :meth:`distribute_row`
+        :param List[int] subtable_indices: the positions of the subtables in the
+            order of the table rows
+        """
+        for table_row, index in zip(table_rows, subtable_indices):
+            self._subtables[index].append(table_row)
+
+    @staticmethod
+    def warn_undistributed(identifier: str, criteria: Set[str]):
+        """Warn about a row, which does not belong to any of the subtables
+
+        :param str identifier: the row's identifier
+        :param Set[str] criteria: the row's criteria
+        """
+        warnings.warn(
+            "XML row identified by "
+            + identifier
+            + " would not be printed, because it does not contain a valid"
+            " combination of criteria. Currently it contains "
+            + str(criteria)
+            + ". If it is supposed to shown please adapt the tables' "
+            "include-filters or adapt the XML tags content .",
+            RuntimeWarning,
+        )
 
     def create_fixedwidth_table(
         self,
@@ -124,9 +252,14 @@ class TableBuilder:
         """
         if widths is None:
             widths = self._table_style.column_widths
+        if isinstance(widths, list):
+            # reportlab pads the widths in place for rows with more cells, which must
+            # not affect the column widths shared by all tables.
+            widths = list(widths)
         if style is None:
             style = self._table_style.custom_styles["normal"]
-        table = Table(cells, colWidths=widths)
-        table.setStyle(style)
-
-        return table
+        column_count = max(map(len, cells), default=0)
+        if column_count:
+            # Share the style's application with all tables of the same shape.
+            style = self._table_style.compiled_style(style, len(cells), column_count)
+        return FixedWidthTable(cells, colWidths=widths, style=style)
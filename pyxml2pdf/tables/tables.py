@@ -1,8 +1,17 @@
-"""This module contains a class :class:`XMLTable` to collect the XML's content."""
+"""This module contains a class :class:`XMLTable` to collect the XML's content.
 
-from typing import List
+It contains as well the class :class:`FixedWidthTable` for the single table rows and
+the class :class:`SubtableFlowable` to lay out all rows of a subtable at once.
+"""
 
-from reportlab.platypus import Table  # type:ignore
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, chain
+from typing import Any, List, Optional, Tuple, Union
+
+from reportlab.platypus import Flowable, Table, TableStyle  # type: ignore
+from reportlab.rl_config import _FUZZ  # type: ignore
+
+from pyxml2pdf.styles.table_styles import CompiledTableStyle
 
 
 class XMLTable:
@@ -36,6 +45,125 @@ class XMLTable:
         """
         self.rows.extend(rows)
 
+    def merge_rows(self, column_widths: List[float], repeat_rows: int = 2) -> Table:
+        """Merge all rows into one table with the same look as the single rows
+
+        Each row's cells are placed into the columns they cover according to their
+        widths, where cells covering several columns are spanned over them. The
+        style commands each row was created with are transferred onto its row in the
+        merged table. Consecutive rows sharing their style and their cells' layout
+        share the transferred style commands as well, so that the merged table only
+        needs few commands, which keeps splitting it across pages cheap.
+
+        :param List[float] column_widths: the widths of the merged table's columns,
+            which all rows' cells' widths need to be composed of
+        :param int repeat_rows: the number of leading rows to repeat on every page,
+            which defaults to the two rows of the title and the column headings
+        :returns: the table with one row for each row in :attr:`rows`
+        :rtype: Table
+        """
+        boundaries = [0.0] + list(accumulate(column_widths))
+        cells = []  # type: List[List[Any]]
+        commands = []  # type: List[Tuple]
+        groups = []  # type: List[List[Any]]
+        for row_index, row in enumerate(self.rows):
+            starts, ends = [], []
+            cell_boundaries = [0.0] + list(accumulate(row._colWidths))
+            for start, end in zip(cell_boundaries, cell_boundaries[1:]):
+                starts.append(self._nearest_boundary(boundaries, start))
+                ends.append(
+                    max(self._nearest_boundary(boundaries, end) - 1, starts[-1])
+                )
+            merged_row = [""] * len(column_widths)  # type: List[Any]
+            for cell, start, end in zip(row._cellvalues[0], starts, ends):
+                merged_row[start] = cell
+                if end > start:
+                    commands.append(("SPAN", (start, row_index), (end, row_index)))
+            cells.append(merged_row)
+            row_style = getattr(row, "row_style", None)
+            if groups and groups[-1][:3] == [row_style, starts, ends]:
+                groups[-1][4] = row_index
+            else:
+                groups.append([row_style, starts, ends, row_index, row_index])
+        for row_style, starts, ends, first_row, last_row in groups:
+            commands.extend(
+                self._transfer_style(row_style, starts, ends, first_row, last_row)
+            )
+        return Table(
+            cells,
+            colWidths=column_widths,
+            repeatRows=min(repeat_rows, len(cells)),
+            style=commands,
+        )
+
+    def to_flowable(self, repeat_rows: int = 0) -> "SubtableFlowable":
+        """Lay out all rows as one flowable, which splits between the rows
+
+        :param int repeat_rows: the number of leading rows to repeat on every page,
+            e.g. 2 for the rows of the title and the column headings, which defaults
+            to repeating none
+        :returns: the flowable drawing all rows in :attr:`rows`
+        :rtype: SubtableFlowable
+        """
+        return SubtableFlowable(self.rows, repeat_rows)
+
+    @staticmethod
+    def _transfer_style(
+        row_style: Optional[TableStyle],
+        starts: List[int],
+        ends: List[int],
+        first_row: int,
+        last_row: int,
+    ) -> List[Tuple]:
+        """Transfer the style of single rows onto consecutive rows of a merged table
+
+        :param Optional[TableStyle] row_style: the style the single rows were
+            created with
+        :param List[int] starts: the first column each of the rows' cells covers
+        :param List[int] ends: the last column each of the rows' cells covers
+        :param int first_row: the index of the first of the rows
+        :param int last_row: the index of the last of the rows
+        :returns: the style commands for the rows in the merged table
+        :rtype: List[Tuple]
+        """
+        commands = []  # type: List[Tuple]
+        for command in row_style.getCommands() if row_style else []:
+            name, (start_column, _), (end_column, _), *arguments = command
+            start = (starts[start_column], first_row)
+            end = (ends[end_column], last_row)
+            if name in ("BOX", "OUTLINE"):
+                # Each single row is boxed, so the rows are separated by lines.
+                commands.append((name, start, end, *arguments))
+                if last_row > first_row:
+                    commands.append(
+                        ("LINEBELOW", start, (end[0], last_row - 1), *arguments)
+                    )
+            elif name == "INNERGRID":
+                # The inner grid of single rows only consists of vertical lines.
+                if end[0] > start[0]:
+                    commands.append(
+                        ("LINEAFTER", start, (end[0] - 1, last_row), *arguments)
+                    )
+            else:
+                commands.append((name, start, end, *arguments))
+        return commands
+
+    @staticmethod
+    def _nearest_boundary(boundaries: List[float], position: float) -> int:
+        """Determine the column boundary closest to a horizontal position
+
+        :param List[float] boundaries: the positions of all column boundaries
+        :param float position: the position of the boundary of a row's cell
+        :returns: the index of the closest column boundary
+        :rtype: int
+        """
+        index = bisect_left(boundaries, position)
+        if index == len(boundaries) or (
+            index and position - boundaries[index - 1] < boundaries[index] - position
+        ):
+            index -= 1
+        return index
+
     @property
     def rows(self) -> List[Table]:
         """List[Table]: The list of rows as Table objects"""
@@ -62,3 +190,208 @@ class XMLTable:
     @include_filters.setter
     def include_filters(self, value: List[List[str]]):
         self._include_filters = value
+
+
+class FixedWidthTable(Table):
+    """A :py:class:`reportlab.platypus.Table` which is measured once per width
+
+    :py:mod:`reportlab` wraps a table row several times, e.g. while trying to keep
+    it together with its neighbours and again while placing it into a frame. The
+    height of a table consisting of a single row does not depend on the available
+    height, so the result of the first measurement is reused for all following ones
+    with the same available width. The cells themselves are measured via
+    :meth:`pyxml2pdf.core.rows.XMLCell.wrap`.
+    """
+
+    _measured_width: Optional[float] = None
+
+    #: The style the row was created with to transfer it into merged tables.
+    row_style: Optional[TableStyle] = None
+
+    #: The pre-compiled style the table shares with others of the same shape.
+    _compiled_style: Optional[CompiledTableStyle] = None
+
+    def __init__(
+        self,
+        data,
+        colWidths=None,
+        style: Optional[Union[TableStyle, CompiledTableStyle]] = None,
+        **kw
+    ):
+        if isinstance(style, CompiledTableStyle):
+            super().__init__(
+                data, colWidths=colWidths, cellStyles=style.cell_styles, **kw
+            )
+            style.apply(self)
+            self._compiled_style = style
+            self.row_style = style.style
+        else:
+            super().__init__(data, colWidths=colWidths, style=style, **kw)
+            self.row_style = style
+
+    def setStyle(self, tblstyle):
+        """Apply a further style without affecting tables sharing the current one
+
+        :param TableStyle tblstyle: the style to apply
+        """
+        if self._compiled_style is not None:
+            self._compiled_style.unshare(self)
+            self._compiled_style = None
+        super().setStyle(tblstyle)
+
+    def wrap(self, availWidth: float, availHeight: float) -> Tuple[float, float]:
+        """Measure the table unless it was measured for the same width before
+
+        :param float availWidth: the available width
+        :param float availHeight: the available height
+        :returns: the width and height of the table
+        :rtype: Tuple[float, float]
+        """
+        if self._nrows == 1 and availWidth == self._measured_width:
+            return self._width, self._height
+        size = super().wrap(availWidth, availHeight)
+        self._measured_width = availWidth
+        return size
+
+
+class _SubtableMeasurements:
+    """The measurements of the rows of a subtable shared by all its parts
+
+    :param List[Table] rows: the rows of the subtable
+    """
+
+    rows: List[Table]
+    width: float
+    widths: List[float]
+    offsets: List[float]
+    _measured_width: Optional[float]
+
+    def __init__(self, rows: List[Table]):
+        self.rows = rows
+        self.width = 0.0
+        self.widths = []
+        self.offsets = [0.0]
+        self._measured_width = None
+
+    def measure(self, availWidth: float, availHeight: float):
+        """Measure all rows unless they were measured for the same width before
+
+        :param float availWidth: the available width
+        :param float availHeight: the available height
+        """
+        if availWidth == self._measured_width:
+            return
+        sizes = [row.wrap(availWidth, availHeight) for row in self.rows]
+        self.widths = [width for width, _ in sizes]
+        self.width = max(self.widths, default=0.0)
+        self.offsets = [0.0] + list(accumulate(height for _, height in sizes))
+        self._measured_width = availWidth
+
+
+class SubtableFlowable(Flowable):
+    """A flowable drawing the rows of a subtable and splitting it between its rows
+
+    Instead of handing over each row as a flowable of its own, which
+    :py:mod:`reportlab` wraps and tries to split again and again near the page
+    ends, all rows of a subtable are measured once. Their cumulative heights then
+    determine the last row fitting onto a page by bisection, so a page split only
+    takes logarithmic time in the number of rows. Without repeated rows the pages
+    look exactly as if each row was handed over on its own. With repeated rows each
+    part following a split starts with them again and a subtable is never split
+    right after them.
+
+    :param List[Table] rows: the rows of the subtable starting with its header rows
+    :param int repeat_rows: the number of leading rows to repeat on every page,
+        which defaults to none
+    """
+
+    _measurements: _SubtableMeasurements
+    _repeat_rows: int
+    _start: int
+    _end: int
+
+    def __init__(self, rows: List[Table], repeat_rows: int = 0):
+        super().__init__()
+        self.hAlign = "CENTER"
+        self._measurements = _SubtableMeasurements(rows)
+        self._repeat_rows = min(repeat_rows, len(rows))
+        self._start = 0
+        self._end = len(rows)
+
+    def _part(self, start: int, end: int) -> "SubtableFlowable":
+        """Create the part of the subtable containing the rows from start to end
+
+        :param int start: the position of the part's first row
+        :param int end: the position after the part's last row
+        :returns: the part sharing the measurements with this flowable
+        :rtype: SubtableFlowable
+        """
+        part = SubtableFlowable([], self._repeat_rows)
+        part._measurements = self._measurements
+        part._repeat_rows = self._repeat_rows
+        part._start, part._end = start, end
+        return part
+
+    def _header_height(self) -> float:
+        """Return the height of the repeated header rows, if this part needs them
+
+        :returns: the height of the header rows for all but the first part or 0
+        :rtype: float
+        """
+        return self._measurements.offsets[self._repeat_rows] if self._start else 0.0
+
+    @property
+    def drawn_rows(self) -> List[Table]:
+        """List[Table]: The rows the part draws including the repeated header rows"""
+        rows = self._measurements.rows
+        header = rows[: self._repeat_rows] if self._start else []
+        return header + rows[self._start : self._end]
+
+    def wrap(self, availWidth: float, availHeight: float) -> Tuple[float, float]:
+        """Measure the part of the subtable
+
+        :param float availWidth: the available width
+        :param float availHeight: the available height
+        :returns: the width and height of the part
+        :rtype: Tuple[float, float]
+        """
+        self._measurements.measure(availWidth, availHeight)
+        offsets = self._measurements.offsets
+        self.width = self._measurements.width
+        self.height = self._header_height() + offsets[self._end] - offsets[self._start]
+        return self.width, self.height
+
+    def split(self, availWidth: float, availHeight: float) -> List["SubtableFlowable"]:
+        """Split the part of the subtable after the last row fitting the height
+
+        :param float availWidth: the available width
+        :param float availHeight: the available height
+        :returns: the part fitting the height and the rest or an empty list, if not
+            even the header rows with one further row fit
+        :rtype: List[SubtableFlowable]
+        """
+        self._measurements.measure(availWidth, availHeight)
+        offsets = self._measurements.offsets
+        end = (
+            bisect_right(
+                offsets,
+                offsets[self._start] + availHeight - self._header_height() + _FUZZ,
+            )
+            - 1
+        )
+        end = min(end, self._end - 1)
+        if end <= (self._start or self._repeat_rows):
+            return []
+        return [self._part(self._start, end), self._part(end, self._end)]
+
+    def draw(self):
+        """Draw the rows of the part one below the other"""
+        measurements = self._measurements
+        offsets = measurements.offsets
+        y = self.height
+        header = range(self._repeat_rows) if self._start else range(0)
+        for index in chain(header, range(self._start, self._end)):
+            y -= offsets[index + 1] - offsets[index]
+            measurements.rows[index].drawOn(
+                self.canv, 0, y, _sW=self.width - measurements.widths[index]
+            )
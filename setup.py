@@ -32,6 +32,7 @@ setup(
     packages=find_packages(exclude=["test"]),
     documentation="pyxml2pdf.readthedocs.io",
     install_requires=["defusedxml", "download", "reportlab", "pypdf2"],
+    extras_require={"lxml": ["lxml"]},
     python_requires=">=3.6",
     classifiers=[
         "Development Status :: 4 - Beta",
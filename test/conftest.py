@@ -1,6 +1,7 @@
 import defusedxml  # type: ignore
 import pytest
 
+from pyxml2pdf.core.backends import get_backend, ParserBackend
 from pyxml2pdf.core.rows import XMLRow
 from pyxml2pdf.styles.table_styles import XMLTableStyle
 
@@ -9,6 +10,34 @@ defusedxml.defuse_stdlib()
 from xml.etree.ElementTree import Element
 
 
+@pytest.fixture(autouse=True)
+def signing_key_path(tmp_path_factory, monkeypatch) -> str:
+    """Keep the secret key to sign the caches with out of the user's home
+
+    :returns: the path to the file holding the key
+    """
+    key_path = str(tmp_path_factory.mktemp("key") / "cache.key")
+    monkeypatch.setattr("pyxml2pdf.core.incremental._KEY_PATH", key_path)
+    return key_path
+
+
+@pytest.fixture
+def long_template(tmp_path) -> str:
+    """Create an XML file with enough rows for several pages per subtable
+
+    :returns: the path to the XML file
+    """
+    rows = "".join(
+        f"<row_tag><name_tag>name {number}</name_tag>"
+        f"<info_tag>info {number} with a longer text to wrap</info_tag>"
+        f"<filter_tag>filter_{number % 3 + 1}, filter_2</filter_tag></row_tag>"
+        for number in range(60)
+    )
+    long_path = tmp_path / "long.xml"
+    long_path.write_text(f"<main_tag>{rows}</main_tag>")
+    return str(long_path)
+
+
 @pytest.fixture
 def test_element() -> Element:
     """Create a test element
@@ -44,3 +73,14 @@ def test_row(test_element) -> XMLRow:
     :returns: a row matching the test_element
     """
     return XMLRow(test_element)
+
+
+@pytest.fixture(params=["defusedxml", "lxml"])
+def parser_backend(request) -> ParserBackend:
+    """Create each of the backends to parse XML, skipping those not installed
+
+    :returns: a backend to parse XML
+    """
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    return get_backend(request.param)
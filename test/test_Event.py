@@ -4,7 +4,7 @@ from typing import Callable, Dict
 
 import pytest
 from hypothesis import given, HealthCheck, settings
-from hypothesis.strategies import dates, text
+from hypothesis.strategies import dates, lists, text
 from reportlab.platypus.tables import Table  # type: ignore
 
 from pyxml2pdf.core.events import Event
@@ -186,3 +186,31 @@ def test_remove_country(test_event, dat):
     assert re.sub(
         "[0-9]{4,}", test_event._remove_century, dat.strftime("%d.%m.%Y")
     ) == dat.strftime("%d.%m.%y")
+
+
+@given(
+    lists(
+        lists(text(alphabet="0129.: -aufAnrge"), min_size=3, max_size=3),
+        max_size=20,
+    )
+)
+def test_format_dates_equals_format_date(date_ranges):
+    date_range_columns = [list(column) for column in zip(*date_ranges)] or [[]] * 3
+    assert Event.format_dates(date_range_columns) == [
+        Event._format_date(ranges) for ranges in date_ranges
+    ]
+
+
+def test_format_dates():
+    assert Event.format_dates(
+        [
+            ["31.12.2021 00:00", "01.01.2099", "", "1.1.21"],
+            ["02.01.2022 10:00", "", "", ""],
+            ["", "", "", "3.1.22"],
+        ]
+    ) == [
+        "31.12.21 <br/>und<br/>02.01.22 10:00",
+        "auf Anfrage",
+        "",
+        "1.1.21<br/>und<br/>3.1.22",
+    ]
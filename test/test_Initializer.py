@@ -19,3 +19,32 @@ def test_initializer():
     output_filename = "testdata.pdf"
     output_path = output_folder + output_filename
     Initializer(input_path, output_path)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_initializer_backends(tmp_path, parser_backend, streaming):
+    output_path = str(tmp_path / "template.pdf")
+    Initializer(
+        "input/template.xml",
+        output_path,
+        streaming=streaming,
+        backend=parser_backend.name,
+    )
+    assert (tmp_path / "template.pdf").exists()
+    assert (tmp_path / "template_page_01.pdf").exists()
+
+
+def test_initializer_merge_rows(tmp_path):
+    output_path = str(tmp_path / "template.pdf")
+    Initializer("input/template.xml", output_path, merge_rows=True)
+    assert (tmp_path / "template_page_01.pdf").exists()
+
+
+def test_initializer_merge_rows_not_incremental(tmp_path):
+    with pytest.raises(ValueError):
+        Initializer(
+            "input/template.xml",
+            str(tmp_path / "template.pdf"),
+            incremental=True,
+            merge_rows=True,
+        )
@@ -1,4 +1,6 @@
+import argparse
 import subprocess
+import sys
 
 import pytest
 
@@ -31,6 +33,48 @@ def test_validate_main_with_invalid_input():
         main.validate_inputs({"foo": "bar"})
 
 
+@pytest.mark.parametrize(
+    "pages, page_numbers", [("3", [2]), ("3,7-9", [2, 6, 7, 8]), ("2-2", [1])]
+)
+def test_page_numbers(pages, page_numbers):
+    assert main._page_numbers(pages) == page_numbers
+
+
+@pytest.mark.parametrize(
+    "pages", ["", "0", "a", "3-1", "1-2-3", "3,9-7", "3-", "-3", "2,3-,5"]
+)
+def test_page_numbers_invalid(pages):
+    with pytest.raises(argparse.ArgumentTypeError):
+        main._page_numbers(pages)
+
+
+def test_positive_int():
+    assert main._positive_int("4") == 4
+
+
+@pytest.mark.parametrize("number", ["0", "-1", "1.5", "a"])
+def test_positive_int_invalid(number):
+    with pytest.raises(argparse.ArgumentTypeError):
+        main._positive_int(number)
+
+
+@pytest.mark.parametrize("option", ["-w", "-P"])
+def test_batch_rejects_single_file_options(option, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["main.py", option, "2", "a.xml", "b.xml"])
+    with pytest.raises(SystemExit):
+        main._add_arguments()
+    assert "only applies to the conversion of a single XML file" in (
+        capsys.readouterr().err
+    )
+
+
+def test_single_file_accepts_single_file_options(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["main.py", "-w", "2", "-P", "2", "a.xml"])
+    args = main._add_arguments()
+    assert args["render_workers"] == 2
+    assert args["pages"] == [1]
+
+
 @pytest.mark.online
 def test_input():
     with pytest.raises(SystemExit):
@@ -52,3 +96,48 @@ def test_main_call():
         subprocess.run(
             ["python3", "-m", "pyxml2pdf.main", "test.xml", "test.pdf"], check=True
         )
+
+
+#: The modules only needed for the conversion, which is imported for the baseline.
+conversion_module = "reportlab.platypus"
+
+
+def measure_import(module: str):
+    """Import a module and then the conversion in a fresh interpreter and time both
+
+    :returns: the names of all modules imported by the module and the cumulative
+        import times of all modules
+    """
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import sys, {module}; print(' '.join(sys.modules)); "
+            f"import {conversion_module}",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                import_times[name.strip()] = int(cumulative)
+    return process.stdout.split(), import_times
+
+
+@pytest.mark.parametrize("module", ["pyxml2pdf", "pyxml2pdf.main"])
+def test_import_is_lazy(module):
+    modules, import_times = measure_import(module)
+    for heavy_module in ["reportlab", "PyPDF2", "download", "requests", "tqdm", "lxml"]:
+        assert heavy_module not in modules
+    print(
+        f"Importing {module} took {import_times[module]} µs compared to "
+        f"{import_times[conversion_module]} µs for {conversion_module}."
+    )
+    # Both are measured in the same interpreter, so a loaded machine slows both.
+    assert import_times[module] < import_times[conversion_module]
@@ -0,0 +1,103 @@
+import pytest
+from defusedxml import DTDForbidden, EntitiesForbidden  # type: ignore
+
+from pyxml2pdf.core.backends import BACKEND_NAMES, get_backend
+from pyxml2pdf.core.events import Event
+from pyxml2pdf.core.streamer import Streamer
+
+malicious_xml = (
+    '<?xml version="1.0"?>'
+    '<!DOCTYPE main_tag [<!ENTITY lol "lol"><!ENTITY lol2 "&lol;&lol;">]>'
+    "<main_tag><row_tag><name_tag>&lol2;</name_tag></row_tag></main_tag>"
+)
+
+
+@pytest.fixture
+def malicious_file(tmp_path) -> str:
+    """Create an XML file declaring entities
+
+    :returns: the path to the file
+    """
+    path = tmp_path / "malicious.xml"
+    path.write_text(malicious_xml)
+    return str(path)
+
+
+def extract_texts(backend):
+    """Extract all texts needed for events from the test data with backend"""
+    return [
+        (record.tag, record.attrib, record.criteria, record.identifier)
+        + tuple(record.findtext(tag) for tag in sorted(Event._referenced_tags))
+        for record in map(
+            Event.extract, Streamer("test/test_data/testdata.xml", "kurs", backend)
+        )
+    ]
+
+
+def test_get_backend():
+    for name in BACKEND_NAMES[1:]:
+        if name == "lxml":
+            pytest.importorskip("lxml")
+        assert get_backend(name).name == name
+    assert get_backend().name in BACKEND_NAMES
+
+
+def test_get_unknown_backend():
+    with pytest.raises(ValueError):
+        get_backend("expat")
+
+
+def test_backends_extract_identical_texts(parser_backend):
+    texts = extract_texts(parser_backend)
+    assert texts
+    assert texts == extract_texts(get_backend("defusedxml"))
+
+
+def test_backends_parse_identical_rows(parser_backend):
+    tree = parser_backend.parse("test/test_data/testdata.xml")
+    reference = get_backend("defusedxml").parse("test/test_data/testdata.xml")
+    assert [
+        Event.extract(element).findtext("Bezeichnung")
+        for element in tree.findall("kurs")
+    ] == [
+        Event.extract(element).findtext("Bezeichnung")
+        for element in reference.findall("kurs")
+    ]
+
+
+def test_backends_forbid_entities_when_parsing(parser_backend, malicious_file):
+    with pytest.raises(EntitiesForbidden):
+        parser_backend.parse(malicious_file)
+
+
+def test_backends_forbid_entities_when_streaming(parser_backend, malicious_file):
+    with pytest.raises(EntitiesForbidden):
+        list(Streamer(malicious_file, "row_tag", parser_backend))
+
+
+@pytest.mark.parametrize(
+    "doctype",
+    [
+        '<!DOCTYPE main_tag SYSTEM "http://example.com/main.dtd">',
+        '<!DOCTYPE main_tag PUBLIC "-//example//DTD main//EN" "main.dtd">',
+    ],
+)
+def test_backends_forbid_external_dtds(parser_backend, tmp_path, doctype):
+    path = tmp_path / "external.xml"
+    path.write_text(
+        f'<?xml version="1.0"?>{doctype}'
+        "<main_tag><row_tag><name_tag>name</name_tag></row_tag></main_tag>"
+    )
+    with pytest.raises(DTDForbidden):
+        parser_backend.parse(str(path))
+    with pytest.raises(DTDForbidden):
+        list(Streamer(str(path), "row_tag", parser_backend))
+
+
+def test_backends_accept_internal_dtds(parser_backend, tmp_path):
+    path = tmp_path / "internal.xml"
+    path.write_text(
+        '<?xml version="1.0"?><!DOCTYPE main_tag [<!ELEMENT name_tag ANY>]>'
+        "<main_tag><row_tag><name_tag>name</name_tag></row_tag></main_tag>"
+    )
+    assert parser_backend.parse(str(path)).findtext("row_tag/name_tag") == "name"
@@ -0,0 +1,62 @@
+import os
+import shutil
+
+import pytest
+
+from pyxml2pdf.core.batch import BatchConverter
+
+
+@pytest.fixture
+def input_folder(tmp_path) -> str:
+    """Create a folder with one valid and one broken XML file
+
+    :returns: the path to the folder
+    """
+    shutil.copy("input/template.xml", str(tmp_path / "valid.xml"))
+    (tmp_path / "broken.xml").write_text("<main_tag><row_tag></main_tag>")
+    (tmp_path / "notes.txt").write_text("no XML")
+    return str(tmp_path)
+
+
+def test_collect_inputs_from_folder(input_folder):
+    assert BatchConverter.collect_inputs([input_folder]) == [
+        os.path.join(input_folder, "broken.xml"),
+        os.path.join(input_folder, "valid.xml"),
+    ]
+
+
+def test_collect_inputs_from_glob(input_folder):
+    assert BatchConverter.collect_inputs([os.path.join(input_folder, "v*.xml")]) == [
+        os.path.join(input_folder, "valid.xml")
+    ]
+
+
+def test_collect_inputs_keeps_files():
+    assert BatchConverter.collect_inputs(["missing.xml"]) == ["missing.xml"]
+
+
+def test_pair_outputs():
+    assert BatchConverter.pair_outputs(["input/a.xml"], "output") == [
+        ("input/a.xml", os.path.join("output", "a.pdf"))
+    ]
+
+
+def test_pair_outputs_rejects_clashing_names():
+    with pytest.raises(ValueError):
+        BatchConverter.pair_outputs(["a/program.xml", "b/program.xml"], "output")
+
+
+def test_pair_outputs_converts_files_once():
+    assert BatchConverter.pair_outputs(
+        ["a/program.xml", "a/program.xml"], "output"
+    ) == [("a/program.xml", os.path.join("output", "program.pdf"))]
+
+
+def test_convert_reports_each_file(input_folder):
+    jobs = BatchConverter.pair_outputs(
+        BatchConverter.collect_inputs([input_folder]), input_folder
+    )
+    broken, valid = BatchConverter(jobs, max_workers=2).convert()
+    assert broken.error
+    assert valid.error is None
+    assert os.path.exists(valid.output_path)
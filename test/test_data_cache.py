@@ -0,0 +1,101 @@
+import os
+import pickle
+import shutil
+
+import pytest
+
+import input.properties_template as properties  # type: ignore
+from pyxml2pdf.core.data_cache import DataCache
+from pyxml2pdf.core.initializer import Initializer
+from pyxml2pdf.core.rows import XMLRow
+from pyxml2pdf.core.sorter import Sorter
+from pyxml2pdf.core.streamer import Streamer
+
+
+@pytest.fixture
+def input_path(tmp_path) -> str:
+    """Copy the template to a temporary folder to keep the cache out of the repo
+
+    :returns: the path to the copy
+    """
+    copied_path = str(tmp_path / "template.xml")
+    shutil.copy("input/template.xml", copied_path)
+    return copied_path
+
+
+def extract_sorted(input_path: str):
+    """Extract and sort the data of an XML file
+
+    :returns: the sorted dataset
+    """
+    dataset = XMLRow.create_dataset(Streamer(input_path, "row_tag"))
+    return Sorter(dataset).sort_parsed_xml("name_tag")
+
+
+def test_data_cache_misses_without_cache(input_path):
+    assert DataCache(input_path).load() is None
+
+
+def test_data_cache_round_trip(input_path):
+    dataset = extract_sorted(input_path)
+    data_cache = DataCache(input_path)
+    assert data_cache.load() is None
+    data_cache.save(dataset)
+    assert os.path.exists(DataCache.cache_path(input_path))
+    cached = DataCache(input_path).load()
+    assert cached.column("info_tag") == dataset.column("info_tag")
+    assert cached.criteria == dataset.criteria
+    assert cached.sort_keys == dataset.sort_keys
+
+
+def test_data_cache_survives_touching(input_path):
+    DataCache(input_path).save(extract_sorted(input_path))
+    stat = os.stat(input_path)
+    os.utime(input_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert DataCache(input_path).load() is not None
+
+
+def test_data_cache_detects_changed_content(input_path):
+    DataCache(input_path).save(extract_sorted(input_path))
+    with open(input_path) as xml_file:
+        content = xml_file.read()
+    with open(input_path, "w") as xml_file:
+        xml_file.write(content.replace("info 1", "info 9"))
+    stat = os.stat(input_path)
+    os.utime(input_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert DataCache(input_path).load() is None
+
+
+def test_data_cache_detects_changed_properties(input_path, monkeypatch):
+    DataCache(input_path).save(extract_sorted(input_path))
+    monkeypatch.setattr(properties, "sort_xmltag", ["name_tag", "info_tag"])
+    assert DataCache(input_path).load() is None
+
+
+def test_data_cache_ignores_corrupt_cache(input_path):
+    with open(DataCache.cache_path(input_path), "wb") as cache_file:
+        cache_file.write(b"no pickle")
+    assert DataCache(input_path).load() is None
+
+
+class _Planted:
+    def __reduce__(self):
+        return exec, ("raise AssertionError('The cache ran code.')",)
+
+
+def test_data_cache_does_not_unpickle(input_path):
+    with open(DataCache.cache_path(input_path), "wb") as cache_file:
+        pickle.dump(_Planted(), cache_file)
+    assert DataCache(input_path).load() is None
+
+
+def test_initializer_skips_parsing(input_path, tmp_path, monkeypatch):
+    output_path = str(tmp_path / "template.pdf")
+    Initializer(input_path, output_path, cache_data=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The XML file was parsed again.")
+
+    monkeypatch.setattr("pyxml2pdf.core.initializer.get_backend", fail)
+    Initializer(input_path, output_path, cache_data=True)
+    assert (tmp_path / "template_page_01.pdf").exists()
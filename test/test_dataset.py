@@ -0,0 +1,69 @@
+import pytest
+
+from pyxml2pdf.core.dataset import XMLDataset
+from pyxml2pdf.core.events import Event
+from pyxml2pdf.core.rows import XMLRow
+from pyxml2pdf.core.sorter import Sorter
+from pyxml2pdf.core.streamer import Streamer
+
+
+@pytest.fixture
+def template_dataset() -> XMLDataset:
+    """Create a dataset from the template
+
+    :returns: the dataset of all rows of the template
+    """
+    return XMLRow.create_dataset(Streamer("input/template.xml", "row_tag"))
+
+
+@pytest.fixture
+def event_dataset() -> XMLDataset:
+    """Create a dataset of events from the test data
+
+    :returns: the dataset of all events of the test data
+    """
+    return Event.create_dataset(Streamer("test/test_data/testdata.xml", "kurs"))
+
+
+def test_dataset_columns(template_dataset):
+    assert len(template_dataset) == 5
+    assert template_dataset.column("name_tag") == [f"name {i}" for i in range(1, 6)]
+    assert template_dataset.criteria[0] == {"filter_1", "filter_2"}
+
+
+def test_dataset_records_round_trip(template_dataset):
+    records = list(template_dataset.records())
+    assert XMLDataset.from_records(records, XMLRow._referenced_tags).column(
+        "info_tag"
+    ) == template_dataset.column("info_tag")
+
+
+def test_dataset_reorder(template_dataset):
+    template_dataset.reorder([4, 3, 2, 1, 0])
+    assert template_dataset.column("name_tag")[0] == "name 5"
+    assert template_dataset.criteria[0] == {"filter_1"}
+
+
+def test_sort_dataset_like_records(event_dataset):
+    """Sorting the dataset should result in the same order as sorting records"""
+    records = list(event_dataset.records())
+    sort_key = ["TerminDatumVon1", "Bezeichnung"]
+    expected = [
+        record.findtext("Bezeichnung")
+        for record in Sorter(records).sort_parsed_xml(sort_key)
+    ]
+    sorted_dataset = Sorter(event_dataset).sort_parsed_xml(sort_key)
+    assert sorted_dataset.column("Bezeichnung") == expected
+    assert len(sorted_dataset.sort_keys) == len(expected)
+
+
+def test_row_cell_texts_in_batch(template_dataset):
+    assert XMLRow.build_cell_texts(template_dataset) == [
+        XMLRow(record)._cell_texts for record in template_dataset.records()
+    ]
+
+
+def test_event_cell_texts_in_batch(event_dataset):
+    assert Event.build_cell_texts(event_dataset) == [
+        Event(record)._cell_texts for record in event_dataset.records()
+    ]
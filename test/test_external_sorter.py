@@ -0,0 +1,145 @@
+import random
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from pyxml2pdf.core.events import Event
+from pyxml2pdf.core.external_sorter import _CACHED_DATE_SIZE, ExternalSorter
+from pyxml2pdf.core.initializer import Initializer
+from pyxml2pdf.core.records import XMLRecord
+from pyxml2pdf.core.sorter import _create_date_parser, Sorter
+from pyxml2pdf.core.streamer import Streamer
+
+dates = st.sampled_from(
+    [
+        "",
+        "01.01.2021 10:00",
+        "2021-01-01T10:00:00Z",
+        "02.01.2021 09:00",
+        "2020-12-31T23:59:00",
+        "auf Anfrage",
+    ]
+)
+
+
+def create_records(texts):
+    """Create records with a date and a number to identify them
+
+    :returns: the records in the given order
+    """
+    return [
+        XMLRecord("kurs", {}, {"Termin": date, "Nummer": number, "Kursart": "A"})
+        for number, date in texts
+    ]
+
+
+def numbers(records):
+    return [record.findtext("Nummer") for record in records]
+
+
+@settings(deadline=None, max_examples=50)
+@given(
+    st.lists(st.tuples(st.sampled_from("0123"), dates), max_size=40),
+    st.integers(min_value=0, max_value=2000),
+)
+def test_external_sort_equals_in_memory_sort(texts, memory_budget):
+    texts = [
+        (str(position) + number, date) for position, (number, date) in enumerate(texts)
+    ]
+    expected = numbers(Sorter(create_records(texts)).sort_parsed_xml("Termin"))
+    sorted_rows = ExternalSorter(create_records(texts), memory_budget).sort_parsed_xml(
+        "Termin"
+    )
+    assert len(sorted_rows) == len(texts)
+    assert numbers(sorted_rows) == expected
+    sorted_rows.close()
+
+
+@pytest.mark.parametrize("memory_budget", [0, 500, 10**6])
+def test_external_sort_of_events(memory_budget):
+    sort_key = ["Termin", "Kursnr"]
+    records = [
+        Event.extract(element)
+        for element in Streamer("test/test_data/testdata.xml", "kurs")
+    ]
+    random.Random(1).shuffle(records)
+    expected = [
+        record.identifier for record in Sorter(records).sort_parsed_xml(sort_key)
+    ]
+    sorted_rows = ExternalSorter(iter(records), memory_budget).sort_parsed_xml(sort_key)
+    assert [record.identifier for record in sorted_rows] == expected
+
+
+def test_external_sort_keeps_parsed_dates_bounded(monkeypatch):
+    parsers = []
+
+    def create_date_parser(max_cached=None):
+        parser = _create_date_parser(max_cached)
+        parsers.append(parser)
+        return parser
+
+    monkeypatch.setattr("pyxml2pdf.core.sorter._create_date_parser", create_date_parser)
+    texts = [
+        (
+            str(number),
+            f"{number % 28 + 1:02}.{number % 12 + 1:02}.2021 {number % 24:02}:00",
+        )
+        for number in range(2000)
+    ]
+    memory_budget = 20000
+    sorted_rows = ExternalSorter(create_records(texts), memory_budget).sort_parsed_xml(
+        "Termin"
+    )
+    assert len(sorted_rows._runs) > 10
+    assert numbers(sorted_rows) == numbers(
+        Sorter(create_records(texts)).sort_parsed_xml("Termin")
+    )
+    sorted_rows.close()
+    cache_info = parsers[0].cache_info()
+    assert cache_info.maxsize <= memory_budget // _CACHED_DATE_SIZE
+    assert cache_info.currsize == cache_info.maxsize
+    assert cache_info.misses > cache_info.maxsize
+
+
+def test_external_sort_of_nothing():
+    sorted_rows = ExternalSorter([], 0).sort_parsed_xml("Termin")
+    assert not sorted_rows
+    assert list(sorted_rows) == []
+
+
+def test_initializer_with_memory_budget(tmp_path):
+    Initializer(
+        "input/template.xml",
+        str(tmp_path / "template.pdf"),
+        streaming=True,
+        memory_budget=200,
+    )
+    assert (tmp_path / "template_page_01.pdf").exists()
+
+
+def test_initializer_rejects_incremental_with_memory_budget(tmp_path):
+    with pytest.raises(ValueError):
+        Initializer(
+            "input/template.xml",
+            str(tmp_path / "template.pdf"),
+            incremental=True,
+            memory_budget=200,
+        )
+
+
+def test_initializer_closes_sorted_rows_on_failure(tmp_path, monkeypatch):
+    closed = []
+    monkeypatch.setattr(
+        "pyxml2pdf.core.external_sorter.SortedRows.close",
+        lambda sorted_rows: closed.append(sorted_rows),
+    )
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("The table rows could not be built.")
+
+    monkeypatch.setattr("pyxml2pdf.core.parser.Parser.collect_xml_data", fail)
+    with pytest.raises(RuntimeError):
+        Initializer(
+            "input/template.xml", str(tmp_path / "template.pdf"), memory_budget=200
+        )
+    assert len(closed) == 1
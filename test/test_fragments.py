@@ -0,0 +1,58 @@
+from hypothesis import given, strategies as hst
+from reportlab.lib.styles import getSampleStyleSheet  # type: ignore
+from reportlab.platypus import Paragraph  # type: ignore
+
+from pyxml2pdf.core.fragments import FragmentCache
+from pyxml2pdf.core.rows import XMLCell
+
+stylesheet = getSampleStyleSheet()
+
+
+def test_fragment_cache_parses_once():
+    fragment_cache = FragmentCache()
+    fragments = fragment_cache.parse("<b>keine</b>", stylesheet["Normal"])
+    assert fragment_cache.parse("<b>keine</b>", stylesheet["Normal"]) is fragments
+    assert fragment_cache.hits == 1
+    assert fragment_cache.misses == 1
+    assert fragment_cache.hit_rate == 0.5
+
+
+def test_fragment_cache_distinguishes_styles():
+    fragment_cache = FragmentCache()
+    fragment_cache.parse("keine", stylesheet["Normal"])
+    fragment_cache.parse("keine", stylesheet["Heading1"])
+    assert fragment_cache.misses == 2
+    assert len(fragment_cache) == 2
+
+
+def test_fragment_cache_is_bounded():
+    fragment_cache = FragmentCache(maxsize=2)
+    for text in ["a", "b", "a", "c", "a", "b"]:
+        fragment_cache.parse(text, stylesheet["Normal"])
+    assert len(fragment_cache) == 2
+    assert fragment_cache.hits == 2
+    fragment_cache.clear()
+    assert len(fragment_cache) == 0
+    assert fragment_cache.hit_rate == 0.0
+
+
+@given(text=hst.text(alphabet=hst.characters(min_codepoint=32, max_codepoint=126)))
+def test_fragment_cache_equals_parsing(text):
+    text = text.replace("<", "").replace("&", "")
+    fragment_cache = FragmentCache()
+    cached = Paragraph(
+        text,
+        stylesheet["Normal"],
+        frags=fragment_cache.parse(text, stylesheet["Normal"]),
+    )
+    assert cached.getPlainText() == Paragraph(text, stylesheet["Normal"]).getPlainText()
+
+
+def test_xmlcells_share_fragments(test_table_style):
+    XMLCell.style = test_table_style.custom_styles["stylesheet"]["Normal"]
+    first_cell, second_cell = XMLCell("Eigenverant- wortlich"), XMLCell(
+        "Eigenverant- wortlich"
+    )
+    first_cell.wrap(100, 100)
+    second_cell.wrap(100, 100)
+    assert first_cell.frags is second_cell.frags
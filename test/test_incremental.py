@@ -0,0 +1,204 @@
+import os
+import pickle
+import stat
+
+import pytest
+from PyPDF2 import PdfFileReader  # type: ignore
+from reportlab.lib.units import mm  # type: ignore
+
+from input.properties_template import pagesize  # type: ignore
+from pyxml2pdf.core.incremental import IncrementalDocTemplate, RowCache
+from pyxml2pdf.core.initializer import Initializer
+from pyxml2pdf.core.parser import Parser
+from pyxml2pdf.core.rows import XMLRow
+from pyxml2pdf.core.streamer import Streamer
+from pyxml2pdf.tables.builder import TableBuilder
+
+
+@pytest.fixture
+def changed_template(tmp_path) -> str:
+    """Create a copy of the template with the third row's info changed
+
+    :returns: the path to the changed copy
+    """
+    with open("input/template.xml") as template:
+        content = template.read()
+    changed_path = tmp_path / "changed.xml"
+    changed_path.write_text(content.replace("info 3", "changed info 3"))
+    return str(changed_path)
+
+
+def run_parser(input_path: str, cache_path: str) -> RowCache:
+    """Distribute all rows of an XML file with a cache and store it afterwards
+
+    :returns: the cache used
+    """
+    row_cache = RowCache(cache_path)
+    parser = Parser([], row_cache)
+    parser.collect_xml_data(parser.create_dataset(Streamer(input_path, "row_tag")))
+    row_cache.save()
+    return row_cache
+
+
+def build_incrementally(input_path: str, output_path: str) -> IncrementalDocTemplate:
+    """Build a PDF from an XML file reusing the previous run's rows and pages
+
+    :returns: the document template used
+    """
+    row_cache = RowCache(RowCache.cache_path(output_path))
+    pdf = IncrementalDocTemplate(
+        output_path,
+        row_cache,
+        pagesize=[size * mm for size in pagesize],
+        topMargin=0.0,
+        bottomMargin=0.0,
+        leftMargin=0.0,
+        rightMargin=0.0,
+    )
+    data = []
+    parser = Parser(data, row_cache)
+    parser.collect_xml_data(parser.create_dataset(Streamer(input_path, "row_tag")))
+    pdf.build(data)
+    row_cache.save()
+    return pdf
+
+
+def extract_texts(path: str) -> list:
+    """Extract the text of all pages of a PDF
+
+    :returns: the texts of all pages
+    """
+    pdf = PdfFileReader(path)
+    return [pdf.getPage(page).extractText() for page in range(pdf.getNumPages())]
+
+
+def test_row_hashes_depend_on_content(changed_template, tmp_path):
+    row_cache = RowCache(str(tmp_path / "rows.cache"))
+    hashes = row_cache.row_hashes(
+        XMLRow.create_dataset(Streamer("input/template.xml", "row_tag"))
+    )
+    changed_hashes = row_cache.row_hashes(
+        XMLRow.create_dataset(Streamer(changed_template, "row_tag"))
+    )
+    assert len(set(hashes)) == 5
+    assert [a == b for a, b in zip(hashes, changed_hashes)] == [
+        True,
+        True,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_row_hashes_depend_on_row_type():
+    assert RowCache.fingerprint("XMLRow") != RowCache.fingerprint("Event")
+
+
+def test_first_run_builds_everything(tmp_path):
+    row_cache = run_parser("input/template.xml", str(tmp_path / "rows.cache"))
+    assert row_cache.row_hits == 0
+    assert row_cache.row_misses == 5
+    assert row_cache.subtable_hits == 0
+    assert (tmp_path / "rows.cache").exists()
+
+
+def test_unchanged_input_reuses_everything(tmp_path):
+    cache_path = str(tmp_path / "rows.cache")
+    first_run = run_parser("input/template.xml", cache_path)
+    second_run = run_parser("input/template.xml", cache_path)
+    assert second_run.row_hits == 5
+    assert second_run.row_misses == 0
+    assert second_run.subtable_misses == 0
+    assert second_run.subtable_hits == first_run.subtable_misses
+
+
+def test_changed_row_rebuilds_only_its_subtables(changed_template, tmp_path):
+    cache_path = str(tmp_path / "rows.cache")
+    first_run = run_parser("input/template.xml", cache_path)
+    second_run = run_parser(changed_template, cache_path)
+    changed_subtables = TableBuilder().match_subtables({"filter_2"})
+    assert second_run.row_hits == 4
+    assert second_run.row_misses == 1
+    assert second_run.subtable_misses == len(changed_subtables)
+    assert (
+        second_run.subtable_hits
+        == first_run.subtable_misses - second_run.subtable_misses
+    )
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    cache_path = tmp_path / "rows.cache"
+    cache_path.write_bytes(b"no pickle")
+    assert run_parser("input/template.xml", str(cache_path)).row_misses == 5
+
+
+class _Planted:
+    def __reduce__(self):
+        return exec, ("raise AssertionError('The cache ran code.')",)
+
+
+def test_unsigned_cache_is_ignored(tmp_path):
+    cache_path = tmp_path / "rows.cache"
+    cache_path.write_bytes(bytes(32) + pickle.dumps(_Planted()))
+    assert run_parser("input/template.xml", str(cache_path)).row_misses == 5
+
+
+def test_cache_of_another_key_is_ignored(tmp_path, signing_key_path):
+    cache_path = str(tmp_path / "rows.cache")
+    run_parser("input/template.xml", cache_path)
+    os.remove(signing_key_path)
+    assert run_parser("input/template.xml", cache_path).row_misses == 5
+    assert run_parser("input/template.xml", cache_path).row_misses == 0
+
+
+def test_signing_key_is_private(tmp_path, signing_key_path):
+    run_parser("input/template.xml", str(tmp_path / "rows.cache"))
+    assert stat.S_IMODE(os.stat(signing_key_path).st_mode) == 0o600
+
+
+def test_initializer_incremental(tmp_path):
+    output_path = str(tmp_path / "template.pdf")
+    for _ in range(2):
+        Initializer("input/template.xml", output_path, incremental=True)
+    assert (tmp_path / "template.cache").exists()
+    assert (tmp_path / "template_page_01.pdf").exists()
+
+
+def test_unchanged_input_keeps_pdf(tmp_path):
+    output_path = str(tmp_path / "template.pdf")
+    first_run = build_incrementally("input/template.xml", output_path)
+    assert first_run.changed_pages == [0, 1, 2]
+    modification_time = (tmp_path / "template.pdf").stat().st_mtime_ns
+    second_run = build_incrementally("input/template.xml", output_path)
+    assert second_run.changed_pages == []
+    assert (tmp_path / "template.pdf").stat().st_mtime_ns == modification_time
+
+
+def test_changed_input_equals_full_build(changed_template, tmp_path):
+    output_path = str(tmp_path / "template.pdf")
+    build_incrementally("input/template.xml", output_path)
+    build_incrementally(changed_template, output_path)
+    Initializer(changed_template, str(tmp_path / "reference.pdf"))
+    assert extract_texts(output_path) == extract_texts(str(tmp_path / "reference.pdf"))
+
+
+def test_incremental_build_equals_normal_build(long_template, tmp_path):
+    (tmp_path / "normal").mkdir()
+    (tmp_path / "incremental").mkdir()
+    Initializer(long_template, str(tmp_path / "normal" / "long.pdf"))
+    Initializer(
+        long_template, str(tmp_path / "incremental" / "long.pdf"), incremental=True
+    )
+    normal = extract_texts(str(tmp_path / "normal" / "long.pdf"))
+    assert len(normal) > 3
+    assert extract_texts(str(tmp_path / "incremental" / "long.pdf")) == normal
+
+
+def test_incremental_build_rejects_repeated_headers(tmp_path):
+    with pytest.raises(ValueError):
+        Initializer(
+            "input/template.xml",
+            str(tmp_path / "template.pdf"),
+            incremental=True,
+            repeat_headers=True,
+        )
@@ -0,0 +1,47 @@
+from reportlab.lib.styles import getSampleStyleSheet  # type: ignore
+from reportlab.platypus import Paragraph  # type: ignore
+
+from pyxml2pdf.core.measurements import MeasurementCache
+from pyxml2pdf.core.rows import XMLCell
+from pyxml2pdf.tables.builder import TableBuilder
+
+stylesheet = getSampleStyleSheet()
+
+
+def test_measurement_cache_round_trip():
+    measurement_cache = MeasurementCache()
+    assert measurement_cache.get("keine", stylesheet["Normal"], 50) is None
+    measurement_cache.store("keine", stylesheet["Normal"], 50, {"height": 12})
+    assert measurement_cache.get("keine", stylesheet["Normal"], 50) == {"height": 12}
+    assert measurement_cache.get("keine", stylesheet["Normal"], 60) is None
+    assert measurement_cache.hit_rate == 1 / 3
+
+
+def test_measurement_cache_is_bounded():
+    measurement_cache = MeasurementCache(maxsize=1)
+    measurement_cache.store("a", stylesheet["Normal"], 50, {})
+    measurement_cache.store("b", stylesheet["Normal"], 50, {})
+    assert len(measurement_cache) == 1
+    assert measurement_cache.get("a", stylesheet["Normal"], 50) is None
+    measurement_cache.clear()
+    assert len(measurement_cache) == 0
+
+
+def test_xmlcell_reuses_measurement(test_table_style):
+    XMLCell.style = test_table_style.custom_styles["stylesheet"]["Normal"]
+    text = "Eigenverant- wortlich und noch ein wenig mehr Text"
+    first_cell, second_cell = XMLCell(text), XMLCell(text)
+    size = first_cell.wrap(40, 1000)
+    hits = XMLCell.measurement_cache.hits
+    assert second_cell.wrap(40, 1000) == size
+    assert XMLCell.measurement_cache.hits == hits + 1
+    assert second_cell.blPara is first_cell.blPara
+    assert size == Paragraph(text, XMLCell.style).wrap(40, 1000)
+
+
+def test_fixedwidth_table_is_measured_once(test_table_style):
+    XMLCell.style = test_table_style.custom_styles["stylesheet"]["Normal"]
+    table = TableBuilder().create_fixedwidth_table([[XMLCell("keine")]], 100)
+    size = table.wrap(100, 1000)
+    table._rowHeights = None
+    assert table.wrap(100, 50) == size
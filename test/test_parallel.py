@@ -0,0 +1,114 @@
+import io
+
+import pytest
+from PyPDF2 import PdfFileReader  # type: ignore
+from reportlab.lib.units import mm  # type: ignore
+from reportlab.platypus import Flowable  # type: ignore
+
+from input.properties_template import pagesize  # type: ignore
+from pyxml2pdf.core.initializer import Initializer
+from pyxml2pdf.core.parallel import _FragmentDocTemplate, ParallelDocTemplate
+from pyxml2pdf.core.parser import Parser
+from pyxml2pdf.core.streamer import Streamer
+
+page_settings = dict(
+    pagesize=[size * mm for size in pagesize],
+    topMargin=0.0,
+    bottomMargin=0.0,
+    leftMargin=0.0,
+    rightMargin=0.0,
+)
+
+
+def page_texts(pdf_path: str):
+    pdf = PdfFileReader(pdf_path)
+    return [pdf.getPage(page).extractText() for page in range(pdf.getNumPages())]
+
+
+def test_paginate_equals_serial_layout(long_template, tmp_path):
+    serial_path = str(tmp_path / "serial.pdf")
+    Initializer(long_template, serial_path)
+    parser = Parser([])
+    flowables = parser.collect_xml_data(
+        parser.create_dataset(Streamer(long_template, "row_tag"))
+    )
+    pages = ParallelDocTemplate(
+        str(tmp_path / "parallel.pdf"), **page_settings
+    ).paginate(flowables)
+    assert len(pages) == PdfFileReader(serial_path).getNumPages() > 3
+
+
+def test_parallel_build_equals_serial_build(long_template, tmp_path):
+    serial_path, parallel_path = str(tmp_path / "serial.pdf"), str(
+        tmp_path / "parallel.pdf"
+    )
+    Initializer(long_template, serial_path)
+    Initializer(long_template, parallel_path, render_workers=2)
+    serial_texts = [text.replace(serial_path, "") for text in page_texts(serial_path)]
+    parallel_texts = [
+        text.replace(parallel_path, "") for text in page_texts(parallel_path)
+    ]
+    assert parallel_texts == serial_texts
+    assert (tmp_path / "parallel_page_01.pdf").exists()
+
+
+def test_selected_pages_equal_serial_pages(long_template, tmp_path):
+    serial_path, selected_path = str(tmp_path / "serial.pdf"), str(
+        tmp_path / "selected.pdf"
+    )
+    Initializer(long_template, serial_path)
+    Initializer(long_template, selected_path, pages=[3, 1])
+    assert not (tmp_path / "selected.pdf").exists()
+    assert sorted(path.name for path in tmp_path.glob("selected_page_*.pdf")) == [
+        "selected_page_02.pdf",
+        "selected_page_04.pdf",
+    ]
+    for page in ("02", "04"):
+        assert (
+            PdfFileReader(str(tmp_path / f"selected_page_{page}.pdf"))
+            .getPage(0)
+            .extractText()
+            == PdfFileReader(str(tmp_path / f"serial_page_{page}.pdf"))
+            .getPage(0)
+            .extractText()
+        )
+
+
+def test_selected_pages_keep_previous_pdf(long_template, tmp_path):
+    output_path = str(tmp_path / "long.pdf")
+    Initializer(long_template, output_path)
+    previous_pdf = (tmp_path / "long.pdf").read_bytes()
+    Initializer(long_template, output_path, pages=[2])
+    assert (tmp_path / "long.pdf").read_bytes() == previous_pdf
+
+
+@pytest.mark.parametrize("pages", [[], [99]])
+def test_selected_pages_exist(long_template, tmp_path, pages):
+    with pytest.raises(ValueError):
+        Initializer(long_template, str(tmp_path / "selected.pdf"), pages=pages)
+
+
+@pytest.mark.parametrize("incremental, merge_rows", [(True, False), (False, True)])
+def test_parallel_build_requires_subtables(tmp_path, incremental, merge_rows):
+    with pytest.raises(ValueError):
+        Initializer(
+            "input/template.xml",
+            str(tmp_path / "template.pdf"),
+            incremental=incremental,
+            merge_rows=merge_rows,
+            render_workers=2,
+        )
+
+
+class PageNumberRecorder(Flowable):
+    page_numbers = []
+
+    def draw(self):
+        self.page_numbers.append(
+            (self.canv.getPageNumber(), self.canv._doctemplate.page)
+        )
+
+
+def test_fragment_continues_page_numbers():
+    _FragmentDocTemplate(io.BytesIO(), 3, **page_settings).build([PageNumberRecorder()])
+    assert PageNumberRecorder.page_numbers == [(4, 4)]
@@ -0,0 +1,46 @@
+import pytest
+from PyPDF2 import PdfFileReader  # type: ignore
+from reportlab.pdfgen.canvas import Canvas  # type: ignore
+
+from pyxml2pdf.core.post_processor import PostProcessor
+
+
+def create_pdf(path: str, page_count: int):
+    """Create a PDF file with the number of each page as its content"""
+    canvas = Canvas(path)
+    for page in range(page_count):
+        canvas.drawString(100, 100, f"page {page + 1}")
+        canvas.showPage()
+    canvas.save()
+
+
+@pytest.mark.parametrize(
+    "page_count, name", [(3, "x_page_03.pdf"), (130, "x_page_130.pdf")]
+)
+def test_post_processor_names_pages(tmp_path, page_count, name):
+    create_pdf(str(tmp_path / "x.pdf"), page_count)
+    PostProcessor(str(tmp_path / "x.pdf")).finalize_print_preparation()
+    assert len(list(tmp_path.glob("x_page_*.pdf"))) == page_count
+    assert (tmp_path / name).exists()
+
+
+def test_post_processor_splits_in_parallel(tmp_path, capsys):
+    create_pdf(str(tmp_path / "x.pdf"), 130)
+    PostProcessor(str(tmp_path / "x.pdf"), max_workers=2).finalize_print_preparation()
+    assert "130 single paged PDFs" in capsys.readouterr().out
+    for page in (1, 65, 66, 130):
+        single_page = PdfFileReader(str(tmp_path / f"x_page_{page:03}.pdf"))
+        assert single_page.getNumPages() == 1
+        assert f"page {page}" in single_page.getPage(0).extractText()
+        assert single_page.getPage(0).get("/Rotate") == -90
+
+
+def test_post_processor_stores_changed_pages(tmp_path):
+    create_pdf(str(tmp_path / "x.pdf"), 3)
+    post_processor = PostProcessor(str(tmp_path / "x.pdf"))
+    post_processor.finalize_print_preparation([1])
+    # The files were not named this way before, so all pages are stored.
+    assert len(list(tmp_path.glob("x_page_*.pdf"))) == 3
+    (tmp_path / "x_page_03.pdf").unlink()
+    post_processor.finalize_print_preparation([1])
+    assert not (tmp_path / "x_page_03.pdf").exists()
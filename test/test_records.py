@@ -0,0 +1,59 @@
+import pytest
+
+from pyxml2pdf.core.records import XMLRecord
+from pyxml2pdf.core.rows import XMLRow
+from pyxml2pdf.core.streamer import Streamer
+
+
+@pytest.fixture
+def test_record() -> XMLRecord:
+    """Create a record from the first row of the template
+
+    :returns: a record of the template's first row
+    """
+    return XMLRow.extract(next(iter(Streamer("input/template.xml", "row_tag"))))
+
+
+def test_record_is_compact(test_record):
+    """A record should not carry a __dict__ but only its slots"""
+    assert not hasattr(test_record, "__dict__")
+
+
+def test_record_texts(test_record):
+    assert test_record.tag == "row_tag"
+    assert test_record.findtext("name_tag") == "name 1"
+    assert test_record.findtext("info_tag") == "info 1"
+
+
+def test_record_ignores_unreferenced_tags(test_element):
+    test_element.append(test_element.makeelement("unreferenced", {}))
+    test_element[-1].text = "text"
+    assert XMLRow.extract(test_element).findtext("unreferenced") is None
+
+
+def test_record_criteria_and_identifier(test_record):
+    assert test_record.criteria == {"filter_1", "filter_2"}
+    assert isinstance(test_record.identifier, str)
+
+
+def test_record_concatenate(test_record):
+    assert test_record.concatenate(["name_tag", "missing", "info_tag"]) == (
+        "name 1 - info 1"
+    )
+
+
+def test_row_from_record(test_record):
+    row = XMLRow(test_record)
+    assert row.criteria == test_record.criteria
+    assert row.findtext("name_tag") == "name 1"
+    assert len(row) == 0
+
+
+def test_record_takes_first_occurrence_like_findtext(test_element):
+    for text in ("", "second", "third"):
+        child = test_element.makeelement("name_tag", {})
+        child.text = text
+        test_element.append(child)
+    record = XMLRow.extract(test_element)
+    assert test_element.findtext("name_tag") == ""
+    assert record.findtext("name_tag", "") == ""
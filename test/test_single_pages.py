@@ -0,0 +1,85 @@
+import pytest
+from PyPDF2 import PdfFileReader  # type: ignore
+from reportlab.lib.styles import getSampleStyleSheet  # type: ignore
+from reportlab.platypus import PageBreak, Paragraph  # type: ignore
+
+from pyxml2pdf.core.initializer import Initializer
+from pyxml2pdf.core.single_pages import SinglePageDocTemplate
+
+
+def test_single_pages_equal_post_processed_pages(tmp_path):
+    (tmp_path / "post").mkdir()
+    (tmp_path / "direct").mkdir()
+    Initializer("input/template.xml", str(tmp_path / "post" / "template.pdf"))
+    Initializer(
+        "input/template.xml",
+        str(tmp_path / "direct" / "template.pdf"),
+        direct_pages=True,
+    )
+    post_processed = PdfFileReader(str(tmp_path / "post" / "template_page_01.pdf"))
+    direct = PdfFileReader(str(tmp_path / "direct" / "template_page_01.pdf"))
+    assert direct.getPage(0).get("/Rotate") == -90
+    assert direct.getPage(0).extractText() == post_processed.getPage(0).extractText()
+    combined = PdfFileReader(str(tmp_path / "direct" / "template.pdf"))
+    assert combined.getNumPages() == len(list(tmp_path.glob("direct/*_page_*.pdf")))
+    # The combined PDF is drawn just like without writing the single pages directly.
+    normal = PdfFileReader(str(tmp_path / "post" / "template.pdf"))
+    assert combined.getNumPages() == normal.getNumPages()
+    for page in range(normal.getNumPages()):
+        assert combined.getPage(page).get("/Rotate") == normal.getPage(page).get(
+            "/Rotate"
+        )
+        assert (
+            combined.getPage(page).getContents().getData()
+            == normal.getPage(page).getContents().getData()
+        )
+
+
+def test_single_pages_without_combined(tmp_path, capsys):
+    SinglePageDocTemplate(str(tmp_path / "x.pdf"), combined=False).build(
+        [
+            flowable
+            for page in range(130)
+            for flowable in (
+                Paragraph(f"page {page + 1}", getSampleStyleSheet()["Normal"]),
+                PageBreak(),
+            )
+        ]
+    )
+    assert "130 single paged PDFs" in capsys.readouterr().out
+    assert not (tmp_path / "x.pdf").exists()
+    assert len(list(tmp_path.glob("x_page_*.pdf"))) == 130
+    for page in (1, 99, 130):
+        single_page = PdfFileReader(str(tmp_path / f"x_page_{page:03}.pdf"))
+        assert single_page.getNumPages() == 1
+        assert f"page {page}" in single_page.getPage(0).extractText()
+
+
+def test_single_pages_draw_page_callbacks(tmp_path):
+    def draw_title(canv, doc):
+        canv.drawString(10, 10, f"title {doc.page}")
+
+    SinglePageDocTemplate(str(tmp_path / "x.pdf")).build(
+        [Paragraph("first", getSampleStyleSheet()["Normal"]), PageBreak()] * 2,
+        onFirstPage=draw_title,
+        onLaterPages=draw_title,
+    )
+    combined = PdfFileReader(str(tmp_path / "x.pdf"))
+    for page in (1, 2):
+        single_page = PdfFileReader(str(tmp_path / f"x_page_{page:02}.pdf"))
+        assert f"title {page}" in single_page.getPage(0).extractText()
+        assert f"title {page}" in combined.getPage(page - 1).extractText()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        dict(direct_pages=True, incremental=True),
+        dict(direct_pages=True, render_workers=2),
+        dict(direct_pages=True, pages=[0]),
+        dict(combined=False),
+    ],
+)
+def test_single_pages_invalid_options(tmp_path, options):
+    with pytest.raises(ValueError):
+        Initializer("input/template.xml", str(tmp_path / "template.pdf"), **options)
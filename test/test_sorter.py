@@ -0,0 +1,98 @@
+from datetime import datetime
+
+import defusedxml  # type: ignore
+import pytest
+
+from pyxml2pdf.core.sorter import _from_iso_format, Sorter
+
+# Monkeypatch standard library xml vulnerabilities.
+defusedxml.defuse_stdlib()
+from xml.etree.ElementTree import Element, SubElement
+
+
+def create_course(**texts) -> Element:
+    """Create a course element with the given tags and texts
+
+    :returns: the course element
+    """
+    course = Element("kurs")
+    for tag, text in texts.items():
+        SubElement(course, tag).text = text
+    return course
+
+
+@pytest.fixture
+def courses():
+    return [
+        create_course(Termin="03.01.2021 10:00", Nummer="3"),
+        create_course(Termin="", Nummer="0"),
+        create_course(Termin="01.01.2021 10:00", Nummer="2"),
+        create_course(Termin="2021-01-01T10:00:00Z", Nummer="1"),
+        create_course(Termin="02.01.2021 10:00", Nummer="4"),
+    ]
+
+
+def numbers(courses):
+    return [course.findtext("Nummer") for course in courses]
+
+
+def test_sort_by_date_is_stable(courses):
+    """Equal dates in both formats should keep their original order"""
+    assert numbers(Sorter(courses).sort_parsed_xml("Termin")) == [
+        "2",
+        "1",
+        "4",
+        "3",
+        "0",
+    ]
+
+
+def test_sort_with_tie_breaker(courses):
+    assert numbers(Sorter(courses).sort_parsed_xml(["Termin", "Nummer"])) == [
+        "1",
+        "2",
+        "4",
+        "3",
+        "0",
+    ]
+
+
+def test_sort_keeps_undated_after_dated(courses):
+    courses.append(create_course(Termin="auf Anfrage", Nummer="5"))
+    assert numbers(Sorter(courses).sort_parsed_xml("Termin"))[-2:] == ["0", "5"]
+
+
+def test_sort_in_place(courses):
+    sorter = Sorter(courses)
+    assert sorter.sort_parsed_xml("Termin") == courses
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "2021-01-01",
+        "2021-01-01T10:00",
+        "2021-01-01 10:00:30",
+        "2021-01-01T10:00:30.25",
+        "2021-01-01T10:00:00+00:00",
+        "2021-01-01T10:00:00-05:30",
+    ],
+)
+def test_from_iso_format_equals_fromisoformat(text):
+    assert _from_iso_format(text) == datetime.fromisoformat(text)
+
+
+@pytest.mark.parametrize("text", ["2021-01-01T", "2021-13-01", "01.01.2021 10:00"])
+def test_from_iso_format_rejects_invalid_dates(text):
+    with pytest.raises(ValueError):
+        _from_iso_format(text)
+
+
+def test_sort_by_date_in_utc():
+    """Dates with different offsets should be compared by their time in UTC"""
+    courses = [
+        create_course(Termin="2021-01-01T09:00:00Z", Nummer="2"),
+        create_course(Termin="2021-01-01T10:00:00+02:00", Nummer="1"),
+        create_course(Termin="01.01.2021 08:30", Nummer="1.5"),
+    ]
+    assert numbers(Sorter(courses).sort_parsed_xml("Termin")) == ["1", "1.5", "2"]
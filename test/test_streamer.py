@@ -0,0 +1,45 @@
+import pytest
+
+from pyxml2pdf.core.streamer import Streamer
+
+
+@pytest.fixture
+def nested_xml(tmp_path) -> str:
+    """Create a small XML file with rows on different levels
+
+    :returns: the path to the XML file
+    """
+    path = tmp_path / "nested.xml"
+    path.write_text(
+        "<main_tag>"
+        "<row_tag><name_tag>name 1</name_tag></row_tag>"
+        "<other_tag><row_tag><name_tag>nested</name_tag></row_tag></other_tag>"
+        "<row_tag><name_tag>name 2</name_tag></row_tag>"
+        "</main_tag>"
+    )
+    return str(path)
+
+
+def test_streamer_yields_all_rows(parser_backend):
+    """Streaming the template should yield the same rows as parsing it at once"""
+    names = [
+        element.findtext("name_tag")
+        for element in Streamer("input/template.xml", "row_tag", parser_backend)
+    ]
+    assert names == ["name 1", "name 2", "name 3", "name 4", "name 5"]
+
+
+def test_streamer_ignores_nested_rows(nested_xml, parser_backend):
+    """Only direct children of the root should be yielded like with findall"""
+    names = [
+        element.findtext("name_tag")
+        for element in Streamer(nested_xml, "row_tag", parser_backend)
+    ]
+    assert names == ["name 1", "name 2"]
+
+
+def test_streamer_clears_consumed_rows(parser_backend):
+    """Rows should be emptied as soon as the next one is requested"""
+    elements = list(Streamer("input/template.xml", "row_tag", parser_backend))
+    for element in elements:
+        assert len(element) == 0
@@ -1,7 +1,18 @@
 import pytest
+from hypothesis import given, strategies as hst
 
+from input.properties_template import subtable_settings  # type: ignore
 from pyxml2pdf.tables.builder import TableBuilder
 
+all_criteria = sorted(
+    {
+        criterion
+        for subtable in subtable_settings
+        for include_filters in subtable.include
+        for criterion in include_filters
+    }
+)
+
 
 @pytest.fixture
 def table_data():
@@ -26,3 +37,24 @@ def test_property_subtables(table_builder):
 def test_tablebuilder_distribute_row(test_row, table_builder):
     """Check proper execution of distribute_row"""
     table_builder.distribute_row(test_row)
+
+
+@given(criteria=hst.sets(hst.sampled_from(all_criteria + ["unknown"])))
+def test_tablebuilder_match_subtables(criteria):
+    """Check the compiled include filters against matching each list of filters"""
+    table_builder = TableBuilder()
+    expected = [
+        index
+        for index, subtable in enumerate(subtable_settings)
+        if all(criteria.intersection(include) for include in subtable.include)
+    ]
+    assert table_builder.match_subtables(criteria) == expected
+    assert table_builder.match_subtables(list(criteria)) == expected
+
+
+def test_tablebuilder_shares_column_headings(table_builder):
+    column_headings = table_builder.make_column_headings()
+    assert all(subtable.rows[1] is column_headings for subtable in table_builder.tables)
+    assert TableBuilder().tables[0].rows[1] is column_headings
+    title_rows = [subtable.rows[0] for subtable in table_builder.tables]
+    assert len({id(title_row) for title_row in title_rows}) == len(title_rows)
@@ -5,7 +5,9 @@ from hypothesis import given, HealthCheck, settings, strategies as hst
 
 from input.properties import SubtableSetting  # type: ignore
 from input.properties_template import subtable_settings  # type: ignore
-from pyxml2pdf.tables.tables import XMLTable
+from pyxml2pdf.styles.table_styles import XMLTableStyle
+from pyxml2pdf.tables.builder import TableBuilder
+from pyxml2pdf.tables.tables import SubtableFlowable, XMLTable
 
 
 @pytest.fixture
@@ -62,3 +64,89 @@ def test_xmltable_extend(test_table, test_row):
     """Check if a list of one row can be appended."""
     test_table.extend([test_row.get_table_row(test_table.title)])
     assert test_table.rows[-1] == test_row.get_table_row(test_table.title)
+
+
+def test_xmltable_merge_rows(test_row):
+    subtable = TableBuilder().tables[0]
+    subtable.append(test_row.get_table_row(subtable.title))
+    column_widths = XMLTableStyle.shared().column_widths
+    merged = subtable.merge_rows(column_widths)
+    assert merged._nrows == len(subtable.rows)
+    assert merged.repeatRows == 2
+    assert merged._colWidths == column_widths
+    # The title spans all columns.
+    assert ("SPAN", (0, 0), (len(column_widths) - 1, 0)) in [
+        command[:3] for command in merged._spanCmds
+    ]
+
+
+def test_xmltable_merge_rows_fits_width(test_row):
+    subtable = TableBuilder().tables[0]
+    subtable.append(test_row.get_table_row(subtable.title))
+    table_width = XMLTableStyle.shared().table_width
+    width, _ = subtable.merge_rows(XMLTableStyle.shared().column_widths).wrap(
+        table_width, 10000
+    )
+    assert width == pytest.approx(table_width)
+
+
+@pytest.fixture
+def test_subtable(test_row) -> XMLTable:
+    subtable = TableBuilder().tables[0]
+    subtable.extend([test_row.get_table_row(subtable.title)] * 5)
+    return subtable
+
+
+def test_xmltable_to_flowable(test_subtable):
+    flowable = test_subtable.to_flowable()
+    assert isinstance(flowable, SubtableFlowable)
+    table_width = XMLTableStyle.shared().table_width
+    width, height = flowable.wrap(table_width, 10000)
+    assert width == pytest.approx(table_width)
+    assert height == pytest.approx(
+        sum(row.wrap(table_width, 10000)[1] for row in test_subtable.rows)
+    )
+
+
+@settings(suppress_health_check=(HealthCheck.function_scoped_fixture,))
+@given(available_height=hst.floats(min_value=0, max_value=500))
+def test_subtable_flowable_split(test_subtable, available_height):
+    table_width = XMLTableStyle.shared().table_width
+    heights = [row.wrap(table_width, 10000)[1] for row in test_subtable.rows]
+    header_height = sum(heights[:2])
+    flowable = test_subtable.to_flowable(repeat_rows=2)
+    parts = flowable.split(table_width, available_height)
+    if available_height < header_height + heights[2]:
+        # The header rows are never left alone at the end of a page.
+        assert parts == []
+        return
+    first_part, rest = parts
+    assert first_part.wrap(table_width, available_height)[1] <= available_height
+    assert first_part._end == rest._start > 2
+    # Each part after a split repeats the header rows.
+    assert rest.wrap(table_width, 10000)[1] == pytest.approx(
+        header_height + sum(heights[rest._start :])
+    )
+
+
+@settings(suppress_health_check=(HealthCheck.function_scoped_fixture,))
+@given(available_height=hst.floats(min_value=0, max_value=500))
+def test_subtable_flowable_split_without_repeated_rows(
+    test_subtable, available_height
+):
+    table_width = XMLTableStyle.shared().table_width
+    heights = [row.wrap(table_width, 10000)[1] for row in test_subtable.rows]
+    if available_height >= sum(heights):
+        # The subtable fits as a whole and is not split at all.
+        return
+    parts = test_subtable.to_flowable().split(table_width, available_height)
+    if available_height < heights[0]:
+        assert parts == []
+        return
+    first_part, rest = parts
+    # As many rows as fit stay on the page, just like rows handed over one by one.
+    assert sum(heights[: first_part._end]) <= available_height + 1e-6
+    assert sum(heights[: first_part._end + 1]) > available_height - 1e-6
+    assert rest.wrap(table_width, 10000)[1] == pytest.approx(
+        sum(heights[rest._start :])
+    )
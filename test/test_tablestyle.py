@@ -1,6 +1,11 @@
 from reportlab.lib.colors import Color  # type: ignore
 from reportlab.lib.styles import StyleSheet1  # type: ignore
-from reportlab.platypus import TableStyle  # type: ignore
+from reportlab.platypus import Table, TableStyle  # type: ignore
+
+from pyxml2pdf.core.events import Event
+from pyxml2pdf.core.rows import XMLRow
+from pyxml2pdf.styles.table_styles import CompiledTableStyle, XMLTableStyle
+from pyxml2pdf.tables.builder import TableBuilder
 
 
 def test_tablestyle_custom_styles(test_table_style):
@@ -49,3 +54,58 @@ def test_tablestyle_table_width(test_table_style):
 def test_tablestyle__init_font_family_call(test_table_style):
     """Check if initialisation of font family runs without error and returns nothing."""
     assert test_table_style._init_font_family() is None
+
+
+def test_tablestyle_shared(test_row):
+    assert XMLTableStyle.shared() is XMLTableStyle.shared()
+    assert XMLRow._table_style is XMLTableStyle.shared()
+    assert Event._table_style is XMLTableStyle.shared()
+    assert TableBuilder()._table_style is XMLTableStyle.shared()
+
+
+def test_tablestyle_loads_fonts_once(monkeypatch):
+    XMLTableStyle.shared()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The fonts were loaded again.")
+
+    monkeypatch.setattr("pyxml2pdf.styles.table_styles.TTFont", fail)
+    assert XMLTableStyle().custom_styles["stylesheet"]
+
+
+def test_tablestyle_compiled_style_is_shared(test_table_style):
+    compiled_style = test_table_style.compiled_style("normal", 1, 3)
+    assert isinstance(compiled_style, CompiledTableStyle)
+    assert compiled_style.style is test_table_style.custom_styles["normal"]
+    assert test_table_style.compiled_style("normal", 1, 3) is compiled_style
+    assert (
+        test_table_style.compiled_style(test_table_style.custom_styles["normal"], 1, 3)
+        is compiled_style
+    )
+    assert test_table_style.compiled_style("normal", 1, 2) is not compiled_style
+
+
+def test_tablestyle_compiled_style_equals_set_style(test_table_style):
+    style = test_table_style.custom_styles["normal"]
+    table_builder = TableBuilder()
+    compiled = table_builder.create_fixedwidth_table([["a", "b", "c"]], style=style)
+    styled = Table([["a", "b", "c"]], style=style)
+    for name in ("_linecmds", "_bkgrndcmds", "_spanCmds"):
+        assert getattr(compiled, name) == getattr(styled, name)
+    for compiled_cell, styled_cell in zip(
+        compiled._cellStyles[0], styled._cellStyles[0]
+    ):
+        assert dict(vars(compiled_cell), name=None) == dict(
+            vars(styled_cell), name=None
+        )
+
+
+def test_tablestyle_compiled_style_unshared_on_set_style(test_table_style):
+    table_builder = TableBuilder()
+    first_table, second_table = (
+        table_builder.create_fixedwidth_table([["a", "b", "c"]]) for _ in range(2)
+    )
+    assert first_table._cellStyles is second_table._cellStyles
+    first_table.setStyle([("ALIGN", (0, 0), (-1, -1), "RIGHT")])
+    assert first_table._cellStyles[0][0].alignment == "RIGHT"
+    assert second_table._cellStyles[0][0].alignment == "LEFT"
@@ -1,6 +1,9 @@
+import pickle
+
 import pytest
 from hypothesis import given, HealthCheck, settings, strategies as hst
 from reportlab.lib.styles import ParagraphStyle  # type: ignore
+from reportlab.platypus import Paragraph  # type: ignore
 
 from input.properties import SubtableSetting  # type: ignore
 from input.properties_template import subtable_settings  # type: ignore
@@ -26,3 +29,18 @@ def test_xmlcell(test_xmlcell_class, text):
     assert isinstance(my_cell, XMLCell)
     assert isinstance(my_cell.style, ParagraphStyle)
     assert my_cell.text == text
+
+
+def test_xmlcell_defers_parsing(test_xmlcell_class):
+    my_cell = test_xmlcell_class("<b>bold</b> and<br/>broken")
+    assert "frags" not in my_cell.__dict__
+    width, height = my_cell.wrap(100, 100)
+    assert "frags" in my_cell.__dict__
+    paragraph = Paragraph("<b>bold</b> and<br/>broken", my_cell.style)
+    assert (width, height) == paragraph.wrap(100, 100)
+    assert my_cell.getPlainText() == paragraph.getPlainText()
+
+
+def test_xmlcell_survives_pickling_unparsed(test_xmlcell_class):
+    my_cell = pickle.loads(pickle.dumps(test_xmlcell_class("<i>text</i>")))
+    assert my_cell.getPlainText() == "text"